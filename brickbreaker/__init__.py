@@ -0,0 +1,4 @@
+# The game model runs headless; tkinter is only imported by brickbreaker.app
+# when a window is opened. `python -m brickbreaker` is the launcher.
+from .variants import DEFAULT, VARIANTS, Variant
+from .world import TICK, Ball, Brick, Paddle, Rules, World
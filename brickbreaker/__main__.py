@@ -0,0 +1,8 @@
+import sys
+
+from .cli import main
+
+# Guarded so worker processes that re-import the main module (the spawn
+# start method) don't start the launcher again
+if __name__ == '__main__':
+    sys.exit(main())
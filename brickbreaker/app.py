@@ -0,0 +1,122 @@
+import math
+import sys
+
+from .backends import tk_canvas
+from .controls import Controls
+from .variants import DEFAULT, VARIANTS, make_bricks
+from .view import CanvasView
+
+
+def main(variant=DEFAULT, physics_hz=None, render_hz=60, record=None,
+         replay=None, speed=1.0, tiles=False, fullscreen=False,
+         particles=0, governor=True, scores=None, profile=None,
+         level_file=None, bricks='grid', rules=None):
+    # The only place a window is made, so tkinter is imported here and
+    # nowhere at module level
+    import tkinter as tk
+    from . import profiler
+    from .loop import FixedStepLoop
+    from .scheduler import Scheduler
+    from .viewport import Viewport
+
+    variant = VARIANTS[variant]
+    physics_hz = physics_hz or variant.physics_hz
+    # Rules overrides from the command line, such as multiball. Longer steps
+    # than the variant's move the ball further than it was made for, so
+    # collisions are swept then.
+    rules = dict(rules or {})
+    if physics_hz < variant.physics_hz:
+        rules.setdefault('swept', True)
+    rules = variant.make_rules(**rules)
+    recorder = playback = mapped = None
+    if replay:
+        from .replay import Replay
+        playback = Replay.load(replay)
+        variant = playback.variant
+        world = playback.world
+        physics_hz = speed / playback.dt
+    elif record:
+        from .replay import Recorder
+        recorder = Recorder(open(record, 'wb'), rules=rules,
+                            dt=1.0 / physics_hz,
+                            variant=variant.name, bricks=make_bricks(bricks))
+        world = recorder.world
+    elif level_file:
+        # Mapped for the whole game: every new level is laid out from it
+        from .levels import LevelFile
+        mapped = LevelFile(level_file)
+        world = variant.world(bricks=make_bricks(bricks), rules=rules,
+                              layout=mapped.layout)
+    else:
+        world = variant.world(bricks=make_bricks(bricks), rules=rules)
+
+    root = tk.Tk()
+    root.title(variant.title)
+    if fullscreen:
+        root.attributes('-fullscreen', True)
+    canvas = tk_canvas(world.width, world.height, variant.style['bg'], root)
+    renderer = None
+    if tiles:
+        # The tiled image is drawn at world size, so the window doesn't scale
+        from .tiles import TiledBrickRenderer
+        renderer = TiledBrickRenderer(canvas, world, bg=variant.style['bg'])
+        viewport = Viewport(world.width, world.height)
+    else:
+        viewport = Viewport(world.width, world.height, canvas)
+    effects = None
+    if particles:
+        # Particles are numpy arrays; the game plays the same without them
+        try:
+            from .effects import Effects
+        except ImportError as error:
+            print('no particle effects: %s' % error, file=sys.stderr)
+        else:
+            dt = playback.dt if playback is not None else 1.0 / physics_hz
+            effects = Effects(world, particles, dt=dt)
+    view = CanvasView(canvas, world, renderer, variant.style, viewport,
+                      effects)
+
+    if playback is not None:
+        step = playback.step
+    elif recorder is not None:
+        step = Controls(canvas, world, variant.paddle_speed, recorder.start,
+                        recorder.press, recorder.step, viewport).step
+    else:
+        step = Controls(canvas, world, variant.paddle_speed,
+                        viewport=viewport).step
+
+    # Frames that run long cost the HUD, then effects, then render rate
+    governed = None
+    if governor:
+        from .governor import Governor
+        governed = Governor(render_hz, view, effects)
+    # A replay at speed runs that many times the steps per frame, so the
+    # cap on steps per frame grows with it; otherwise anything over about
+    # 15x at 60 fps would be dropped
+    max_steps = 5
+    if playback is not None:
+        max_steps = int(math.ceil(max_steps * max(speed, 1)))
+    loop = FixedStepLoop(step, view.draw, physics_hz, max_steps,
+                         governor=governed)
+    # Scores are written from a thread of their own; a replay isn't a game
+    store = session = None
+    if scores and playback is None:
+        from .scores import ScoreStore, Session
+        store = ScoreStore(scores)
+        session = Session(store, world, variant.name)
+    profiler.install(root, loop, canvas, path=profile)
+    # asyncio drives Tk and the game loop; closing the window stops both
+    scheduler = Scheduler(root)
+    root.protocol('WM_DELETE_WINDOW', scheduler.stop)
+    try:
+        scheduler.run(loop.run_async(render_hz))
+    finally:
+        if recorder is not None:
+            recorder.close()
+            recorder.f.close()
+        if session is not None:
+            session.close()
+            store.close()
+        if mapped is not None:
+            mapped.close()
+        root.destroy()
@@ -0,0 +1,129 @@
+import random
+
+from .eventsim import follow_ball
+from .world import TICK
+
+
+def fold(x, low, high):
+    # Where a point moving freely from low ends up once every crossing of
+    # low or high is mirrored back, i.e. after bouncing between two walls
+    span = high - low
+    if span <= 0:
+        return low
+    x = (x - low) % (2 * span)
+    return low + (x if x <= span else 2 * span - x)
+
+
+def predict(world, ticks=None):
+    # x of the ball's centre when its bottom reaches the top of the paddle.
+    # Ball directions are +-1 on both axes, so it covers as much ground
+    # sideways as it falls; a rising ball first goes up to the ceiling and
+    # back. Walls are folded in, bricks are not: the prediction is cheap
+    # enough to redo every tick and picks up any brick bounce then. Also
+    # usable as an eventsim.EventSimulator controller.
+    ball = world.ball
+    radius = ball.radius
+    line = world.paddle.get_position()[1] - radius
+    if ball.y > line:
+        return ball.x
+    if ball.direction[1] > 0:
+        fall = line - ball.y
+    else:
+        fall = (ball.y - radius) + (line - radius)
+    return fold(ball.x + ball.direction[0] * fall, radius,
+                world.width - radius)
+
+
+def intercept(world, ticks=None):
+    # Predictor's target: where a falling ball will meet the paddle, or the
+    # ball itself while it rises, since a brick can send it back down from
+    # anywhere. Also usable as an eventsim.EventSimulator controller.
+    if world.ball.direction[1] < 0:
+        return world.ball.x
+    return predict(world)
+
+
+class Autopilot(object):
+    # Seeded paddle input: an arrow key held toward the target, moving
+    # speed pixels per second like Controls.poll whatever the physics rate,
+    # aiming off-centre by a random amount that
+    # is picked again every time the ball turns back down. error is a
+    # fraction of the paddle's half width, so around 1.0 some balls get
+    # missed. This one chases the ball where it is now.
+    def __init__(self, world, speed, seed=None, error=0.5):
+        self.world = world
+        self.speed = speed
+        self.random = random.Random(seed)
+        self.error = error
+        self.aim = 0
+        self.falling = False
+        self.direction = 0
+        self.carry = 0.0
+
+    def target(self):
+        return self.world.ball.x
+
+    def __call__(self, dt=TICK):
+        # The paddle offset for a tick of dt seconds, in whole pixels with
+        # the fraction carried as for a held key
+        world = self.world
+        falling = world.ball.direction[1] > 0
+        if falling and not self.falling and self.error:
+            half = world.paddle.width / 2
+            self.aim = self.random.uniform(-1, 1) * self.error * half
+        self.falling = falling
+        offset = self.target() + self.aim - world.paddle.x
+        # Held while it is more than half this tick's move away
+        reach = self.speed * dt / 2
+        direction = 0
+        if offset > reach:
+            direction = 1
+        elif offset < -reach:
+            direction = -1
+        if direction != self.direction:
+            self.carry = 0.0
+        self.direction = direction
+        if not direction:
+            return 0
+        move = direction * self.speed * dt + self.carry
+        whole = int(move + (1e-9 if move > 0 else -1e-9))
+        self.carry = move - whole
+        # Clamped to the field as Controls.poll does: Paddle.move refuses a
+        # move that would cross a wall, which would leave the paddle short
+        half = world.paddle.width / 2
+        x = max(half, min(world.width - half, world.paddle.x + whole))
+        offset = int(round(x - world.paddle.x))
+        if offset != whole:
+            self.carry = 0.0
+        return offset
+
+    def drive(self, dt=TICK):
+        offset = self(dt)
+        if offset:
+            self.world.move_paddle(offset)
+
+
+class Predictor(Autopilot):
+    # Heads for where a falling ball will meet the paddle instead of where
+    # it is, so it is waiting there with time to spare. A rising ball is
+    # followed instead: a brick can send it back down from anywhere, and
+    # from under the ball a paddle that is faster sideways than the ball
+    # always reaches the landing point before it does. With no aim error
+    # it never misses.
+    def __init__(self, world, speed, seed=None, error=0):
+        super().__init__(world, speed, seed, error)
+
+    def target(self):
+        return intercept(self.world)
+
+
+PILOTS = {
+    'follow': Autopilot,
+    'predict': Predictor,
+}
+
+# The same pilots as EventSimulator controllers, with no aim error
+CONTROLLERS = {
+    'follow': follow_ball,
+    'predict': intercept,
+}
@@ -0,0 +1,66 @@
+import itertools
+
+# CanvasView draws through RenderLayer onto anything with this part of the
+# tk.Canvas interface: create_rectangle/oval/text, coords, itemconfig,
+# delete, tag_raise, tag_lower. A backend is a function returning such a
+# canvas for a field of width x height with background bg.
+
+
+class NullCanvas(object):
+    # Accepts every drawing call and keeps nothing, for running the full
+    # view code with no output at all
+    def __init__(self, width=610, height=400, bg='black', **options):
+        self.width = width
+        self.height = height
+        self.bg = bg
+        self.ids = itertools.count(1)
+
+    def create_rectangle(self, *coords, **options):
+        return next(self.ids)
+
+    create_oval = create_text = create_image = create_rectangle
+
+    def coords(self, item, *coords):
+        return []
+
+    def itemconfig(self, item, **options):
+        pass
+
+    def delete(self, *items):
+        pass
+
+    def tag_raise(self, item, above=None):
+        pass
+
+    def tag_lower(self, item, below=None):
+        pass
+
+
+def tk_canvas(width, height, bg, master=None):
+    import tkinter as tk
+
+    master = master or tk.Tk()
+    canvas = tk.Canvas(master, width=width, height=height, bg=bg,
+                       highlightthickness=0)
+    canvas.pack(fill='both', expand=True)
+    return canvas
+
+
+def framebuffer_canvas(width, height, bg, master=None):
+    from .framebuffer import FramebufferCanvas
+    return FramebufferCanvas(width, height, bg)
+
+
+def null_canvas(width, height, bg, master=None):
+    return NullCanvas(width, height, bg)
+
+
+BACKENDS = {
+    'tk': tk_canvas,
+    'framebuffer': framebuffer_canvas,
+    'null': null_canvas,
+}
+
+
+def open_canvas(backend, width, height, bg, master=None):
+    return BACKENDS[backend](width, height, bg, master)
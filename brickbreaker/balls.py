@@ -0,0 +1,221 @@
+import time
+
+import numpy as np
+
+
+class BallPool(object):
+    # Struct-of-arrays store for many balls. Each slot has a position,
+    # direction (+1/-1 per axis like Ball.direction), speed and radius;
+    # dead slots are reused by spawn() so views can reuse their items too.
+    def __init__(self, capacity=256):
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.dx = np.ones(capacity)
+        self.dy = -np.ones(capacity)
+        self.speed = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.used = 0
+
+    @property
+    def capacity(self):
+        return len(self.x)
+
+    def grow(self):
+        size = self.capacity
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'dx', 'dy', 'speed',
+                     'radius', 'alive'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self.dx[size:] = 1
+        self.dy[size:] = -1
+
+    def spawn(self, x, y, direction, speed=5, radius=10):
+        free = np.flatnonzero(~self.alive[:self.used])
+        if len(free):
+            index = int(free[0])
+        else:
+            if self.used == self.capacity:
+                self.grow()
+            index = self.used
+            self.used += 1
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.dx[index], self.dy[index] = direction
+        self.speed[index] = speed
+        self.radius[index] = radius
+        self.alive[index] = True
+        return index
+
+    def kill(self, index):
+        self.alive[index] = False
+
+    def clear(self):
+        self.alive[:] = False
+        self.used = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def bounds(self, indexes=None, alpha=None):
+        if indexes is None:
+            indexes = np.flatnonzero(self.alive)
+        x = self.x[indexes]
+        y = self.y[indexes]
+        if alpha is not None:
+            x = self.prev_x[indexes] + (x - self.prev_x[indexes]) * alpha
+            y = self.prev_y[indexes] + (y - self.prev_y[indexes]) * alpha
+        r = self.radius[indexes]
+        return np.stack([x - r, y - r, x + r, y + r], axis=1)
+
+    def step(self, world, scale=1):
+        # One pass of World.check_collisions and Ball.update for every live
+        # ball. Balls that reach the bottom are freed, they don't cost lives.
+        idx = np.flatnonzero(self.alive)
+        if not len(idx):
+            return
+        self.prev_x[idx] = self.x[idx]
+        self.prev_y[idx] = self.y[idx]
+        bounds = self.bounds(idx)
+        x = self.x[idx]
+        dx = self.dx[idx]
+        dy = self.dy[idx]
+
+        p = world.paddle.get_position()
+        on_paddle = ((dy > 0) &
+                     (bounds[:, 0] <= p[2]) & (bounds[:, 2] >= p[0]) &
+                     (bounds[:, 1] <= p[3]) & (bounds[:, 3] >= p[1]))
+        counts, first, hit_balls, hit_bricks = self.brick_hits(world.bricks,
+                                                                bounds)
+        total = counts + on_paddle
+        self.speed[idx[on_paddle]] += world.rules.paddle_speedup
+
+        # Ball.collide: several objects flip dy, one object deflects by side
+        objects = np.empty((len(idx), 4))
+        objects[:] = p
+        from_brick = (counts == 1) & ~on_paddle
+        if from_brick.any():
+            objects[from_brick] = [world.bricks.get_position(i)
+                                   for i in first[from_brick]]
+        single = total == 1
+        right = single & (x > objects[:, 2])
+        left = single & ~right & (x < objects[:, 0])
+        dx[right] = 1
+        dx[left] = -1
+        dy[(total > 1) | (single & ~right & ~left)] *= -1
+
+        if len(hit_bricks):
+            self.apply_hits(world, hit_bricks)
+
+        out = bounds[:, 3] >= world.height
+        self.alive[idx[out]] = False
+
+        dx[(bounds[:, 0] <= 0) | (bounds[:, 2] >= world.width)] *= -1
+        dy[bounds[:, 1] <= 0] *= -1
+        moving = ~out
+        step = self.speed[idx] * scale
+        self.x[idx[moving]] += (dx * step)[moving]
+        self.y[idx[moving]] += (dy * step)[moving]
+        self.dx[idx] = dx
+        self.dy[idx] = dy
+
+    def brick_hits(self, bricks, bounds):
+        # Per ball: overlap count and first brick hit, plus every
+        # (ball, brick) overlap pair
+        n = len(bounds)
+        counts = np.zeros(n, dtype=int)
+        first = np.zeros(n, dtype=int)
+        if not len(bricks):
+            return counts, first, np.zeros(0, int), np.zeros(0, int)
+        if hasattr(bricks, 'mask_many'):
+            rows = bricks.rows
+            live = rows[rows[:, 4] > 0]
+            near = np.flatnonzero(
+                (bounds[:, 0] <= live[:, 2].max()) &
+                (bounds[:, 2] >= live[:, 0].min()) &
+                (bounds[:, 1] <= live[:, 3].max()) &
+                (bounds[:, 3] >= live[:, 1].min()))
+            if not len(near):
+                return counts, first, np.zeros(0, int), np.zeros(0, int)
+            mask = bricks.mask_many(bounds[near])
+            counts[near] = mask.sum(axis=1)
+            first[near] = mask.argmax(axis=1)
+            balls, hit = np.nonzero(mask)
+            return counts, first, near[balls], hit
+        balls, hit = [], []
+        for i, box in enumerate(bounds.tolist()):
+            found = bricks.overlapping(box)
+            counts[i] = len(found)
+            if found:
+                first[i] = found[0]
+            balls.extend([i] * len(found))
+            hit.extend(found)
+        return counts, first, np.array(balls, int), np.array(hit, int)
+
+    def apply_hits(self, world, hit_bricks):
+        # Several balls can hit one brick in the same pass; only the hits it
+        # had left count, not the ones past its destruction
+        bricks = world.bricks
+        if hasattr(bricks, 'hit_many'):
+            indexes, times = np.unique(hit_bricks, return_counts=True)
+            applied = int(np.minimum(bricks.rows[indexes, 4], times).sum())
+            left = bricks.hit_many(hit_bricks)
+            final = dict(zip(hit_bricks.tolist(), left.tolist()))
+        else:
+            applied = 0
+            final = {}
+            for index in hit_bricks.tolist():
+                if bricks.hits(index) > 0:
+                    final[index] = bricks.hit(index)
+                    applied += 1
+        world.score += world.rules.points * applied
+        for index, hits in final.items():
+            world.emit('hit', index, hits)
+
+
+def compare(count=300, ticks=200, seed=0):
+    # Seconds per tick for `count` world.Ball objects against one BallPool
+    # holding the same balls, both colliding with the same brick field
+    from .brickfield import BrickArray
+    from .world import Ball, World, Rules
+
+    rng = np.random.RandomState(seed)
+    start_x = rng.uniform(50, 560, count)
+    start_y = rng.uniform(150, 300, count)
+    directions = rng.choice([-1, 1], (count, 2))
+
+    def world():
+        # A paddle as wide as the field keeps every ball in play
+        w = World(rules=Rules(paddle_width=600), bricks=BrickArray(),
+                  seed=seed)
+        w.start()
+        return w
+
+    objects = world()
+    balls = [Ball(x, y, direction=list(d))
+             for x, y, d in zip(start_x, start_y, directions.tolist())]
+    t = time.perf_counter()
+    for _ in range(ticks):
+        for ball in balls:
+            objects.ball = ball
+            objects.check_collisions()
+            ball.update(objects.width, objects.height)
+    per_object = (time.perf_counter() - t) / ticks
+
+    pooled = world()
+    pool = BallPool(count)
+    for x, y, d in zip(start_x, start_y, directions.tolist()):
+        pool.spawn(x, y, d)
+    t = time.perf_counter()
+    for _ in range(ticks):
+        pool.step(pooled)
+    return per_object, (time.perf_counter() - t) / ticks
+
+
+if __name__ == '__main__':
+    for count in (10, 100, 300, 1000):
+        per_object, pooled = compare(count)
+        print('%5d balls: objects %7.2f ms/tick, pool %6.2f ms/tick'
+              % (count, per_object * 1000, pooled * 1000))
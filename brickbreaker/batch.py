@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .autopilot import CONTROLLERS, PILOTS
+from .eventsim import EventSimulator
+from .variants import BRICKS, DEFAULT, VARIANTS, make_bricks
+from .world import TICK
+
+# How a game is played: stepping every physics tick with an Autopilot, or
+# jumping from contact to contact with an EventSimulator
+MODES = ('ticks', 'events')
+
+
+def scatter(world):
+    # Starts the paddle, and the first ball with it, at a seeded x. A bounce
+    # doesn't depend on where the ball meets the paddle and the layouts are
+    # symmetric, so with only the launch direction seeded every game of a
+    # variant would play one of two mirror images.
+    paddle = world.paddle
+    half = paddle.width / 2
+    # In whole pixels, like every other paddle move
+    offset = world.random.randint(int(half), int(world.width - half)) - \
+        paddle.x
+    paddle.move(offset, world.width)
+    if paddle.ball is None:
+        world.ball.move(offset, 0)
+    paddle.save()
+    world.ball.save()
+
+
+def play(variant, seed, level=1, rules=None, error=None, max_ticks=20000,
+         pilot='follow', layout=None, bricks='grid', mode='ticks'):
+    # One headless game of the given level. It ends when the level is
+    # cleared, the last ball is lost or max_ticks have been stepped. Ticks
+    # are the variant's physics steps in either mode; the event mode has
+    # no aim error and no extra balls.
+    variant = VARIANTS[variant]
+    world = variant.world(seed, make_bricks(bricks),
+                          variant.make_rules(**(rules or {})), level, layout)
+    scatter(world)
+    if mode == 'events':
+        sim = EventSimulator(world, CONTROLLERS[pilot], variant.paddle_speed)
+        # The simulator's clock counts ticks of the original loops
+        scale = TICK * variant.physics_hz
+
+        def advance():
+            sim.advance()
+            return int(sim.time * scale)
+    else:
+        pilot = PILOTS[pilot](world, variant.paddle_speed, seed)
+        if error is not None:
+            pilot.error = error
+        dt = 1.0 / variant.physics_hz
+
+        def advance():
+            pilot.drive(dt)
+            world.step(dt)
+            return world.ticks
+    world.start()
+    result = 'timeout'
+    ticks = 0
+    while ticks < max_ticks:
+        ticks = advance()
+        if world.level != level or world.state == 'won':
+            result = 'cleared'
+            break
+        if world.state == 'over':
+            result = 'over'
+            break
+        if world.state == 'ready':
+            world.start()
+    return {
+        'seed': seed,
+        'result': result,
+        'ticks': ticks,
+        'lives_lost': world.rules.lives - world.lives,
+        # the next level's bricks are already laid out once one is cleared
+        'bricks': 0 if result == 'cleared' else len(world.bricks),
+        'score': world.score,
+    }
+
+
+def play_many(variant, seeds, level=1, rules=None, error=None,
+              max_ticks=20000, pilot='follow', level_file=None,
+              bricks='grid', mode='ticks'):
+    # Worker task: a chunk of games, so each round trip to the pool carries
+    # many results. A level file is mapped once for the whole chunk.
+    if level_file is None:
+        return [play(variant, seed, level, rules, error, max_ticks, pilot,
+                     bricks=bricks, mode=mode) for seed in seeds]
+    from .levels import LevelFile
+
+    with LevelFile(level_file) as mapped:
+        return [play(variant, seed, level, rules, error, max_ticks, pilot,
+                     mapped.layout, bricks, mode) for seed in seeds]
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Summary(object):
+    # Running totals over game results, in whatever order they arrive
+    def __init__(self):
+        self.games = 0
+        self.results = {'cleared': 0, 'over': 0, 'timeout': 0}
+        self.clear_ticks = []
+        self.lives_lost = 0
+        self.bricks = 0
+        self.score = 0
+
+    def add(self, game):
+        self.games += 1
+        self.results[game['result']] += 1
+        if game['result'] == 'cleared':
+            self.clear_ticks.append(game['ticks'])
+        self.lives_lost += game['lives_lost']
+        self.bricks += game['bricks']
+        self.score += game['score']
+
+    def report(self):
+        games = self.games or 1
+        ticks = self.clear_ticks
+        return {
+            'games': self.games,
+            'cleared': self.results['cleared'] / games,
+            'over': self.results['over'] / games,
+            'timeout': self.results['timeout'] / games,
+            'clear_ticks_mean': sum(ticks) / len(ticks) if ticks else 0,
+            'clear_ticks_p50': percentile(ticks, 0.5),
+            'clear_ticks_p90': percentile(ticks, 0.9),
+            'lives_lost_mean': self.lives_lost / games,
+            'bricks_left_mean': self.bricks / games,
+            'score_mean': self.score / games,
+        }
+
+
+def run(variant, games, seed=0, level=1, rules=None, error=None,
+        max_ticks=20000, workers=None, chunk=None, on_result=None,
+        pilot='follow', level_file=None, bricks='grid', mode='ticks'):
+    # Plays games seeded seed, seed + 1, ... across a process pool and
+    # folds each result into a Summary as its chunk comes back. workers=0
+    # plays in this process instead.
+    seeds = list(range(seed, seed + games))
+    workers = os.cpu_count() if workers is None else workers
+    chunk = chunk or max(1, min(100, games // (max(workers, 1) * 8)))
+    chunks = [seeds[i:i + chunk] for i in range(0, games, chunk)]
+    summary = Summary()
+
+    def collect(results):
+        for game in results:
+            summary.add(game)
+            if on_result is not None:
+                on_result(game)
+
+    if workers == 0:
+        for part in chunks:
+            collect(play_many(variant, part, level, rules, error, max_ticks,
+                              pilot, level_file, bricks, mode))
+        return summary
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_many, variant, part, level, rules,
+                               error, max_ticks, pilot, level_file, bricks,
+                               mode)
+                   for part in chunks]
+        for future in as_completed(futures):
+            collect(future.result())
+    return summary
+
+
+def parse_rule(text):
+    # name=value, with the value read as JSON so numbers and booleans work
+    name, _, value = text.partition('=')
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+    return name, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='brickbreaker batch',
+        description='Play many headless games of one variant and level '
+                    'with a seeded autopilot, across all cores.')
+    parser.add_argument('variant', nargs='?', default=DEFAULT,
+                        choices=sorted(VARIANTS))
+    parser.add_argument('-n', '--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--level', type=int, default=1)
+    parser.add_argument('--rule', action='append', default=[], type=parse_rule,
+                        metavar='NAME=VALUE', help='override a Rules value')
+    parser.add_argument('--pilot', choices=sorted(PILOTS), default='follow',
+                        help='follow the ball, or predict where it lands')
+    parser.add_argument('--mode', choices=MODES, default='ticks',
+                        help='step every physics tick, or jump between '
+                             'contacts to fast-forward (default: ticks)')
+    parser.add_argument('--error', type=float,
+                        help='autopilot aim error, in paddle half widths '
+                             "(default: the pilot's own)")
+    parser.add_argument('--level-file', metavar='PATH',
+                        help="play this level file's layout instead of the "
+                             "variant's")
+    parser.add_argument('--bricks', choices=BRICKS, default='grid',
+                        help='brick store (default: grid)')
+    parser.add_argument('--max-ticks', type=int, default=20000)
+    parser.add_argument('-j', '--workers', type=int,
+                        help='processes (default: all cores, 0: none)')
+    parser.add_argument('--chunk', type=int, help='games per worker task')
+    parser.add_argument('--out', metavar='JSONL',
+                        help='write every game result as it arrives')
+    args = parser.parse_args(argv)
+
+    rules = dict(args.rule)
+    # Fail here rather than in every worker
+    try:
+        VARIANTS[args.variant].make_rules(**rules)
+    except TypeError as error:
+        parser.error(str(error))
+    if args.mode == 'events':
+        # The simulator only moves the main ball, and aims without error
+        if rules.get('multiball') or rules.get('powerup'):
+            parser.error('--mode events plays without extra balls')
+        if args.error is not None:
+            parser.error('--mode events has no aim error')
+    if args.level_file:
+        from .levels import LevelFile
+        variant = VARIANTS[args.variant]
+        try:
+            with LevelFile(args.level_file) as level:
+                level.check(variant.width, variant.height)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+
+    out = open(args.out, 'w') if args.out else None
+
+    def on_result(game):
+        if out is not None:
+            out.write(json.dumps(game, sort_keys=True) + '\n')
+
+    start = time.perf_counter()
+    try:
+        summary = run(args.variant, args.games, args.seed, args.level, rules,
+                      args.error, args.max_ticks, args.workers, args.chunk,
+                      on_result, args.pilot, args.level_file, args.bricks,
+                      args.mode)
+    finally:
+        if out is not None:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    report = summary.report()
+    for key, value in report.items():
+        print('%-18s %10.3f' % (key, value) if isinstance(value, float)
+              else '%-18s %10d' % (key, value))
+    print('%d games in %.1fs (%.0f games/s)'
+          % (summary.games, elapsed, summary.games / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from .controls import Controls
+from .fakecanvas import FakeCanvas, FakeTk
+from .registry import ItemRegistry
+from .variants import DEFAULT, VARIANTS as ALL
+from .view import CanvasView
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, 'bench_baseline.json')
+
+# Tk commands counted per tick
+COMMANDS = {'coords', 'move', 'delete', 'itemconfig', 'itemconfigure',
+            'create_rectangle', 'create_oval', 'create_text', 'create_line',
+            'create_image', 'find_overlapping', 'find_withtag', 'tag_raise',
+            'winfo_width', 'winfo_height', 'bbox', 'itemcget'}
+
+
+class CountingCanvas(FakeCanvas):
+    # FakeCanvas that counts every Tk command the game sends it
+    calls = Counter()
+
+    def __getattribute__(self, name):
+        if name in COMMANDS:
+            CountingCanvas.calls[name] += 1
+        return super().__getattribute__(name)
+
+
+# Each setup starts a fresh game of one variant on a CountingCanvas and
+# returns its root, world and item registry, with the game loop already
+# scheduled. Games are restarted whenever one ends. The registry raises
+# LeakError once more items are alive than the level can need (its bricks,
+# the extra balls' pool slots, plus SPARE), so a leak fails the run rather
+# than just slowing it.
+
+SPARE = 8
+
+def preset(variant, rules=None):
+    def setup():
+        root = FakeTk()
+        canvas = CountingCanvas(root, width=variant.width,
+                                height=variant.height)
+        world = variant.world(seed=random.random(),
+                              rules=variant.make_rules(**(rules or {})))
+        room = {'bricks': len(world.bricks), 'balls': 0}
+        registry = ItemRegistry(canvas)
+        view = CanvasView(canvas, world, style=variant.style,
+                          registry=registry)
+
+        def budget(event):
+            # Later levels may lay out more bricks; a pool slot keeps its
+            # oval once used, even after the pool is cleared
+            if event[0] == 'level':
+                room['bricks'] = len(world.bricks)
+            if world.pool is not None:
+                room['balls'] = max(room['balls'], world.pool.used)
+            registry.limit = room['bricks'] + room['balls'] + SPARE
+
+        budget(('start',))
+        world.listeners.append(budget)
+        controls = Controls(canvas, world, variant.paddle_speed)
+        world.start()
+        delay = int(round(1000 / variant.physics_hz))
+        dt = 1.0 / variant.physics_hz
+
+        def game_loop():
+            controls.step(dt)
+            view.draw()
+            if world.state in ('won', 'over'):
+                return
+            if world.state == 'ready':
+                world.start()
+            registry.after('loop', delay, game_loop)
+
+        game_loop()
+        return root, world, registry
+    return setup
+
+
+VARIANTS = {name: preset(variant) for name, variant in ALL.items()}
+# Multiball: four extra balls with every ball and two more every fifth brick
+VARIANTS['storm'] = preset(ALL[DEFAULT], dict(multiball=4, powerup=5))
+
+
+def autopilot(root, world):
+    # Scripted input: one key tap toward the ball each tick, read from the
+    # world so it doesn't count as Tk calls
+    offset = world.ball.x - world.paddle.x
+    key = 'Right' if offset > 10 else 'Left' if offset < -10 else None
+    if key is not None:
+        root.fire('<KeyPress>', keysym=key)
+        root.fire('<KeyRelease>', keysym=key)
+
+
+def run(setup, ticks, seed=0):
+    random.seed(seed)
+    root, world, registry = setup()
+    times = []
+    calls = 0
+    items = 0
+    games = 1
+    while len(times) < ticks:
+        timer = root.next_timer()
+        if timer is None or root.quitted:
+            # Won, lost or quit: nothing left to time in this game
+            root, world, registry = setup()
+            games += 1
+            continue
+        if getattr(timer, '__name__', '') != 'game_loop':
+            root.run_next()
+            continue
+        autopilot(root, world)
+        CountingCanvas.calls.clear()
+        start = time.perf_counter()
+        root.run_next()
+        times.append(time.perf_counter() - start)
+        calls += sum(CountingCanvas.calls.values())
+        # Every item on the canvas, shown or pooled, so a leak shows as growth
+        counts = registry.counts()
+        items = max(items, counts['items'] + counts['pooled'])
+
+    times.sort()
+    total = sum(times)
+    return {
+        'ticks': len(times),
+        'games': games,
+        'ticks_per_sec': len(times) / total if total else 0.0,
+        'p50_ms': times[len(times) // 2] * 1000,
+        'p99_ms': times[min(len(times) - 1, int(len(times) * 0.99))] * 1000,
+        'calls_per_tick': calls / len(times),
+        'items': items,
+    }
+
+
+def reference(n=200000, repeat=3):
+    # Loops/sec of a fixed pure-Python workload that no game code touches,
+    # best of `repeat`. Speeds are compared in units of it, so a slower
+    # machine lowers the baseline with it.
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = 0
+        for i in range(n):
+            total += i * i % 7
+        best = max(best, n / (time.perf_counter() - start))
+    return best
+
+
+def compare(results, baseline, tolerance=None, speed=None):
+    # Canvas calls and items are deterministic for a given seed, so any
+    # real increase counts. Speed is only checked when given a tolerance
+    # and this machine's reference() speed: it may then drop by
+    # `tolerance` against the baseline scaled by the two references.
+    failures = []
+    scale = None
+    if tolerance is not None and speed and baseline.get('reference'):
+        scale = speed / baseline['reference']
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if scale is not None and result['ticks_per_sec'] < \
+                base['ticks_per_sec'] * scale * (1 - tolerance):
+            failures.append('%s: %.0f ticks/s, baseline %.0f here'
+                            % (name, result['ticks_per_sec'],
+                               base['ticks_per_sec'] * scale))
+        if result['calls_per_tick'] > base['calls_per_tick'] * 1.01 + 0.01:
+            failures.append('%s: %.2f canvas calls/tick, baseline %.2f'
+                            % (name, result['calls_per_tick'],
+                               base['calls_per_tick']))
+        if result['items'] > base.get('items', result['items']):
+            failures.append('%s: %d canvas items, baseline %d'
+                            % (name, result['items'], base['items']))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Drive every game variant headless and time its loop.')
+    parser.add_argument('-n', '--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', action='append', choices=sorted(VARIANTS))
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save', action='store_true',
+                        help='write the results as the new baseline')
+    parser.add_argument('--check-speed', action='store_true',
+                        help='also fail on slower ticks/sec, relative to a '
+                             'reference loop timed in the same run')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed drop in ticks/sec (default 0.5 = 50%%)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    print('%-30s %7s %10s %8s %8s %10s %6s'
+          % ('variant', 'ticks', 'ticks/s', 'p50 ms', 'p99 ms', 'calls/tick',
+             'items'))
+    for name in args.only or VARIANTS:
+        result = run(VARIANTS[name], args.ticks, args.seed)
+        results[name] = result
+        print('%-30s %7d %10.0f %8.3f %8.3f %10.2f %6d'
+              % (name, result['ticks'], result['ticks_per_sec'],
+                 result['p50_ms'], result['p99_ms'],
+                 result['calls_per_tick'], result['items']))
+
+    speed = None
+    if args.save or args.check_speed:
+        speed = reference()
+        print('reference loop: %.0f loops/s' % speed)
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        baseline['reference'] = speed
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print('baseline written to %s' % args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('no baseline at %s, run with --save to create one'
+              % args.baseline)
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.check_speed and not baseline.get('reference'):
+        print('baseline has no reference speed, run with --save to add one')
+    failures = compare(results, baseline,
+                       args.tolerance if args.check_speed else None, speed)
+    for failure in failures:
+        print('REGRESSION ' + failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import numpy as np
+
+X0, Y0, X1, Y1, HITS = range(5)
+
+
+class BrickArray(object):
+    # Drop-in for world.BrickList that keeps every brick in one (n, 5) float
+    # array of x0, y0, x1, y1, hits. A brick with 0 hits left is dead; its
+    # row stays so indexes remain valid.
+    def __init__(self, capacity=256):
+        self.data = np.zeros((capacity, 5))
+        self.size = 0
+        self.count = 0
+
+    @classmethod
+    def from_arrays(cls, bounds, hits):
+        field = cls(max(len(bounds), 1))
+        field.extend(bounds, hits)
+        return field
+
+    def extend(self, bounds, hits):
+        # Adds an (n, 4) array of bounds with their hits in one copy
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        end = self.size + len(bounds)
+        if end > len(self.data):
+            grown = np.zeros((max(end, 2 * len(self.data)), 5))
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end, :4] = bounds
+        self.data[self.size:end, HITS] = hits
+        self.count += int(np.count_nonzero(self.data[self.size:end, HITS] > 0))
+        self.size = end
+
+    def add(self, x, y, hits, width=75, height=20):
+        if self.size == len(self.data):
+            self.data = np.concatenate([self.data, np.zeros_like(self.data)])
+        self.data[self.size] = (x - width / 2, y - height / 2,
+                                x + width / 2, y + height / 2, hits)
+        self.size += 1
+        if hits > 0:
+            self.count += 1
+        return self.size - 1
+
+    def clear(self):
+        self.data[:self.size] = 0
+        self.size = 0
+        self.count = 0
+
+    @property
+    def rows(self):
+        return self.data[:self.size]
+
+    def mask(self, bounds):
+        rows = self.rows
+        return ((rows[:, HITS] > 0) &
+                (rows[:, X0] <= bounds[2]) & (rows[:, X1] >= bounds[0]) &
+                (rows[:, Y0] <= bounds[3]) & (rows[:, Y1] >= bounds[1]))
+
+    def mask_many(self, bounds):
+        # (balls, bricks) overlap mask for an (n, 4) array of ball bounds
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        rows = self.rows
+        return ((rows[:, HITS] > 0) &
+                (rows[:, X0] <= bounds[:, 2:3]) &
+                (rows[:, X1] >= bounds[:, 0:1]) &
+                (rows[:, Y0] <= bounds[:, 3:4]) &
+                (rows[:, Y1] >= bounds[:, 1:2]))
+
+    def overlapping(self, bounds):
+        return np.flatnonzero(self.mask(bounds)).tolist()
+
+    def get_position(self, index):
+        return self.data[index, :4].tolist()
+
+    def hits(self, index):
+        return int(self.data[index, HITS])
+
+    def hit(self, index):
+        hits = self.data[index, HITS]
+        if hits > 0:
+            hits -= 1
+            self.data[index, HITS] = hits
+            if hits == 0:
+                self.count -= 1
+        return int(hits)
+
+    def hit_many(self, indexes):
+        # Repeated indexes take one hit each; returns hits left per index.
+        # Only the bricks hit are looked at, so the count is kept up to date
+        # from the ones that went from alive to dead.
+        indexes = np.asarray(indexes, dtype=np.intp)
+        hits = self.data[:, HITS]
+        unique = np.unique(indexes)
+        alive = hits[unique] > 0
+        np.subtract.at(hits, indexes, 1)
+        left = np.maximum(hits[unique], 0)
+        hits[unique] = left
+        self.count -= int(np.count_nonzero(alive & (left == 0)))
+        return hits[indexes].astype(int)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(np.flatnonzero(self.rows[:, HITS] > 0).tolist())
@@ -0,0 +1,163 @@
+import argparse
+import sys
+
+# Every command imports what it needs when it runs, so listing variants or
+# benchmarking never loads tkinter.
+
+
+def positive(text):
+    # A rate or speed; 0 would divide by zero in the loop
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError('must be more than 0, not %s' % text)
+    return value
+
+
+def play(argv):
+    from .scores import DEFAULT_PATH
+    from .variants import BRICKS, DEFAULT, VARIANTS
+
+    parser = argparse.ArgumentParser(
+        prog='brickbreaker',
+        description='Play a brick breaker variant. Other commands: '
+                    'list, bench, batch, capture, levels, scores, replay.')
+    parser.add_argument('variant', nargs='?', default=DEFAULT,
+                        choices=sorted(VARIANTS))
+    parser.add_argument('--physics-hz', type=positive,
+                        help="default: the variant's own tick rate")
+    parser.add_argument('--render-hz', type=positive, default=60)
+    parser.add_argument('--record', metavar='LOG')
+    parser.add_argument('--replay', metavar='LOG')
+    parser.add_argument('--speed', type=positive, default=1.0)
+    parser.add_argument('--tiles', action='store_true',
+                        help='draw bricks into one tiled image')
+    parser.add_argument('--fullscreen', action='store_true',
+                        help='scale the game to fill the screen')
+    parser.add_argument('--particles', type=int, default=0, metavar='N',
+                        help='particle budget for effects, which need numpy '
+                             '(default: none)')
+    parser.add_argument('--no-governor', dest='governor',
+                        action='store_false',
+                        help='keep full quality even when frames run long')
+    parser.add_argument('--scores', metavar='DB', default=DEFAULT_PATH,
+                        help='keep high scores and stats here '
+                             '(default: %(default)s)')
+    parser.add_argument('--no-scores', dest='scores', action='store_const',
+                        const=None, help="don't keep scores")
+    parser.add_argument('--profile', metavar='PATH',
+                        help='profile from the start (F3 toggles) and write '
+                             'the numbers here as JSON on exit')
+    parser.add_argument('--level-file', metavar='PATH',
+                        help="play this level file's layout instead of the "
+                             "variant's")
+    parser.add_argument('--bricks', choices=BRICKS, default='grid',
+                        help='brick store (default: grid)')
+    parser.add_argument('--balls', type=int, default=0, metavar='N',
+                        help='storm mode: launch N extra balls with every '
+                             'ball')
+    parser.add_argument('--powerup', type=int, default=0, metavar='N',
+                        help='every Nth brick broken launches two extra '
+                             'balls')
+    parser.add_argument('--swept', action='store_true',
+                        help='time-of-impact collisions, so a fast ball '
+                             "can't pass through a brick or the paddle "
+                             "(default: on below the variant's physics rate)")
+    args = parser.parse_args(argv)
+    if args.level_file and (args.record or args.replay):
+        # A log names the variant, not the file its bricks came from
+        parser.error('--level-file cannot be recorded or replayed')
+    if args.replay:
+        import struct
+
+        from .replay import Replay
+        try:
+            Replay.load(args.replay)
+        except (OSError, ValueError, struct.error) as error:
+            parser.error('cannot read %s: %s' % (args.replay, error))
+    if args.level_file:
+        from .levels import LevelFile
+
+        variant = VARIANTS[args.variant]
+        try:
+            with LevelFile(args.level_file) as level:
+                level.check(variant.width, variant.height)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+    rules = {}
+    if args.balls:
+        rules['multiball'] = args.balls
+    if args.powerup:
+        rules['powerup'] = args.powerup
+    if args.swept:
+        rules['swept'] = True
+    if rules and args.replay:
+        parser.error('a replay keeps the rules it was recorded with')
+
+    from . import app
+    app.main(args.variant, args.physics_hz, args.render_hz, args.record,
+             args.replay, args.speed, args.tiles, args.fullscreen,
+             args.particles, args.governor, args.scores, args.profile,
+             args.level_file, args.bricks, rules)
+    return 0
+
+
+def list_variants(argv):
+    from .variants import VARIANTS
+
+    for name, variant in sorted(VARIANTS.items()):
+        print('%-16s %-20s %dx%d' % (name, variant.script, variant.width,
+                                      variant.height))
+    return 0
+
+
+def bench(argv):
+    from . import bench
+    return bench.main(argv)
+
+
+def batch(argv):
+    from . import batch
+    return batch.main(argv)
+
+
+def capture(argv):
+    from . import framebuffer
+    return framebuffer.main(argv)
+
+
+def levels(argv):
+    from . import levels
+    return levels.main(argv)
+
+
+def scores(argv):
+    from . import scores
+    return scores.main(argv)
+
+
+def replay(argv):
+    from . import replay
+    return replay.main(argv)
+
+
+COMMANDS = {
+    'play': play,
+    'list': list_variants,
+    'bench': bench,
+    'batch': batch,
+    'capture': capture,
+    'levels': levels,
+    'scores': scores,
+    'replay': replay,
+}
+
+
+def main(argv=None):
+    # `brickbreaker [command] ...`; without a command the arguments go to
+    # play, so `python -m brickbreaker gameclass` opens that variant
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in COMMANDS:
+        command, argv = argv[0], argv[1:]
+    else:
+        command = 'play'
+    return COMMANDS[command](argv) or 0
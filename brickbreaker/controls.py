@@ -0,0 +1,103 @@
+from .world import TICK
+
+# Keys that move the paddle, and which way
+KEYS = {'Left': -1, 'Right': 1, 'a': -1, 'd': 1}
+
+
+class Controls(object):
+    # Keyboard and mouse state for the paddle, read once per physics tick.
+    # Key events only record which keys are down and motion events only
+    # where the pointer is, so however many events arrive the paddle makes
+    # one move per tick, and a held key moves it paddle_speed pixels per
+    # second from the first tick on instead of waiting for the OS key repeat
+    # to start.
+    #
+    # step() is the physics step to hand to a FixedStepLoop: it applies the
+    # polled move through press (world.move_paddle, or a Recorder's press)
+    # and then runs advance (world.step, or a Recorder's step).
+    def __init__(self, widget, world, paddle_speed=300, start=None,
+                 press=None, advance=None, viewport=None):
+        self.world = world
+        self.viewport = viewport
+        self.paddle_speed = paddle_speed
+        self.start = start
+        self.press = press or world.move_paddle
+        self.advance = advance or world.step
+        self.held = set()
+        self.released = set()
+        self.pointer = None
+        self.direction = 0
+        self.carry = 0.0
+        widget.focus_set()
+        widget.bind('<KeyPress>', self.key_press)
+        widget.bind('<KeyRelease>', self.key_release)
+        widget.bind('<Motion>', self.motion)
+        widget.bind('<space>', self.space)
+
+    def key_press(self, event):
+        key = event.keysym
+        if key in KEYS:
+            # Key repeat on X11 sends a release and a press back to back, so
+            # a press cancels a release that hasn't been applied yet
+            self.released.discard(key)
+            self.held.add(key)
+            self.pointer = None
+
+    def key_release(self, event):
+        # Applied at the next poll, so a tap shorter than a tick still moves
+        if event.keysym in self.held:
+            self.released.add(event.keysym)
+
+    def motion(self, event):
+        # Kept in world units, so a scaled window steers the same way
+        if self.viewport is not None:
+            self.pointer = self.viewport.to_world(event.x, event.y)[0]
+        else:
+            self.pointer = event.x
+
+    def space(self, _):
+        world = self.world
+        if self.start is not None:
+            self.start()
+        elif world.state == 'over':
+            world.retry()
+        else:
+            world.start()
+
+    def poll(self, dt=TICK):
+        # The whole paddle move for one tick of dt seconds, clamped to the
+        # field and in whole pixels so a Recorder can log it. A held key's
+        # fraction of a pixel is carried to the next tick, so short ticks
+        # (a high physics rate) still add up to paddle_speed per second.
+        paddle = self.world.paddle
+        # Left and 'a' held together still move at one key's speed
+        total = sum(KEYS[key] for key in self.held)
+        direction = (total > 0) - (total < 0)
+        self.held -= self.released
+        self.released.clear()
+        if direction != self.direction:
+            self.carry = 0.0
+        self.direction = direction
+        if direction:
+            move = direction * self.paddle_speed * dt + self.carry
+            # (a hair over the truncation, so 99.999... makes 100)
+            whole = int(move + (1e-9 if move > 0 else -1e-9))
+            self.carry = move - whole
+            x = paddle.x + whole
+        elif self.pointer is not None:
+            x = self.pointer
+        else:
+            return 0
+        half = paddle.width / 2
+        offset = int(round(max(half, min(self.world.width - half, x)) -
+                           paddle.x))
+        if offset != x - paddle.x:
+            # Stopped by a wall, or following the pointer
+            self.carry = 0.0
+        return offset
+
+    def step(self, dt=TICK):
+        offset = self.poll(dt)
+        if offset:
+            self.press(offset)
+        return self.advance(dt)
@@ -0,0 +1,130 @@
+import numpy as np
+
+from .world import TICK
+
+
+class Particles(object):
+    # Fixed-size struct-of-arrays particle store. spawn() writes into the
+    # slots after a ring cursor, overwriting the oldest particles once the
+    # budget is used, so there is never more than `budget` to step or draw
+    # and nothing is allocated per particle. limit (<= budget) lowers the
+    # cap at runtime without reallocating.
+    def __init__(self, budget=256, seed=None, gravity=0.4):
+        self.budget = budget
+        self.limit = budget
+        self.gravity = gravity
+        self.x = np.zeros(budget)
+        self.y = np.zeros(budget)
+        self.vx = np.zeros(budget)
+        self.vy = np.zeros(budget)
+        self.life = np.zeros(budget)
+        self.size = np.zeros(budget)
+        self.color = np.zeros(budget, dtype=np.int32)
+        self.palette = []
+        self.cursor = 0
+        self.used = 0
+        self.random = np.random.default_rng(seed)
+
+    def color_index(self, color):
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def spawn(self, x, y, vx, vy, life, size, color):
+        # x, y, vx, vy are equal-length arrays (or scalars with vx/vy arrays)
+        count = min(len(vx), self.limit)
+        if count <= 0:
+            return
+        slots = (self.cursor + np.arange(count)) % self.limit
+        self.cursor = int(slots[-1] + 1) % self.limit
+        self.used = max(self.used, int(slots.max()) + 1)
+        self.x[slots] = np.broadcast_to(x, len(vx))[:count]
+        self.y[slots] = np.broadcast_to(y, len(vx))[:count]
+        self.vx[slots] = vx[:count]
+        self.vy[slots] = vy[:count]
+        self.life[slots] = life
+        self.size[slots] = size
+        self.color[slots] = self.color_index(color)
+
+    def burst(self, bounds, color, count, speed=3.0, life=15):
+        # Shards flying out of a rectangle
+        x0, y0, x1, y1 = bounds
+        rng = self.random
+        x = rng.uniform(x0, x1, count)
+        y = rng.uniform(y0, y1, count)
+        angle = rng.uniform(0, 2 * np.pi, count)
+        velocity = rng.uniform(0.3, 1.0, count) * speed
+        self.spawn(x, y, np.cos(angle) * velocity, np.sin(angle) * velocity,
+                   life, 3, color)
+
+    def trail(self, x, y, color, life=6):
+        self.spawn(x, y, np.zeros(1), np.zeros(1), life, 4, color)
+
+    def step(self, ticks=1):
+        # Ages every slot by ticks of the original loop in one pass
+        # (dead slots move too; that is cheaper than masking them out)
+        used = self.used
+        self.vy[:used] += self.gravity * ticks
+        self.x[:used] += self.vx[:used] * ticks
+        self.y[:used] += self.vy[:used] * ticks
+        self.life[:used] -= ticks
+
+    def alive(self):
+        return self.life[:self.used] > 0
+
+    def live(self):
+        # A mask over the whole budget of the live slots below limit; the
+        # ones above it are left over from before the limit was lowered
+        mask = self.life > 0
+        mask[self.limit:] = False
+        return mask
+
+    def bounds(self, slots=None):
+        if slots is None:
+            slots = slice(0, self.used)
+        half = self.size[slots] / 2
+        x = self.x[slots]
+        y = self.y[slots]
+        return np.stack([x - half, y - half, x + half, y + half], axis=1)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive()))
+
+
+class Effects(object):
+    # Brick-shatter and ball-trail particles, driven by the world's events
+    # and ticks. Purely visual: nothing here feeds back into the world, so
+    # recordings and checksums are unaffected. dt is the world's step, so
+    # particles move at the same speed whatever the physics rate.
+    def __init__(self, world, budget=256, shatter=12, trail=True, seed=None,
+                 trail_color='white', dt=TICK):
+        self.world = world
+        self.scale = dt / TICK
+        self.particles = Particles(budget, seed)
+        self.shatter = shatter
+        self.trail = trail
+        self.trail_color = trail_color
+        self.ticks = world.ticks
+        world.listeners.append(self.on_event)
+
+    def on_event(self, event):
+        if event[0] != 'hit':
+            return
+        _, index, hits = event
+        color = self.world.brick_color(index, hits + 1)
+        # A full shatter when the brick goes, a few chips otherwise
+        count = self.shatter if hits <= 0 else self.shatter // 4
+        if count:
+            self.particles.burst(self.world.bricks.get_position(index), color,
+                                 count)
+
+    def advance(self):
+        # Catches up with however many world ticks ran since the last frame
+        world = self.world
+        ticks = world.ticks - self.ticks
+        self.ticks = world.ticks
+        if ticks <= 0:
+            return
+        self.particles.step(ticks * self.scale)
+        if self.trail and world.state == 'running':
+            self.particles.trail(world.ball.x, world.ball.y, self.trail_color)
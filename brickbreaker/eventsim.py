@@ -0,0 +1,159 @@
+from .sweep import sweep, sweep_walls, swept_bounds
+from .world import TICK
+
+
+def follow_ball(world, ticks):
+    # Default controller: go to where the ball is now
+    return world.ball.x
+
+
+class EventSimulator(object):
+    # Plays a World by jumping from one contact to the next instead of
+    # stepping every tick. Between events the ball flies in a straight line,
+    # so the next wall, paddle line, floor or brick contact is solved for
+    # directly. Brick and paddle contacts are resolved with Ball.collide,
+    # the same rule World.check_collisions uses.
+    #
+    # Time is counted in ticks of the original loop. The paddle is moved
+    # only at events, toward controller(world, ticks_until_paddle_line), by
+    # at most paddle_speed pixels per second that has passed.
+    def __init__(self, world, controller=follow_ball, paddle_speed=300):
+        self.world = world
+        self.controller = controller
+        self.paddle_speed = paddle_speed
+        self.time = 0.0
+        self.paddle_time = 0.0
+        self.events = 0
+
+    def run(self, max_events=1000000):
+        world = self.world
+        while world.state not in ('won', 'over') and self.events < max_events:
+            if world.state == 'ready':
+                world.start()
+            self.advance()
+        return {'state': world.state, 'ticks': self.time,
+                'events': self.events, 'score': world.score,
+                'lives': world.lives, 'bricks': len(world.bricks),
+                'level': world.level}
+
+    def velocity(self):
+        ball = self.world.ball
+        return ball.direction[0] * ball.speed, ball.direction[1] * ball.speed
+
+    def paddle_line(self, box, vy):
+        # Ticks until the ball's bottom reaches the top of the paddle. Once
+        # it is on the line (a miss leaves it there) the next stop is the floor
+        top = self.world.paddle.get_position()[1]
+        if vy > 0 and box[3] < top:
+            return (top - box[3]) / vy
+        return None
+
+    def move_paddle(self):
+        world = self.world
+        box = world.ball.get_position()
+        vx, vy = self.velocity()
+        until = self.paddle_line(box, vy)
+        target = self.controller(world, until)
+        reach = self.paddle_speed * TICK * (self.time - self.paddle_time)
+        self.paddle_time = self.time
+        offset = max(-reach, min(reach, target - world.paddle.x))
+        half = world.paddle.width / 2
+        x = max(half, min(world.width - half, world.paddle.x + offset))
+        world.paddle.move(x - world.paddle.x, world.width)
+
+    def advance(self):
+        world = self.world
+        ball = world.ball
+        self.move_paddle()
+        box = ball.get_position()
+        vx, vy = self.velocity()
+        world.events = []
+        self.events += 1
+
+        # The walls, floor and paddle line bound how far the ball can fly
+        # before something happens, and so how far to look for bricks
+        horizon = []
+        if vy > 0:
+            horizon.append(((world.height - box[3]) / vy, 'floor'))
+        line = self.paddle_line(box, vy)
+        if line is not None:
+            horizon.append((line, 'paddle'))
+        span = max(world.width, world.height) / max(abs(vx), abs(vy))
+        wall = sweep_walls(box, vx * span, vy * span, world.width)
+        if wall is not None:
+            horizon.append((wall[0] * span, wall[1]))
+        when, what = min(horizon, key=lambda event: event[0])
+        when = max(when, 0.0)
+
+        hits = []
+        if when > 0:
+            dx, dy = vx * when, vy * when
+            for index in world.bricks.overlapping(swept_bounds(box, dx, dy)):
+                hit = sweep(box, dx, dy, world.bricks.get_position(index))
+                if hit is not None:
+                    hits.append((hit[0] * when, hit[1], index))
+        if hits:
+            first = min(hit[0] for hit in hits)
+            hits = [hit for hit in hits if hit[0] <= first + 1e-9]
+            when, what = first, 'brick'
+
+        ball.move(vx * when, vy * when)
+        self.time += when
+        world.ticks = int(self.time)
+
+        if what == 'brick':
+            self.hit_bricks(hits)
+        elif what == 'paddle':
+            # The paddle gets the time the ball took to come down
+            self.move_paddle()
+            self.reach_paddle()
+        elif what == 'floor':
+            self.lose_ball()
+        else:
+            ball.direction[what] *= -1
+
+    def hit_bricks(self, hits):
+        world = self.world
+        ball = world.ball
+        bounds = [world.bricks.get_position(index) for _, _, index in hits]
+        before = list(ball.direction)
+        ball.collide(bounds)
+        # A corner hit can leave the ball still heading into the brick
+        for axis in set(hit[1] for hit in hits):
+            if ball.direction[axis] == before[axis]:
+                ball.direction[axis] *= -1
+        for _, _, index in hits:
+            left = world.bricks.hit(index)
+            world.score += world.rules.points
+            world.emit('hit', index, left)
+        if len(world.bricks) == 0:
+            if world.rules.levels:
+                world.next_level()
+                world.start()
+            else:
+                world.state = 'won'
+                world.emit('won')
+
+    def reach_paddle(self):
+        world = self.world
+        ball = world.ball
+        box = ball.get_position()
+        paddle = world.paddle.get_position()
+        if box[2] >= paddle[0] and box[0] <= paddle[2]:
+            before = ball.direction[1]
+            ball.collide([paddle])
+            if ball.direction[1] == before:
+                ball.direction[1] = -1
+            ball.speed += world.rules.paddle_speedup
+
+    def lose_ball(self):
+        world = self.world
+        world.lives -= 1
+        world.emit('lost', world.lives)
+        if world.lives < 0:
+            world.state = 'over'
+            world.emit('over')
+        else:
+            self.time += world.rules.respawn_delay / TICK
+            world.setup_game()
+            world.start()
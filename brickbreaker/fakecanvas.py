@@ -0,0 +1,359 @@
+import heapq
+import types
+
+from .spatial import UniformGrid
+
+
+class Event(object):
+    def __init__(self, widget=None, **attrs):
+        self.widget = widget
+        self.__dict__.update(attrs)
+
+
+class FakeItem(object):
+    def __init__(self, kind, coords, options):
+        self.kind = kind
+        self.coords = [float(c) for c in coords]
+        tags = options.pop('tags', options.pop('tag', ()))
+        if isinstance(tags, str):
+            tags = tags.split()
+        self.tags = tuple(tags)
+        self.options = options
+
+    def bbox(self):
+        xs = self.coords[0::2]
+        ys = self.coords[1::2]
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+class FakeWidget(object):
+    # Geometry, binding and timer calls shared by the fake widgets. Timers
+    # and key events go through the root, which owns a virtual clock.
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.root = master.root if master is not None else self
+        self.options = options
+        self.bindings = {}
+
+    def pack(self, **options):
+        pass
+
+    def grid(self, **options):
+        pass
+
+    def focus_set(self):
+        self.root.focus = self
+
+    def bind(self, sequence, func=None, add=None):
+        if add and sequence in self.bindings:
+            previous = self.bindings[sequence]
+            self.bindings[sequence] = lambda event: (previous(event),
+                                                     func(event))
+        else:
+            self.bindings[sequence] = func
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+
+    def after(self, ms, func=None, *args):
+        return self.root.after(ms, func, *args)
+
+    def after_cancel(self, after_id):
+        self.root.after_cancel(after_id)
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, name):
+        return self.options.get(name)
+
+    def mainloop(self, n=0):
+        self.root.mainloop(n)
+
+    def quit(self):
+        self.root.quit()
+
+    def update(self):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+    def winfo_width(self):
+        return int(self.options.get('width', 1))
+
+    def winfo_height(self):
+        return int(self.options.get('height', 1))
+
+
+class FakeTk(FakeWidget):
+    # Stand-in for tk.Tk. mainloop() returns at once; the caller drives the
+    # game with run_next()/advance() and sends input with fire().
+    def __init__(self, *args, **options):
+        super().__init__(None, **options)
+        self.now = 0
+        self.timers = []
+        # Ids still due to run, and those cancelled but not yet popped
+        self.scheduled = set()
+        self.cancelled = set()
+        self.counter = 0
+        self.focus = None
+        self.quitted = False
+
+    def title(self, text=None):
+        if text is not None:
+            self.options['title'] = text
+        return self.options.get('title', '')
+
+    def after(self, ms, func=None, *args):
+        self.counter += 1
+        after_id = 'after#%d' % self.counter
+        heapq.heappush(self.timers, (self.now + int(ms), self.counter,
+                                     after_id, func, args))
+        self.scheduled.add(after_id)
+        return after_id
+
+    def after_cancel(self, after_id):
+        # Like Tk, an id that already ran or was cancelled is ignored
+        if after_id in self.scheduled:
+            self.scheduled.discard(after_id)
+            self.cancelled.add(after_id)
+
+    def pending(self):
+        return len(self.scheduled)
+
+    def next_timer(self):
+        # The callback run_next() would run, without running it
+        while self.timers and self.timers[0][2] in self.cancelled:
+            self.cancelled.discard(heapq.heappop(self.timers)[2])
+        return self.timers[0][3] if self.timers else None
+
+    def run_next(self):
+        # Runs the next timer, moving the clock to its due time. Returns the
+        # callback that ran, or None when nothing is scheduled.
+        while self.timers:
+            due, _, after_id, func, args = heapq.heappop(self.timers)
+            if after_id in self.cancelled:
+                self.cancelled.discard(after_id)
+                continue
+            self.scheduled.discard(after_id)
+            self.now = max(self.now, due)
+            func(*args)
+            return func
+        return None
+
+    def advance(self, ms):
+        end = self.now + ms
+        while self.timers and self.timers[0][0] <= end:
+            self.run_next()
+        self.now = end
+
+    def fire(self, sequence, **attrs):
+        # Delivers an event the way Tk does: focused widget, then the root
+        widgets = [self.focus, self] if self.focus not in (None, self) else [self]
+        for widget in widgets:
+            func = widget.bindings.get(sequence)
+            if func is not None:
+                func(Event(widget, **attrs))
+
+    def mainloop(self, n=0):
+        pass
+
+    def protocol(self, name, func=None):
+        self.bindings[name] = func
+
+    def attributes(self, *args):
+        pass
+
+    def close(self):
+        # The user closing the window: the WM_DELETE_WINDOW handler if one
+        # was set, else destroy() as Tk does
+        func = self.bindings.get('WM_DELETE_WINDOW')
+        (func or self.destroy)()
+
+    def quit(self):
+        self.quitted = True
+
+    def destroy(self):
+        self.timers = []
+        self.scheduled = set()
+        self.cancelled = set()
+
+
+class FakeFrame(FakeWidget):
+    pass
+
+
+class FakePhotoImage(object):
+    # Keeps one colour string per pixel so tests can look at what was drawn
+    def __init__(self, master=None, width=0, height=0, **options):
+        self._width = int(width)
+        self._height = int(height)
+        self.pixels = [[''] * self._width for _ in range(self._height)]
+        self.puts = 0
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def put(self, data, to=None):
+        self.puts += 1
+        x0, y0, x1, y1 = to or (0, 0, self._width, self._height)
+        for row in self.pixels[y0:y1]:
+            row[x0:x1] = [data] * (min(x1, self._width) - x0)
+
+    def get(self, x, y):
+        return self.pixels[y][x]
+
+    def blank(self):
+        self.pixels = [[''] * self._width for _ in range(self._height)]
+
+
+class FakeLabel(FakeWidget):
+    pass
+
+
+class FakeCanvas(FakeWidget):
+    # The subset of tk.Canvas the games use, on plain Python objects.
+    # find_overlapping works on item bounding boxes through a UniformGrid
+    # and returns ids in stacking order like Tk.
+    def __init__(self, master=None, cell_size=64, **options):
+        super().__init__(master, **options)
+        self.items = {}
+        self.counter = 0
+        self.grid = UniformGrid(cell_size)
+
+    def create(self, kind, coords, options):
+        if len(coords) == 1:
+            coords = coords[0]
+        self.counter += 1
+        item = FakeItem(kind, coords, dict(options))
+        self.items[self.counter] = item
+        self.grid.insert(self.counter, item.bbox())
+        return self.counter
+
+    def create_rectangle(self, *coords, **options):
+        return self.create('rectangle', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self.create('oval', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self.create('line', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self.create('text', coords, options)
+
+    def create_image(self, *coords, **options):
+        return self.create('image', coords, options)
+
+    def resolve(self, tag_or_id):
+        if isinstance(tag_or_id, int) or str(tag_or_id).isdigit():
+            item = int(tag_or_id)
+            return [item] if item in self.items else []
+        if tag_or_id == 'all':
+            return sorted(self.items, key=self.grid.order.__getitem__)
+        return [item for item in sorted(self.items,
+                                        key=self.grid.order.__getitem__)
+                if tag_or_id in self.items[item].tags]
+
+    def coords(self, tag_or_id, *coords):
+        items = self.resolve(tag_or_id)
+        if not items:
+            return []
+        item = self.items[items[0]]
+        if not coords:
+            return list(item.coords)
+        if len(coords) == 1:
+            coords = coords[0]
+        item.coords = [float(c) for c in coords]
+        self.grid.move(items[0], item.bbox())
+
+    def move(self, tag_or_id, dx, dy):
+        for key in self.resolve(tag_or_id):
+            item = self.items[key]
+            item.coords = [c + (dx if i % 2 == 0 else dy)
+                           for i, c in enumerate(item.coords)]
+            self.grid.move(key, item.bbox())
+
+    def itemconfig(self, tag_or_id, **options):
+        for key in self.resolve(tag_or_id):
+            item = self.items[key]
+            if 'tags' in options or 'tag' in options:
+                tags = options.pop('tags', options.pop('tag', ()))
+                item.tags = tuple(tags.split() if isinstance(tags, str)
+                                  else tags)
+            item.options.update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id, option):
+        items = self.resolve(tag_or_id)
+        if not items:
+            return ''
+        item = self.items[items[0]]
+        if option == 'tags':
+            return ' '.join(item.tags)
+        return item.options.get(option, '')
+
+    def type(self, tag_or_id):
+        items = self.resolve(tag_or_id)
+        return self.items[items[0]].kind if items else None
+
+    def bbox(self, tag_or_id):
+        boxes = [self.items[key].bbox() for key in self.resolve(tag_or_id)]
+        if not boxes:
+            return None
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def delete(self, *tags_or_ids):
+        for tag_or_id in tags_or_ids:
+            for key in self.resolve(tag_or_id):
+                del self.items[key]
+                self.grid.remove(key)
+
+    def tag_raise(self, tag_or_id, above=None):
+        for key in self.resolve(tag_or_id):
+            self.grid.insert(key, self.items[key].bbox())
+
+    lift = tag_raise
+
+    def tag_lower(self, tag_or_id, below=None):
+        order = self.grid.order
+        for key in reversed(self.resolve(tag_or_id)):
+            order[key] = min(order.values()) - 1
+
+    lower = tag_lower
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self.resolve(tag_or_id))
+
+    def find_all(self):
+        return tuple(self.resolve('all'))
+
+    def find_overlapping(self, x0, y0, x1, y1):
+        return tuple(key for key in self.grid.query((x0, y0, x1, y1))
+                     if self.items[key].options.get('state') != 'hidden')
+
+
+class TclError(Exception):
+    pass
+
+
+def fake_tkinter(canvas=FakeCanvas, tk=FakeTk):
+    # A module object that can stand in for tkinter in sys.modules, so
+    # app.main and anything else that imports tkinter runs with no display
+    module = types.ModuleType('tkinter')
+    module.Tk = tk
+    module.Frame = FakeFrame
+    module.Label = FakeLabel
+    module.Canvas = canvas
+    module.PhotoImage = FakePhotoImage
+    module.TclError = TclError
+    module.TkVersion = 8.6
+    return module
@@ -0,0 +1,242 @@
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+# The Tk colour names the variants use; anything else must be '#rrggbb'
+NAMES = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+    'red': (255, 0, 0),
+    'green': (0, 255, 0),
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'orange': (255, 165, 0),
+    'purple': (160, 32, 240),
+    'lightgreen': (144, 238, 144),
+}
+
+
+def parse_color(color):
+    if not color:
+        return None
+    if color.startswith('#') and len(color) == 7:
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return NAMES[color.lower()]
+
+
+def ellipse(xs, ys, rx, ry):
+    # Mask of the pixel centres (offsets from the centre) inside an ellipse
+    return ((ys / ry) ** 2)[:, None] + ((xs / rx) ** 2)[None, :] <= 1
+
+
+class FramebufferCanvas(object):
+    # Software rasteriser behind the canvas interface CanvasView uses. Items
+    # are kept like Tk keeps them, in stacking order, and frame() paints
+    # the visible ones into an RGB uint8 array of shape (height, width, 3).
+    # Rectangles and ovals are filled and outlined as Tk's defaults do;
+    # text and images aren't rasterised.
+    def __init__(self, width=610, height=400, bg='black', **options):
+        self.width = int(width)
+        self.height = int(height)
+        self.bg = parse_color(bg)
+        self.pixels = np.zeros((self.height, self.width, 3), np.uint8)
+        self.items = {}
+        self.counter = 0
+        # Pixel centres, for oval masks
+        self.ys = np.arange(self.height) + 0.5
+        self.xs = np.arange(self.width) + 0.5
+
+    def create(self, kind, coords, options):
+        self.counter += 1
+        if kind in ('rectangle', 'oval'):
+            options.setdefault('outline', 'black')
+        self.items[self.counter] = [kind, list(coords), options]
+        return self.counter
+
+    def create_rectangle(self, *coords, **options):
+        return self.create('rectangle', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self.create('oval', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self.create('text', coords, options)
+
+    def create_image(self, *coords, **options):
+        return self.create('image', coords, options)
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item][1] = list(coords)
+        return list(self.items[item][1])
+
+    def itemconfig(self, item, **options):
+        self.items[item][2].update(options)
+
+    def delete(self, *items):
+        for item in items:
+            self.items.pop(item, None)
+
+    def tag_raise(self, item, above=None):
+        self.items[item] = self.items.pop(item)
+
+    def tag_lower(self, item, below=None):
+        entry = self.items.pop(item)
+        self.items = dict([(item, entry)] + list(self.items.items()))
+
+    def clip(self, coords):
+        x0, y0, x1, y1 = (int(round(value)) for value in coords[:4])
+        return (max(0, min(x0, x1)), max(0, min(y0, y1)),
+                min(self.width, max(x0, x1)), min(self.height, max(y0, y1)))
+
+    def frame(self):
+        # Paints every visible item; the array is reused between frames, so
+        # copy it to keep one
+        pixels = self.pixels
+        pixels[:] = self.bg
+        for kind, coords, options in self.items.values():
+            if options.get('state') == 'hidden':
+                continue
+            if kind == 'rectangle':
+                self.paint_rect(coords, options)
+            elif kind == 'oval':
+                self.paint_oval(coords, options)
+        return pixels
+
+    def paint_rect(self, coords, options):
+        x0, y0, x1, y1 = self.clip(coords)
+        if x0 >= x1 or y0 >= y1:
+            return
+        fill = parse_color(options.get('fill'))
+        if fill is not None:
+            self.pixels[y0:y1, x0:x1] = fill
+        outline = parse_color(options.get('outline'))
+        if outline is not None:
+            self.pixels[y0, x0:x1] = outline
+            self.pixels[y1 - 1, x0:x1] = outline
+            self.pixels[y0:y1, x0] = outline
+            self.pixels[y0:y1, x1 - 1] = outline
+
+    def paint_oval(self, coords, options):
+        x0, y0, x1, y1 = self.clip(coords)
+        if x0 >= x1 or y0 >= y1:
+            return
+        cx = (coords[0] + coords[2]) / 2
+        cy = (coords[1] + coords[3]) / 2
+        rx = max(abs(coords[2] - coords[0]) / 2, 0.5)
+        ry = max(abs(coords[3] - coords[1]) / 2, 0.5)
+        xs = self.xs[x0:x1] - cx
+        ys = self.ys[y0:y1] - cy
+        region = self.pixels[y0:y1, x0:x1]
+        inside = ellipse(xs, ys, rx, ry)
+        fill = parse_color(options.get('fill'))
+        if fill is not None:
+            region[inside] = fill
+        outline = parse_color(options.get('outline'))
+        if outline is not None:
+            # The one-pixel ring just inside the edge
+            inner = ellipse(xs, ys, max(rx - 1, 0.5), max(ry - 1, 0.5))
+            region[inside & ~inner] = outline
+
+
+def write_png(path, pixels):
+    # An RGB uint8 array as an 8-bit truecolour PNG, with no imaging library
+    height, width, _ = pixels.shape
+    raw = np.zeros((height, width * 3 + 1), np.uint8)
+    raw[:, 1:] = pixels.reshape(height, width * 3)
+
+    def chunk(tag, data):
+        return (struct.pack('>I', len(data)) + tag + data +
+                struct.pack('>I', zlib.crc32(tag + data)))
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2,
+                                           0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+def positive(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError('must be at least 1, not %d' % value)
+    return value
+
+
+def main(argv=None):
+    from .autopilot import Predictor
+    from .backends import open_canvas
+    from .variants import DEFAULT, VARIANTS
+    from .view import CanvasView
+
+    parser = argparse.ArgumentParser(
+        prog='brickbreaker capture',
+        description='Play a variant headless with the predicting autopilot '
+                    'and render every frame offscreen.')
+    parser.add_argument('variant', nargs='?', default=DEFAULT,
+                        choices=sorted(VARIANTS))
+    parser.add_argument('-n', '--frames', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--backend', choices=('framebuffer', 'null'),
+                        default='framebuffer')
+    parser.add_argument('--out', metavar='DIR',
+                        help='write frames here as PNG files')
+    parser.add_argument('--every', type=positive, default=60,
+                        help='write every Nth frame (default 60)')
+    parser.add_argument('--particles', type=int, default=0, metavar='N',
+                        help='particle budget for effects (default: none)')
+    parser.add_argument('--balls', type=int, default=0, metavar='N',
+                        help='storm mode: launch N extra balls with every '
+                             'ball')
+    parser.add_argument('--powerup', type=int, default=0, metavar='N',
+                        help='every Nth brick broken launches two extra '
+                             'balls')
+    parser.add_argument('--swept', action='store_true',
+                        help='time-of-impact collisions, so a fast ball '
+                             "can't pass through a brick or the paddle")
+    args = parser.parse_args(argv)
+
+    variant = VARIANTS[args.variant]
+    rules = dict(multiball=args.balls, powerup=args.powerup)
+    if args.swept:
+        rules['swept'] = True
+    world = variant.world(args.seed, rules=variant.make_rules(**rules))
+    canvas = open_canvas(args.backend, world.width, world.height,
+                         variant.style['bg'])
+    dt = 1.0 / variant.physics_hz
+    effects = None
+    if args.particles:
+        from .effects import Effects
+        effects = Effects(world, args.particles, seed=args.seed, dt=dt)
+    view = CanvasView(canvas, world, style=variant.style, effects=effects)
+    pilot = Predictor(world, variant.paddle_speed)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    world.start()
+
+    start = time.perf_counter()
+    for number in range(args.frames):
+        pilot.drive(dt)
+        world.step(dt)
+        if world.state == 'ready':
+            world.start()
+        view.draw()
+        if args.backend == 'framebuffer':
+            pixels = canvas.frame()
+            if args.out and number % args.every == 0:
+                write_png(os.path.join(args.out, 'frame%06d.png' % number),
+                          pixels)
+    elapsed = time.perf_counter() - start
+    print('%d frames in %.2fs (%.0f frames/s)'
+          % (args.frames, elapsed, args.frames / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+from collections import deque
+
+# Quality levels, best first; each gives up one more thing than the last
+LEVELS = ('full', 'no-hud', 'few-effects', 'low-rate')
+FULL, NO_HUD, FEW_EFFECTS, LOW_RATE = range(len(LEVELS))
+
+
+class Governor(object):
+    # Keeps frames inside the render interval. frame() is told how long
+    # each frame's work took (physics steps and drawing); over a rolling
+    # window the average decides the level. Running long (past high of the
+    # interval) steps down one level: the HUD is redrawn only every
+    # hud_every frames, then the particle limit drops to a share of its
+    # budget, then the render rate is divided by slowdown. Physics keeps
+    # its fixed step throughout, since the loop's accumulator absorbs the
+    # longer frames. Headroom (under low of the better level's interval)
+    # steps back up. After a change the window refills before the next.
+    def __init__(self, render_hz=60, view=None, effects=None, window=30,
+                 high=0.9, low=0.5, hud_every=10, effects_share=0.25,
+                 slowdown=2):
+        self.render_hz = render_hz
+        self.view = view
+        self.effects = effects
+        self.high = high
+        self.low = low
+        self.hud_every = hud_every
+        self.effects_share = effects_share
+        self.slowdown = slowdown
+        self.samples = deque(maxlen=window)
+        self.total = 0.0
+        self.level = FULL
+        self.changes = 0
+
+    @property
+    def quality(self):
+        return LEVELS[self.level]
+
+    @property
+    def average(self):
+        if not self.samples:
+            return 0.0
+        return self.total / len(self.samples)
+
+    def interval(self, level=None):
+        level = self.level if level is None else level
+        return 1.0 / self.rate(self.render_hz, level)
+
+    def rate(self, render_hz, level=None):
+        # The render rate the loop should run at instead of render_hz
+        level = self.level if level is None else level
+        if level >= LOW_RATE:
+            return render_hz / self.slowdown
+        return render_hz
+
+    def frame(self, seconds):
+        samples = self.samples
+        if len(samples) == samples.maxlen:
+            self.total -= samples[0]
+        samples.append(seconds)
+        self.total += seconds
+        if len(samples) < samples.maxlen:
+            return self.level
+        average = self.average
+        if average > self.high * self.interval():
+            if self.level < len(LEVELS) - 1:
+                self.set(self.level + 1)
+        elif self.level > FULL:
+            if average < self.low * self.interval(self.level - 1):
+                self.set(self.level - 1)
+        return self.level
+
+    def set(self, level):
+        self.level = level
+        self.changes += 1
+        self.samples.clear()
+        self.total = 0.0
+        if self.view is not None:
+            self.view.hud_every = self.hud_every if level >= NO_HUD else 1
+        if self.effects is not None:
+            particles = self.effects.particles
+            if level >= FEW_EFFECTS:
+                particles.limit = max(1, int(particles.budget *
+                                             self.effects_share))
+            else:
+                particles.limit = particles.budget
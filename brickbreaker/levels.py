@@ -0,0 +1,234 @@
+import mmap
+import os
+import random
+import struct
+
+# A level file is a small header followed by fixed-size brick records, so
+# any brick can be read straight out of the mapped file by its index.
+#   header  b'BRKL' version:u8 pad:3 count:u32 width:f32 height:f32
+#   brick   x:f32 y:f32 width:f32 height:f32 hits:u8 color:u8 pad:2
+# x and y are the brick centre. color indexes PALETTE; 0 means "by hits"
+# like Brick.COLORS.
+MAGIC = b'BRKL'
+VERSION = 1
+HEADER = struct.Struct('<4sB3xIff')
+RECORD = struct.Struct('<ffffBB2x')
+
+PALETTE = [None, '#4535AA', '#ED639E', '#8FE1A2', 'red', 'blue', 'green',
+           'yellow', 'purple', 'lightgreen']
+
+NUMPY_RECORD = [('x', '<f4'), ('y', '<f4'), ('width', '<f4'),
+                ('height', '<f4'), ('hits', 'u1'), ('color', 'u1'),
+                ('pad', 'V2')]
+
+
+def write_level(path, bricks, width=610, height=400):
+    # bricks: iterable of (x, y, width, height, hits, color)
+    bricks = list(bricks)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(bricks), width, height))
+        for brick in bricks:
+            f.write(RECORD.pack(*brick))
+
+
+class LevelFile(object):
+    # Read-only view of a level file through mmap. Nothing is parsed up
+    # front: bricks are unpacked one at a time on access, or handed to
+    # NumPy as a zero-copy record array.
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = None
+        self.checked = False
+        try:
+            # mmap can't map an empty file, and unpack_from would raise
+            # struct.error on a short one
+            if os.fstat(self.file.fileno()).st_size < HEADER.size:
+                raise ValueError('%s is not a level file' % path)
+            self.map = mmap.mmap(self.file.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+            magic, version, self.count, self.width, self.height = \
+                HEADER.unpack_from(self.map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError('%s is not a level file' % path)
+            if len(self.map) < HEADER.size + self.count * RECORD.size:
+                raise ValueError('%s is truncated' % path)
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self.map, HEADER.size + index * RECORD.size)
+
+    def __iter__(self):
+        return RECORD.iter_unpack(
+            self.map[HEADER.size:HEADER.size + self.count * RECORD.size])
+
+    def array(self):
+        import numpy as np
+
+        return np.frombuffer(self.map, dtype=np.dtype(NUMPY_RECORD),
+                             count=self.count, offset=HEADER.size)
+
+    def check(self, width, height):
+        # Brick positions are only right on the field size in the header,
+        # and every brick needs a hit to take and a colour PALETTE has
+        if (self.width, self.height) != (width, height):
+            raise ValueError('%s is laid out for a %gx%g field, not %gx%g'
+                             % (self.file.name, self.width, self.height,
+                                width, height))
+        if self.checked:
+            return
+        for index, (_, _, _, _, hits, color) in enumerate(self):
+            if hits < 1:
+                raise ValueError('%s: brick %d has no hits'
+                                 % (self.file.name, index))
+            if color >= len(PALETTE):
+                raise ValueError('%s: brick %d has colour %d, past the '
+                                 'palette' % (self.file.name, index, color))
+        # The file is read-only, so its records only need checking once
+        self.checked = True
+
+    def layout(self, world):
+        # Usable as World(layout=...). A BrickArray is filled in one
+        # vectorised copy; other brick containers get one add() per brick.
+        self.check(world.width, world.height)
+        if hasattr(world.bricks, 'extend'):
+            import numpy as np
+
+            records = self.array()
+            half_w = records['width'] / 2
+            half_h = records['height'] / 2
+            bounds = np.stack([records['x'] - half_w, records['y'] - half_h,
+                               records['x'] + half_w, records['y'] + half_h],
+                              axis=1)
+            start = world.bricks.size
+            world.bricks.extend(bounds, records['hits'])
+            for offset in np.flatnonzero(records['color']).tolist():
+                world.colors[start + offset] = \
+                    PALETTE[records['color'][offset]]
+        else:
+            for x, y, width, height, hits, color in self:
+                world.add_brick(x, y, hits, width, height, PALETTE[color])
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# The layouts hardcoded in the scripts, as brick records. Each takes a
+# random.Random and the level number.
+
+def classic(rng, level=1, width=610):
+    # BrickBreakerGame.py, GameClass.py
+    bricks = []
+    for x in range(5, width - 5, 75):
+        bricks.append((x + 37.5, 50, 75, 20, 3, 0))
+        bricks.append((x + 37.5, 70, 75, 20, 2, 0))
+        bricks.append((x + 37.5, 90, 75, 20, 1, 0))
+    return bricks
+
+
+def brick_class(rng, level=1):
+    # Brick Class.py: one more row per level, 1-3 hits each
+    return [(50 + j * 70, 30 + i * 30, 75, 20, rng.choice([1, 2, 3]), 0)
+            for i in range(5 + level) for j in range(7)]
+
+
+def paddle_class(rng, level=1):
+    # PaddleClass.py: single-hit bricks in random colours
+    return [(50 + j * 70, 30 + i * 30, 60, 20, 1, rng.choice([4, 5, 6, 7]))
+            for i in range(5) for j in range(7)]
+
+
+def game_objeck_class(rng, level=1):
+    # GameObjeckClass.py places bricks by their top-left corner
+    return [(60 * j + 10 + 30, 30 * i + 10 + 10, 60, 20, 1, 9)
+            for i in range(6) for j in range(8)]
+
+
+def ball_class(rng, level=1):
+    # BallClass.py
+    return [(50 + col * 50, 50 + row * 20, 50, 20, 1,
+             rng.choice([4, 5, 6, 7, 8]))
+            for row in range(5) for col in range(10)]
+
+
+def dense(rng, level=1, cols=100, rows=100, width=610, top=20, bottom=250):
+    # Stress layout: cols x rows small bricks filling the top of the field
+    w = width / cols
+    h = (bottom - top) / rows
+    return [((col + 0.5) * w, top + (row + 0.5) * h, w, h,
+             rng.choice([1, 2, 3]), 0)
+            for row in range(rows) for col in range(cols)]
+
+
+LAYOUTS = {
+    'classic': classic,
+    'brick_class': brick_class,
+    'paddle_class': paddle_class,
+    'game_objeck_class': game_objeck_class,
+    'ball_class': ball_class,
+    'dense': dense,
+}
+
+# The field each layout was made for, written to the header on export
+SIZES = {
+    'classic': (610, 400),
+    'brick_class': (500, 400),
+    'paddle_class': (500, 400),
+    'game_objeck_class': (500, 500),
+    'ball_class': (500, 500),
+    'dense': (610, 400),
+}
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='brickbreaker levels',
+                                     description='Write or inspect levels.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help='write a built-in layout')
+    export.add_argument('layout', choices=sorted(LAYOUTS))
+    export.add_argument('path')
+    export.add_argument('--seed', type=int, default=0)
+    export.add_argument('--level', type=int, default=1)
+    export.add_argument('--width', type=float,
+                        help="default: the layout's own field size")
+    export.add_argument('--height', type=float)
+    info = commands.add_parser('info', help='describe a level file')
+    info.add_argument('path')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        width, height = SIZES[args.layout]
+        bricks = LAYOUTS[args.layout](random.Random(args.seed), args.level)
+        write_level(args.path, bricks, args.width or width,
+                    args.height or height)
+        print('%s: %d bricks' % (args.path, len(bricks)))
+    else:
+        try:
+            level = LevelFile(args.path)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        with level:
+            print('%s: %d bricks, %gx%g' % (args.path, len(level),
+                                            level.width, level.height))
+
+
+if __name__ == '__main__':
+    main()
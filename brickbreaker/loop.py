@@ -0,0 +1,64 @@
+import time
+
+
+class FixedStepLoop(object):
+    # Runs step(dt) at a fixed physics rate however often tick() is called,
+    # then render(alpha) once, where alpha is the fraction of a step that is
+    # still waiting in the accumulator. At most max_steps are run per tick;
+    # time beyond that is dropped so a stall can't snowball. A
+    # governor.Governor, if given, is told how long each tick took and
+    # sets the render rate run_async() keeps.
+    def __init__(self, step, render, physics_hz=20, max_steps=5,
+                 clock=time.perf_counter, governor=None):
+        self.step = step
+        self.render = render
+        self.dt = 1.0 / physics_hz
+        self.max_steps = max_steps
+        self.clock = clock
+        self.governor = governor
+        self.accumulator = 0.0
+        self.last = None
+        self.steps = 0
+        self.dropped = 0.0
+
+    def tick(self):
+        now = self.clock()
+        if self.last is None:
+            self.last = now
+        self.accumulator += now - self.last
+        self.last = now
+
+        steps = 0
+        while self.accumulator >= self.dt and steps < self.max_steps:
+            self.step(self.dt)
+            self.accumulator -= self.dt
+            steps += 1
+        if self.accumulator >= self.dt:
+            self.dropped += self.accumulator - self.accumulator % self.dt
+            self.accumulator %= self.dt
+        self.steps += steps
+
+        self.render(self.accumulator / self.dt)
+        if self.governor is not None:
+            self.governor.frame(self.clock() - now)
+        return steps
+
+    def interval(self, render_hz):
+        if self.governor is not None:
+            render_hz = self.governor.rate(render_hz)
+        return 1.0 / render_hz
+
+    async def run_async(self, render_hz=60):
+        # Drives tick() as a coroutine for scheduler.Scheduler. Each sleep is
+        # measured against the time the frame was due, so slow frames don't
+        # push later ones.
+        import asyncio
+
+        due = self.clock()
+        while True:
+            self.tick()
+            due += self.interval(render_hz)
+            now = self.clock()
+            if due < now:
+                due = now
+            await asyncio.sleep(due - now)
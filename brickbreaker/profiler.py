@@ -0,0 +1,258 @@
+import atexit
+import json
+import time
+from collections import Counter
+
+# Tk commands counted on an instrumented canvas
+COMMANDS = ('coords', 'move', 'delete', 'itemconfig', 'itemconfigure',
+            'create_rectangle', 'create_oval', 'create_text', 'create_line',
+            'create_image', 'find_overlapping', 'find_withtag', 'tag_raise',
+            'winfo_width', 'winfo_height', 'bbox', 'itemcget')
+
+# Upper edges of the frame time histogram buckets, in ms
+BUCKETS = (1, 2, 4, 8, 16, 33, 50, 100, float('inf'))
+
+# Methods timed as phases when present. The game loop marks frames.
+PHASES = ('check_collisions', 'sweep_ball', 'draw_hud', 'step', 'render')
+FRAMES = ('game_loop', 'tick')
+
+MISSING = object()
+
+
+class Profiler(object):
+    # Per-frame timings and Tk command counts kept in a fixed-size ring
+    # buffer. attach() wraps a game's loop, phase methods and canvas in
+    # place and detach() puts them back, so it can be toggled while the
+    # game is running.
+    def __init__(self, capacity=600, clock=time.perf_counter):
+        self.capacity = capacity
+        self.clock = clock
+        self.frames = [None] * capacity
+        self.index = 0
+        self.total = 0
+        self.phases = Counter()
+        self.calls = Counter()
+        self.totals = Counter()
+        self.patched = []
+        self.target = None
+        self.canvas = None
+        self.depth = 0
+        self.listeners = []
+
+    @property
+    def enabled(self):
+        return bool(self.patched)
+
+    def record(self, seconds):
+        self.frames[self.index] = (seconds, dict(self.phases),
+                                   dict(self.calls))
+        self.index = (self.index + 1) % self.capacity
+        self.total += 1
+        self.totals.update(self.calls)
+        self.phases.clear()
+        self.calls.clear()
+        for listener in self.listeners:
+            listener(self)
+
+    def recent(self):
+        # Frames in the buffer, oldest first
+        frames = self.frames[self.index:] + self.frames[:self.index]
+        return [frame for frame in frames if frame is not None]
+
+    def wrap(self, owner, name, phase=None, frame=False):
+        # Times owner.name, which may be a class (every instance, including
+        # ones created later) or a single object
+        if isinstance(owner, type):
+            method = owner.__dict__[name]
+        else:
+            method = getattr(owner, name)
+        profiler = self
+        phase = phase or name
+
+        def timed(*args, **kwargs):
+            start = profiler.clock()
+            profiler.depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler.depth -= 1
+                elapsed = profiler.clock() - start
+                if frame and profiler.depth == 0:
+                    profiler.record(elapsed)
+                else:
+                    profiler.phases[phase] += elapsed
+
+        self.patch(owner, name, timed)
+
+    def patch(self, owner, name, value):
+        self.patched.append((owner, name, owner.__dict__.get(name, MISSING)))
+        setattr(owner, name, value)
+
+    def count(self, canvas):
+        profiler = self
+        for name in COMMANDS:
+            method = getattr(canvas, name, None)
+            if method is None:
+                continue
+
+            def counted(*args, _name=name, _method=method, **kwargs):
+                profiler.calls[_name] += 1
+                return _method(*args, **kwargs)
+
+            self.patch(canvas, name, counted)
+
+    def attach(self, game, canvas=None):
+        # game is a FixedStepLoop, or anything with a game_loop or tick
+        # method. Balls and paddles get recreated, so their classes are
+        # wrapped.
+        if self.enabled:
+            return
+        self.target = game
+        self.canvas = canvas
+        # A loop's step is World.step, which owns the ball and paddle, or
+        # belongs to something holding the world (Controls, Recorder); its
+        # render is a CanvasView's draw
+        owner = getattr(getattr(game, 'step', None), '__self__', game)
+        owner = getattr(owner, 'world', owner)
+        view = getattr(getattr(game, 'render', None), '__self__', game)
+        for name in FRAMES:
+            if callable(getattr(game, name, None)):
+                self.wrap(game, name, frame=True)
+                break
+        # Phases are timed where they are defined: on the game, or on the
+        # world or view behind a loop (once, if several have that name)
+        for name in PHASES:
+            for target in (game, owner, view):
+                if callable(getattr(target, name, None)):
+                    self.wrap(target, name)
+                    break
+        for attribute, phase in (('ball', 'Ball.update'),
+                                 ('paddle', 'Paddle.move')):
+            obj = getattr(owner, attribute, None)
+            method = phase.split('.')[1]
+            if obj is not None and method in type(obj).__dict__:
+                self.wrap(type(obj), method, phase)
+        canvas = canvas or getattr(game, 'canvas', None)
+        if canvas is not None:
+            self.count(canvas)
+
+    def detach(self):
+        for owner, name, previous in reversed(self.patched):
+            if previous is MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, previous)
+        self.patched = []
+
+    def toggle(self, game=None, canvas=None):
+        if self.enabled:
+            self.detach()
+        else:
+            self.attach(game or self.target, canvas or self.canvas)
+
+    def histogram(self):
+        counts = [0] * len(BUCKETS)
+        for seconds, _, _ in self.recent():
+            ms = seconds * 1000
+            for i, edge in enumerate(BUCKETS):
+                if ms <= edge:
+                    counts[i] += 1
+                    break
+        return list(zip(BUCKETS, counts))
+
+    def summary(self):
+        frames = self.recent()
+        if not frames:
+            return {'frames': self.total}
+        times = sorted(frame[0] for frame in frames)
+        phases = Counter()
+        calls = Counter()
+        for _, frame_phases, frame_calls in frames:
+            phases.update(frame_phases)
+            calls.update(frame_calls)
+        n = len(frames)
+        return {
+            'frames': self.total,
+            'window': n,
+            'mean_ms': sum(times) / n * 1000,
+            'p50_ms': times[n // 2] * 1000,
+            'p99_ms': times[min(n - 1, int(n * 0.99))] * 1000,
+            'max_ms': times[-1] * 1000,
+            'phase_ms': {name: value / n * 1000
+                         for name, value in phases.items()},
+            'calls_per_frame': {name: value / n
+                                for name, value in calls.items()},
+            'histogram': [[str(edge), count]
+                          for edge, count in self.histogram()],
+            'calls_total': dict(self.totals),
+            'quality': self.quality(),
+        }
+
+    def quality(self):
+        # The quality level of a governed loop, if that is what's attached
+        governor = getattr(self.target, 'governor', None)
+        return governor.quality if governor is not None else None
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2, sort_keys=True)
+
+    def dump_at_exit(self, path='profile.json'):
+        # Only if anything was profiled
+        def dump():
+            if self.total:
+                self.dump(path)
+        atexit.register(dump)
+
+
+class Overlay(object):
+    # Text in the corner of the canvas with the profiler's recent numbers.
+    # It talks to the canvas through the class methods so its own calls
+    # are not counted.
+    def __init__(self, canvas, profiler, every=10, x=None, y=4):
+        self.canvas = canvas
+        self.profiler = profiler
+        self.every = every
+        cls = type(canvas)
+        if x is None:
+            x = int(cls.cget(canvas, 'width')) - 4
+        self.item = cls.create_text(canvas, x, y, anchor='ne', text='',
+                                    fill='black', font=('Courier', 9))
+        profiler.listeners.append(self.update)
+
+    def update(self, profiler):
+        if profiler.total % self.every:
+            return
+        summary = profiler.summary()
+        lines = ['frame %.2f ms  p99 %.2f ms' % (summary['mean_ms'],
+                                                 summary['p99_ms'])]
+        if summary['quality'] is not None:
+            lines.append('quality %s' % summary['quality'])
+        lines += ['%s %.2f ms' % item
+                  for item in sorted(summary['phase_ms'].items())]
+        lines += ['%s %.1f' % item
+                  for item in sorted(summary['calls_per_frame'].items())]
+        type(self.canvas).itemconfig(self.canvas, self.item,
+                                     text='\n'.join(lines))
+
+    def hide(self):
+        type(self.canvas).itemconfig(self.canvas, self.item, text='')
+
+
+def install(root, game, canvas=None, key='<F3>', path=None):
+    # F3 turns profiling and the overlay on and off. With a path profiling
+    # starts on, and the numbers are written there when the program exits.
+    canvas = canvas or game.canvas
+    profiler = Profiler()
+    overlay = Overlay(canvas, profiler)
+
+    def toggle(_=None):
+        profiler.toggle(game, canvas)
+        if not profiler.enabled:
+            overlay.hide()
+
+    root.bind(key, toggle)
+    if path:
+        toggle()
+        profiler.dump_at_exit(path)
+    return profiler
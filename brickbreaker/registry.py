@@ -0,0 +1,87 @@
+from collections import Counter
+
+
+class LeakError(Exception):
+    pass
+
+
+class ItemRegistry(object):
+    # Owns the canvas items and after() ids of one canvas. Released items
+    # are hidden and pooled by kind and tags rather than deleted, so a ball,
+    # a message or a new level's bricks reuse items instead of creating more.
+    # after() keeps at most one pending call per key. counts() is what is
+    # alive right now; check() raises LeakError past a budget.
+    def __init__(self, canvas, pool_size=1024, limit=None):
+        self.canvas = canvas
+        self.pool_size = pool_size
+        self.limit = limit
+        self.live = {}
+        self.pools = {}
+        self.timers = {}
+        self.created = 0
+        self.reused = 0
+        self.peak = 0
+
+    def create(self, kind, coords, options):
+        # Returns the item, the options it now has and the commands sent
+        canvas = self.canvas
+        group = (kind, options.get('tags'))
+        pool = self.pools.get(group)
+        if pool:
+            item, old_coords, old_options = pool.pop()
+            commands = 0
+            if old_coords != coords:
+                canvas.coords(item, *coords)
+                commands += 1
+            options = dict(options)
+            options.setdefault('state', 'normal')
+            changed = {name: value for name, value in options.items()
+                       if old_options.get(name) != value}
+            if changed:
+                canvas.itemconfig(item, **changed)
+                commands += 1
+            self.reused += 1
+        else:
+            item = getattr(canvas, 'create_' + kind)(*coords, **options)
+            options = dict(options)
+            commands = 1
+            self.created += 1
+        self.live[item] = group
+        self.peak = max(self.peak, len(self.live))
+        self.check()
+        return item, options, commands
+
+    def release(self, item, coords, options):
+        # Hides the item for reuse, or deletes it once its pool is full
+        group = self.live.pop(item)
+        pool = self.pools.setdefault(group, [])
+        if len(pool) >= self.pool_size:
+            self.canvas.delete(item)
+        else:
+            self.canvas.itemconfig(item, state='hidden')
+            pool.append((item, coords, dict(options, state='hidden')))
+        return 1
+
+    def after(self, key, ms, func, *args):
+        # A call already pending under key is kept and this one dropped
+        after_id = self.timers.get(key)
+        if after_id is None:
+            def fire():
+                del self.timers[key]
+                func(*args)
+            fire.__name__ = getattr(func, '__name__', 'fire')
+            after_id = self.timers[key] = self.canvas.after(ms, fire)
+        return after_id
+
+    def counts(self):
+        counts = Counter(kind for kind, _ in self.live.values())
+        counts['items'] = len(self.live)
+        counts['pooled'] = sum(len(pool) for pool in self.pools.values())
+        counts['timers'] = len(self.timers)
+        return counts
+
+    def check(self, limit=None):
+        limit = limit or self.limit
+        if limit is not None and len(self.live) > limit:
+            raise LeakError('%d live canvas items, limit %d'
+                            % (len(self.live), limit))
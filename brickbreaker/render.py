@@ -0,0 +1,93 @@
+from .registry import ItemRegistry
+
+
+class RenderLayer(object):
+    # Retained canvas items addressed by key. Calls during a frame only
+    # record what each item should look like; flush() then sends one create,
+    # coords or itemconfig per item that actually differs from what the
+    # canvas already shows. Items come from and go back to an ItemRegistry,
+    # so a deleted key's item is pooled for the next one of its kind.
+    def __init__(self, canvas, registry=None):
+        self.canvas = canvas
+        self.registry = registry or ItemRegistry(canvas)
+        self.items = {}
+        self.sent = {}
+        self.pending = {}
+        self.deleted = set()
+        self.commands = 0
+
+    def rect(self, key, coords, **options):
+        self.set(key, 'rectangle', coords, options)
+
+    def oval(self, key, coords, **options):
+        self.set(key, 'oval', coords, options)
+
+    def text(self, key, x, y, **options):
+        self.set(key, 'text', (x, y), options)
+
+    def set(self, key, kind, coords, options):
+        self.deleted.discard(key)
+        entry = self.pending.get(key)
+        if entry is None or entry[0] != kind:
+            self.pending[key] = (kind, tuple(coords), dict(options))
+        else:
+            entry[2].update(options)
+            self.pending[key] = (kind, tuple(coords), entry[2])
+
+    def config(self, key, **options):
+        # Change options only, keeping the coords already set or sent
+        entry = self.pending.get(key) or self.sent[key]
+        self.set(key, entry[0], entry[1], options)
+
+    def delete(self, key):
+        self.pending.pop(key, None)
+        if key in self.items:
+            self.deleted.add(key)
+
+    def __contains__(self, key):
+        return key in self.pending or (key in self.items and
+                                       key not in self.deleted)
+
+    def release(self, key):
+        _, coords, options = self.sent.pop(key)
+        return self.registry.release(self.items.pop(key), coords, options)
+
+    def flush(self):
+        canvas = self.canvas
+        registry = self.registry
+        commands = 0
+        for key in self.deleted:
+            commands += self.release(key)
+        self.deleted = set()
+
+        for key, (kind, coords, options) in self.pending.items():
+            sent = self.sent.get(key)
+            if sent is not None and sent[0] != kind:
+                commands += self.release(key)
+                sent = None
+            if sent is None:
+                item, options, sent_commands = registry.create(kind, coords,
+                                                               options)
+                self.items[key] = item
+                self.sent[key] = (kind, coords, options)
+                commands += sent_commands
+                continue
+            item = self.items[key]
+            if coords != sent[1]:
+                canvas.coords(item, *coords)
+                commands += 1
+            changed = {name: value for name, value in options.items()
+                       if sent[2].get(name) != value}
+            if changed:
+                canvas.itemconfig(item, **changed)
+                sent[2].update(changed)
+                commands += 1
+            self.sent[key] = (kind, coords, sent[2])
+        self.pending = {}
+        self.commands += commands
+        return commands
+
+    def clear(self):
+        for key in list(self.items):
+            self.delete(key)
+        self.pending = {}
@@ -0,0 +1,223 @@
+import argparse
+import json
+import random
+import struct
+import sys
+import time
+import zlib
+
+from .variants import DEFAULT, VARIANTS
+from .world import TICK, Rules
+
+# File layout: header, then records. An input record is a run of ticks
+# with the same input, so idle stretches cost five bytes.
+#   header  b'BRKR' version:u8 seed:u64 dt:f64 interval:u16 rules_len:u16
+#           rules (JSON: variant name and Rules overrides)
+#   input   b'I' ticks:u16 offset:i8 flags:u8
+#   check   b'C' tick:u32 crc:u32
+MAGIC = b'BRKR'
+VERSION = 1
+HEADER = struct.Struct('<4sBQdHH')
+INPUT = struct.Struct('<HbB')
+CHECK = struct.Struct('<II')
+
+START = 1  # space: start the ball, or retry after game over
+
+
+class DesyncError(Exception):
+    pass
+
+
+def checksum(world):
+    ball = world.ball
+    state = struct.pack('<IiiIddbbdd', world.ticks, world.score, world.lives,
+                        len(world.bricks), ball.x, ball.y,
+                        ball.direction[0], ball.direction[1], ball.speed,
+                        world.paddle.x)
+    return zlib.crc32(world.state.encode(), zlib.crc32(state))
+
+
+def apply_input(world, offset, flags):
+    if offset:
+        world.move_paddle(offset)
+    if flags & START:
+        if world.state == 'over':
+            world.retry()
+        else:
+            world.start()
+
+
+class Recorder(object):
+    # Steps a World and logs the input applied before each step. Key
+    # handlers call press()/start(); the input is held until the next step
+    # so the log lines up with ticks exactly.
+    def __init__(self, f, seed=None, rules=None, dt=TICK, interval=50,
+                 variant=DEFAULT, bricks=None):
+        if seed is None:
+            seed = random.getrandbits(63)
+        rules = rules or VARIANTS[variant].make_rules()
+        overrides = {name: value for name, value in vars(rules).items()
+                     if getattr(Rules, name) != value}
+        blob = json.dumps({'variant': variant, 'rules': overrides},
+                          sort_keys=True).encode()
+        self.f = f
+        self.dt = dt
+        self.interval = interval
+        self.variant = VARIANTS[variant]
+        self.world = self.variant.world(seed, bricks, rules)
+        f.write(HEADER.pack(MAGIC, VERSION, seed, dt, interval, len(blob)))
+        f.write(blob)
+        self.offset = 0
+        self.flags = 0
+        self.run = None
+
+    def press(self, offset):
+        self.offset += offset
+
+    def start(self):
+        self.flags |= START
+
+    def step(self, dt=None):
+        offset = max(-128, min(127, self.offset))
+        flags = self.flags
+        self.offset = 0
+        self.flags = 0
+        self.log(offset, flags)
+        world = self.world
+        apply_input(world, offset, flags)
+        world.step(self.dt)
+        if world.ticks % self.interval == 0:
+            self.flush()
+            self.f.write(b'C' + CHECK.pack(world.ticks, checksum(world)))
+
+    def log(self, offset, flags):
+        if self.run and self.run[1:] == [offset, flags] and \
+                self.run[0] < 0xFFFF:
+            self.run[0] += 1
+        else:
+            self.flush()
+            self.run = [1, offset, flags]
+
+    def flush(self):
+        if self.run:
+            self.f.write(b'I' + INPUT.pack(*self.run))
+            self.run = None
+
+    def close(self):
+        self.flush()
+        self.f.flush()
+
+
+class Replay(object):
+    # Plays a log back into a fresh World, checking every stored checksum.
+    # step() can drive a FixedStepLoop for playback in the UI at any speed;
+    # run() replays headless as fast as possible.
+    def __init__(self, data):
+        magic, version, seed, dt, interval, size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a replay log')
+        pos = HEADER.size
+        blob = json.loads(data[pos:pos + size].decode())
+        if 'variant' not in blob:
+            # Logs from before variants hold only the rule overrides
+            blob = {'variant': DEFAULT, 'rules': blob}
+        self.data = data
+        self.pos = pos + size
+        self.seed = seed
+        self.dt = dt
+        self.interval = interval
+        self.variant = VARIANTS[blob['variant']]
+        self.world = self.variant.world(seed, rules=Rules(**blob['rules']))
+        self.left = 0
+        self.input = (0, 0)
+        self.checked = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    @property
+    def finished(self):
+        return self.left == 0 and self.pos >= len(self.data)
+
+    def next_input(self):
+        data = self.data
+        while self.left == 0:
+            if self.pos >= len(data):
+                return None
+            tag = data[self.pos:self.pos + 1]
+            self.pos += 1
+            if tag == b'I':
+                count, offset, flags = INPUT.unpack_from(data, self.pos)
+                self.pos += INPUT.size
+                self.left = count
+                self.input = (offset, flags)
+            elif tag == b'C':
+                self.verify(*CHECK.unpack_from(data, self.pos))
+                self.pos += CHECK.size
+            else:
+                raise ValueError('bad record %r at byte %d'
+                                 % (tag, self.pos - 1))
+        self.left -= 1
+        return self.input
+
+    def verify(self, tick, crc):
+        world = self.world
+        if world.ticks != tick or checksum(world) != crc:
+            raise DesyncError('replay diverged at tick %d (world at tick %d)'
+                              % (tick, world.ticks))
+        self.checked += 1
+
+    def step(self, dt=None):
+        # Returns False once the log is used up
+        tick = self.next_input()
+        if tick is None:
+            return False
+        apply_input(self.world, *tick)
+        self.world.step(self.dt)
+        # A checksum written right after this tick is checked now
+        if self.left == 0:
+            self.next_checks()
+        return True
+
+    def next_checks(self):
+        data = self.data
+        while data[self.pos:self.pos + 1] == b'C':
+            self.verify(*CHECK.unpack_from(data, self.pos + 1))
+            self.pos += 1 + CHECK.size
+
+    def run(self):
+        while self.step():
+            pass
+        return self.world
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='brickbreaker replay',
+        description='Replay a log headless as fast as possible and check '
+                    'every checksum in it.')
+    parser.add_argument('log')
+    args = parser.parse_args(argv)
+
+    try:
+        replay = Replay.load(args.log)
+    except (OSError, ValueError, struct.error) as error:
+        parser.error('cannot read %s: %s' % (args.log, error))
+    start = time.perf_counter()
+    try:
+        world = replay.run()
+    except DesyncError as error:
+        print('%s: %s after %d checksums' % (args.log, error, replay.checked),
+              file=sys.stderr)
+        return 1
+    seconds = time.perf_counter() - start
+    print('%s: %s, %d ticks, %d checksums ok, score %d (%.2fs)'
+          % (args.log, replay.variant.name, world.ticks, replay.checked,
+             world.score, seconds))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
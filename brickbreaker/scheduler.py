@@ -0,0 +1,59 @@
+import asyncio
+
+
+class Scheduler(object):
+    # Runs a Tk window from an asyncio event loop instead of mainloop(). A
+    # task pumps Tk's events; the game loop and any other coroutine handed
+    # to run() or spawn() are tasks on the same loop. Every task is tracked,
+    # so stop() cancels them all, and one that fails stops the game and
+    # re-raises from run().
+    def __init__(self, root, pump_hz=200):
+        self.root = root
+        self.pump_interval = 1.0 / pump_hz
+        self.tasks = set()
+        self.error = None
+        self.stopped = None
+
+    def spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.done)
+        return task
+
+    def done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.error = self.error or task.exception()
+            self.stop()
+
+    async def pump(self):
+        from tkinter import TclError
+
+        while True:
+            try:
+                self.root.update()
+            except TclError:
+                # The window has been destroyed
+                self.stop()
+                return
+            await asyncio.sleep(self.pump_interval)
+
+    def stop(self):
+        if self.stopped is not None:
+            self.stopped.set()
+
+    async def main(self, *coros):
+        self.stopped = asyncio.Event()
+        self.spawn(self.pump())
+        for coro in coros:
+            self.spawn(coro)
+        await self.stopped.wait()
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.error is not None:
+            raise self.error
+
+    def run(self, *coros):
+        asyncio.run(self.main(*coros))
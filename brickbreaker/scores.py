@@ -0,0 +1,265 @@
+import argparse
+import itertools
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.brickbreaker.sqlite3')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    variant TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL,
+    games INTEGER NOT NULL DEFAULT 0,
+    ticks INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_rank ON scores (variant, score DESC, at);
+CREATE TABLE IF NOT EXISTS level_stats (
+    session TEXT NOT NULL,
+    game INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    ticks INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    lives_lost INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (session, game, level)
+);
+CREATE INDEX IF NOT EXISTS level_stats_level ON level_stats (variant, level);
+'''
+
+INSERT_SESSION = 'INSERT INTO sessions (id, variant, started) VALUES (?, ?, ?)'
+END_SESSION = 'UPDATE sessions SET ended = ?, games = ?, ticks = ? WHERE id = ?'
+INSERT_SCORE = ('INSERT INTO scores (session, variant, score, level, result, '
+                'at) VALUES (?, ?, ?, ?, ?, ?)')
+INSERT_LEVEL = ('INSERT OR REPLACE INTO level_stats (session, game, variant, '
+                'level, ticks, hits, lives_lost, points, result) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+STOP = None
+
+
+def connect(path):
+    connection = sqlite3.connect(path, check_same_thread=False)
+    # WAL lets the leaderboard be read while the writer commits, and
+    # NORMAL sync is still safe with it
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.execute('PRAGMA busy_timeout=5000')
+    return connection
+
+
+class ScoreStore(object):
+    # High scores and session stats in SQLite. Writes never touch the disk
+    # on the calling thread: submit() queues a statement and a writer
+    # thread drains the queue, gathering whatever arrives within delay (up
+    # to batch statements) into one transaction, with runs of the same
+    # statement sent through executemany. Reads use their own connection
+    # and are answered by the scores_rank index. A write that fails is
+    # dropped and kept in error rather than stopping the writer.
+    def __init__(self, path=DEFAULT_PATH, batch=256, delay=0.25):
+        self.path = path
+        self.batch = batch
+        self.delay = delay
+        self.queue = queue.Queue()
+        self.error = None
+        self.written = 0
+        self.commits = 0
+        self.connection = connect(path)
+        self.connection.executescript(SCHEMA)
+        self.reader = None
+        self.thread = threading.Thread(target=self.run, name='scores',
+                                       daemon=True)
+        self.thread.start()
+
+    def submit(self, sql, params=()):
+        self.queue.put((sql, params))
+
+    def run(self):
+        while True:
+            ops = [self.queue.get()]
+            deadline = time.monotonic() + self.delay
+            while ops[-1] is not STOP and len(ops) < self.batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    ops.append(self.queue.get(timeout=max(remaining, 0)))
+                except queue.Empty:
+                    break
+            stop = ops[-1] is STOP
+            if stop:
+                ops.pop()
+            if ops:
+                self.write(ops)
+            for _ in range(len(ops) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def write(self, ops):
+        try:
+            with self.connection:
+                for sql, group in itertools.groupby(ops, lambda op: op[0]):
+                    self.connection.executemany(sql, [op[1] for op in group])
+            self.written += len(ops)
+            self.commits += 1
+        except sqlite3.Error as error:
+            self.error = error
+
+    def flush(self):
+        # Waits until everything submitted so far is committed
+        self.queue.join()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(STOP)
+            self.thread.join()
+        self.connection.close()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+    def read(self, sql, params=()):
+        if self.reader is None:
+            self.reader = connect(self.path)
+        return self.reader.execute(sql, params).fetchall()
+
+    def leaderboard(self, variant, limit=10):
+        return self.read('SELECT score, level, result, at FROM scores '
+                         'WHERE variant = ? ORDER BY score DESC, at LIMIT ?',
+                         (variant, limit))
+
+    def best(self, variant):
+        rows = self.leaderboard(variant, 1)
+        return rows[0][0] if rows else 0
+
+    def level_stats(self, variant):
+        # Per level: plays, mean ticks, hits, lives lost and points, and
+        # how many plays cleared it
+        return self.read('SELECT level, COUNT(*), AVG(ticks), SUM(hits), '
+                         'SUM(lives_lost), SUM(points), '
+                         "SUM(result = 'cleared') FROM level_stats "
+                         'WHERE variant = ? GROUP BY level ORDER BY level',
+                         (variant,))
+
+
+class Session(object):
+    # Follows a World's events for one run of the game. Hits and lives are
+    # only counted in memory; a level's row is queued when it ends and a
+    # score when a game ends, so a tick costs nothing more than a counter.
+    # close() records a game still in progress as 'quit'.
+    def __init__(self, store, world, variant, clock=time.time):
+        self.store = store
+        self.world = world
+        self.variant = variant
+        self.clock = clock
+        self.id = uuid.uuid4().hex
+        self.game = 1
+        self.games = 0
+        self.playing = True
+        store.submit(INSERT_SESSION, (self.id, variant, clock()))
+        self.begin_level()
+        world.listeners.append(self.on_event)
+
+    def begin_level(self):
+        world = self.world
+        self.level = world.level
+        self.ticks = world.ticks
+        self.lives = world.lives
+        self.score = world.score
+        self.hits = 0
+
+    def end_level(self, result):
+        world = self.world
+        self.store.submit(INSERT_LEVEL, (
+            self.id, self.game, self.variant, self.level,
+            world.ticks - self.ticks, self.hits,
+            max(self.lives - world.lives, 0), world.score - self.score,
+            result))
+
+    def end_game(self, result):
+        world = self.world
+        self.store.submit(INSERT_SCORE, (self.id, self.variant, world.score,
+                                         world.level, result, self.clock()))
+        self.games += 1
+        self.game += 1
+        self.playing = False
+
+    def on_event(self, event):
+        kind = event[0]
+        if kind == 'hit':
+            self.hits += 1
+        elif kind == 'level':
+            # world.level is already the next one; self.level the cleared one
+            self.end_level('cleared')
+            self.begin_level()
+        elif kind in ('won', 'over'):
+            self.end_level('cleared' if kind == 'won' else 'over')
+            self.end_game(kind)
+        elif kind == 'retry':
+            self.playing = True
+            self.begin_level()
+
+    def close(self):
+        world = self.world
+        if self.playing and world.ticks > self.ticks:
+            self.end_level('quit')
+            self.end_game('quit')
+        self.store.submit(END_SESSION, (self.clock(), self.games, world.ticks,
+                                        self.id))
+        if self.on_event in world.listeners:
+            world.listeners.remove(self.on_event)
+
+
+def main(argv=None):
+    from .variants import DEFAULT, VARIANTS
+
+    parser = argparse.ArgumentParser(
+        prog='brickbreaker scores',
+        description='Show the high scores and per-level stats of a variant.')
+    parser.add_argument('variant', nargs='?', default=DEFAULT,
+                        choices=sorted(VARIANTS))
+    parser.add_argument('--db', default=DEFAULT_PATH,
+                        help='score database (default: %(default)s)')
+    parser.add_argument('-n', '--top', type=int, default=10)
+    parser.add_argument('--levels', action='store_true',
+                        help='show per-level stats as well')
+    args = parser.parse_args(argv)
+
+    store = ScoreStore(args.db)
+    try:
+        rows = store.leaderboard(args.variant, args.top)
+        if not rows:
+            print('no scores for %s yet' % args.variant)
+        for rank, (score, level, result, at) in enumerate(rows, 1):
+            print('%3d %8d  level %-3d %-7s %s'
+                  % (rank, score, level, result,
+                     time.strftime('%Y-%m-%d %H:%M', time.localtime(at))))
+        if args.levels:
+            print('\nlevel  plays  cleared  mean ticks   hits  lives  points')
+            for level, plays, ticks, hits, lives, points, cleared in \
+                    store.level_stats(args.variant):
+                print('%5d %6d %8d %11.0f %6d %6d %7d'
+                      % (level, plays, cleared, ticks, hits, lives, points))
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
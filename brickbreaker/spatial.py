@@ -0,0 +1,80 @@
+import math
+
+
+def overlaps(a, b):
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+class UniformGrid(object):
+    # Buckets keys by the square cells their bounds touch. query() only looks
+    # at the cells under the query box and returns keys in insertion order,
+    # so "first brick hit" rules behave the same as a linear scan.
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.bounds = {}
+        self.order = {}
+        self.counter = 0
+
+    def cell_range(self, bounds):
+        size = self.cell_size
+        return (int(math.floor(bounds[0] / size)),
+                int(math.floor(bounds[1] / size)),
+                int(math.floor(bounds[2] / size)),
+                int(math.floor(bounds[3] / size)))
+
+    def insert(self, key, bounds):
+        if key in self.bounds:
+            self.remove(key)
+        bounds = tuple(bounds)
+        self.bounds[key] = bounds
+        self.order[key] = self.counter
+        self.counter += 1
+        x0, y0, x1, y1 = self.cell_range(bounds)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(key)
+
+    def remove(self, key):
+        bounds = self.bounds.pop(key, None)
+        if bounds is None:
+            return
+        del self.order[key]
+        x0, y0, x1, y1 = self.cell_range(bounds)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def move(self, key, bounds):
+        order = self.order.get(key)
+        self.insert(key, bounds)
+        if order is not None:
+            self.order[key] = order
+
+    def clear(self):
+        self.cells.clear()
+        self.bounds.clear()
+        self.order.clear()
+
+    def query(self, bounds):
+        x0, y0, x1, y1 = self.cell_range(bounds)
+        found = set()
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        hits = [key for key in found if overlaps(self.bounds[key], bounds)]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def __contains__(self, key):
+        return key in self.bounds
+
+    def __len__(self):
+        return len(self.bounds)
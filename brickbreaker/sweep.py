@@ -0,0 +1,44 @@
+INF = float('inf')
+
+
+def axis_times(lo, hi, target_lo, target_hi, v):
+    # Entry and exit time of [lo, hi] moving at v against [target_lo, target_hi]
+    if v > 0:
+        return (target_lo - hi) / v, (target_hi - lo) / v
+    if v < 0:
+        return (target_hi - lo) / v, (target_lo - hi) / v
+    if hi < target_lo or lo > target_hi:
+        return INF, -INF
+    return -INF, INF
+
+
+def sweep(box, vx, vy, target):
+    # First contact of box moving by (vx, vy) with a static target box, as
+    # (t, axis) with t in [0, 1] of the move and axis 0 for a hit on a left
+    # or right side, 1 for top or bottom. None if they don't meet, or if
+    # they already overlap at t = 0.
+    x_entry, x_exit = axis_times(box[0], box[2], target[0], target[2], vx)
+    y_entry, y_exit = axis_times(box[1], box[3], target[1], target[3], vy)
+    entry = max(x_entry, y_entry)
+    if entry > min(x_exit, y_exit) or entry < 0 or entry > 1:
+        return None
+    return entry, 0 if x_entry > y_entry else 1
+
+
+def sweep_walls(box, vx, vy, width):
+    # First contact with the left, right or top wall, like sweep()
+    hits = []
+    if vx < 0:
+        hits.append((max(-box[0] / vx, 0), 0))
+    elif vx > 0:
+        hits.append((max((width - box[2]) / vx, 0), 0))
+    if vy < 0:
+        hits.append((max(-box[1] / vy, 0), 1))
+    hits = [hit for hit in hits if hit[0] <= 1]
+    return min(hits) if hits else None
+
+
+def swept_bounds(box, vx, vy):
+    # Box covering the whole move, for broad-phase queries
+    return [min(box[0], box[0] + vx), min(box[1], box[1] + vy),
+            max(box[2], box[2] + vx), max(box[3], box[3] + vy)]
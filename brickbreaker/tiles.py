@@ -0,0 +1,79 @@
+import math
+
+
+class TiledBrickRenderer(object):
+    # Paints the brick field into a single PhotoImage shown by one canvas
+    # item, so the number of canvas items doesn't grow with the level. The
+    # image is split into square tiles; a hit only repaints the tiles under
+    # that brick, and only when draw() is called.
+    def __init__(self, canvas, world, tile=32, bg='#D6D1F5', outline='black',
+                 image=None):
+        self.canvas = canvas
+        self.world = world
+        self.tile = tile
+        self.bg = bg
+        self.outline = outline
+        self.width = int(math.ceil(world.width))
+        self.height = int(math.ceil(world.height))
+        if image is None:
+            import tkinter
+
+            image = tkinter.PhotoImage(master=canvas, width=self.width,
+                                       height=self.height)
+        self.image = image
+        self.item = canvas.create_image(0, 0, image=image, anchor='nw')
+        canvas.tag_lower(self.item)
+        self.cols = int(math.ceil(self.width / tile))
+        self.rows = int(math.ceil(self.height / tile))
+        self.dirty = set()
+        self.repaints = 0
+        self.invalidate()
+        world.listeners.append(self.on_event)
+
+    def on_event(self, event):
+        if event[0] == 'hit':
+            self.invalidate(self.world.bricks.get_position(event[1]))
+        elif event[0] == 'level':
+            self.invalidate()
+
+    def invalidate(self, bounds=None):
+        if bounds is None:
+            self.dirty.update((col, row) for col in range(self.cols)
+                              for row in range(self.rows))
+            return
+        tile = self.tile
+        for col in range(max(int(bounds[0] // tile), 0),
+                         min(int(bounds[2] // tile), self.cols - 1) + 1):
+            for row in range(max(int(bounds[1] // tile), 0),
+                             min(int(bounds[3] // tile), self.rows - 1) + 1):
+                self.dirty.add((col, row))
+
+    def draw(self):
+        for col, row in self.dirty:
+            self.paint_tile(col, row)
+        self.repaints += len(self.dirty)
+        self.dirty = set()
+
+    def paint_tile(self, col, row):
+        tile = self.tile
+        x0, y0 = col * tile, row * tile
+        x1 = min(x0 + tile, self.width)
+        y1 = min(y0 + tile, self.height)
+        put = self.image.put
+        put(self.bg, to=(x0, y0, x1, y1))
+        bricks = self.world.bricks
+        for index in bricks.overlapping((x0, y0, x1, y1)):
+            b = bricks.get_position(index)
+            color = self.world.brick_color(index, bricks.hits(index))
+            # Clip the brick and its one-pixel outline to this tile
+            bx0, by0 = int(round(b[0])), int(round(b[1]))
+            bx1, by1 = int(round(b[2])) + 1, int(round(b[3])) + 1
+            cx0, cy0 = max(bx0, x0), max(by0, y0)
+            cx1, cy1 = min(bx1, x1), min(by1, y1)
+            if cx0 >= cx1 or cy0 >= cy1:
+                continue
+            put(self.outline, to=(cx0, cy0, cx1, cy1))
+            ix0, iy0 = max(bx0 + 1, x0), max(by0 + 1, y0)
+            ix1, iy1 = min(bx1 - 1, x1), min(by1 - 1, y1)
+            if ix0 < ix1 and iy0 < iy1:
+                put(color, to=(ix0, iy0, ix1, iy1))
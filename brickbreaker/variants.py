@@ -0,0 +1,112 @@
+from . import levels
+from .view import STYLE
+from .world import BrickGrid, BrickList, Rules, World
+
+# The scripts moved the paddle paddle_step pixels per <Left>/<Right> event,
+# so a held key went as fast as the OS repeats keys: about 30 times a second
+KEY_REPEAT = 30
+
+# Brick stores by name: a list of Brick objects, the same with a grid index
+# (the default), or one NumPy array (brickfield.BrickArray)
+BRICKS = ('grid', 'list', 'array')
+
+
+def make_bricks(kind='grid'):
+    # NumPy is only imported when the array store is asked for
+    if kind == 'array':
+        from .brickfield import BrickArray
+        return BrickArray()
+    return {'grid': BrickGrid, 'list': BrickList}[kind]()
+
+
+def record_layout(layout):
+    # World layout from one of the levels.LAYOUTS record functions, with
+    # each brick's PALETTE colour
+    def add_bricks(world):
+        for x, y, width, height, hits, color in layout(world.random,
+                                                       world.level):
+            world.add_brick(x, y, hits, width, height, levels.PALETTE[color])
+    return add_bricks
+
+
+class Variant(object):
+    # One of the original scripts as a preset: the Rules and layout its
+    # World is built from, plus how it was drawn and controlled.
+    # paddle_speed is how fast a held key moves the paddle, in pixels per
+    # second; by default as fast as the script's key repeat moved it.
+    def __init__(self, name, script, title, layout, width=610, height=400,
+                 rules=None, physics_hz=20, paddle_step=10, paddle_speed=None,
+                 style=None):
+        self.name = name
+        self.script = script
+        self.title = title
+        self.layout = record_layout(layout)
+        self.width = width
+        self.height = height
+        self.rules = rules or {}
+        self.physics_hz = physics_hz
+        self.paddle_step = paddle_step
+        self.paddle_speed = paddle_speed or paddle_step * KEY_REPEAT
+        self.style = dict(STYLE, **(style or {}))
+
+    def make_rules(self, **overrides):
+        return Rules(**dict(self.rules, **overrides))
+
+    def world(self, seed=None, bricks=None, rules=None, level=1, layout=None):
+        # layout replaces the variant's own, e.g. a levels.LevelFile's
+        return World(self.width, self.height, rules or self.make_rules(),
+                     layout or self.layout, seed, bricks, level)
+
+
+# The black-background scripts all shared this look
+DARK = {
+    'bg': 'black',
+    'paddle': 'orange',
+    'text': 'white',
+    'font': 'Arial',
+    'hud': 'Score: {score}',
+    'hud_at': (50, 10),
+    'hud_size': 14,
+    'message_size': 24,
+    'over': 'GAME OVER',
+}
+
+# The ball starts clear of the paddle: the scripts that spawned it
+# overlapping bounced it straight down on the first tick.
+VARIANTS = {variant.name: variant for variant in [
+    Variant('brickbreakergame', 'BrickBreakerGame.py', 'Break those Bricks!',
+            levels.classic),
+    Variant('gameclass', 'GameClass.py', 'Break those Bricks!',
+            levels.classic,
+            rules=dict(ball_speed=6, paddle_width=100, paddle_height=20,
+                       ball_y=305, retry=False),
+            style=dict(paddle='green', ball='blue',
+                       over='You Lose! Game Over!')),
+    Variant('brickclass', 'Brick Class.py', 'Brick Breaker',
+            levels.brick_class, 500, 400,
+            rules=dict(lives=0, paddle_width=100, paddle_y=350, ball_y=334,
+                       paddle_speedup=0.1, levels=True, autostart=True),
+            paddle_step=20, style=DARK),
+    Variant('paddleclass', 'PaddleClass.py', 'Brick Breaker',
+            levels.paddle_class, 500, 400,
+            rules=dict(lives=0, paddle_width=100, paddle_y=350, ball_y=334,
+                       paddle_speedup=0.1, autostart=True),
+            paddle_step=20, style=dict(DARK, won='YOU WIN!')),
+    # Ran at after(10), so its speeds are scaled to pixels per 50 ms
+    Variant('gameobjeckclass', 'GameObjeckClass.py', 'Brick Breaker Game',
+            levels.game_objeck_class, 500, 500,
+            rules=dict(lives=0, ball_speed=25, ball_radius=15,
+                       paddle_width=100, paddle_height=15, paddle_y=480,
+                       ball_y=250, level_speedup=5, levels=True,
+                       autostart=True),
+            physics_hz=100, paddle_step=20,
+            style=dict(DARK, paddle='#FF6347', over='Game Over')),
+    Variant('ballclass', 'BallClass.py', 'Brick Breaker',
+            levels.ball_class, 500, 500,
+            rules=dict(lives=0, paddle_width=100, paddle_y=450, ball_y=300,
+                       autostart=True),
+            paddle_step=20, style=dict(DARK, over='Game Over',
+                                       won='You Win!')),
+]}
+
+DEFAULT = 'brickbreakergame'
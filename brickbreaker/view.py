@@ -0,0 +1,160 @@
+from .render import RenderLayer
+from .viewport import Viewport
+
+# How BrickBreakerGame.py looked; variants override single entries.
+STYLE = {
+    'bg': '#D6D1F5',
+    'paddle': '#FFB643',
+    'ball': 'white',
+    'text': 'black',
+    'font': 'Forte',
+    'hud': 'Lives: {lives}',
+    'hud_at': (50, 20),
+    'hud_size': 15,
+    'message_size': 40,
+    'ready': 'Press Space to start',
+    'won': 'You win! You the Breaker of Bricks.',
+    'over': 'Game Over! Press Space to Retry.',
+}
+
+
+class CanvasView(object):
+    # Mirrors a World onto a tk.Canvas through a RenderLayer. The world never
+    # reads from it; bricks are only touched when the world reports a hit.
+    # A brick renderer such as tiles.TiledBrickRenderer can take over the
+    # bricks instead of one rectangle each. Everything is drawn through a
+    # Viewport, which scales world units to the window. effects is an
+    # optional effects.Effects whose particles are drawn over the field.
+    # The HUD and message are redrawn every hud_every frames, which a
+    # governor.Governor raises when frames run long. registry is the
+    # registry.ItemRegistry the items come from, e.g. one with a limit.
+    def __init__(self, canvas, world, bricks=None, style=None, viewport=None,
+                 effects=None, registry=None):
+        self.layer = RenderLayer(canvas, registry)
+        self.world = world
+        self.bricks = bricks
+        self.effects = effects
+        self.style = dict(STYLE, **(style or {}))
+        self.viewport = viewport or Viewport(world.width, world.height)
+        self.version = self.viewport.version
+        self.hud_every = 1
+        self.frames = 0
+        self.particle_keys = None
+        self.particles_shown = None
+        if bricks is None:
+            self.sync_bricks()
+            world.listeners.append(self.on_event)
+
+    def on_event(self, event):
+        if event[0] == 'hit':
+            self.draw_brick(event[1], event[2])
+        elif event[0] == 'level':
+            self.sync_bricks()
+
+    def sync_bricks(self):
+        layer = self.layer
+        for key in [key for key in set(layer.items) | set(layer.pending)
+                    if key[0] == 'brick']:
+            layer.delete(key)
+        bricks = self.world.bricks
+        for index in bricks:
+            self.draw_brick(index, bricks.hits(index))
+
+    def draw_brick(self, index, hits):
+        key = ('brick', index)
+        if hits <= 0:
+            self.layer.delete(key)
+        else:
+            color = self.world.brick_color(index, hits)
+            bounds = self.world.bricks.get_position(index)
+            self.layer.rect(key, self.viewport.bounds(bounds), fill=color,
+                            tags='brick')
+
+    def draw(self, alpha=1):
+        # alpha is how far we are between the last two physics steps; only
+        # a moving ball is interpolated so the paddle follows input at once
+        world = self.world
+        layer = self.layer
+        style = self.style
+        viewport = self.viewport
+        if self.bricks is not None:
+            self.bricks.draw()
+        elif self.version != viewport.version:
+            self.version = viewport.version
+            self.sync_bricks()
+        layer.rect(('paddle',), viewport.bounds(world.paddle.get_position()),
+                   fill=style['paddle'])
+        if world.state == 'running':
+            ball_coords = world.ball.interpolate(alpha)
+        else:
+            ball_coords = world.ball.get_position()
+        layer.oval(('ball',), viewport.bounds(ball_coords), fill=style['ball'])
+        if world.pool is not None:
+            self.draw_pool(alpha if world.state == 'running' else 1)
+        if self.effects is not None:
+            self.draw_particles()
+        if self.frames % self.hud_every == 0:
+            self.draw_hud()
+        self.frames += 1
+        layer.flush()
+
+    def draw_hud(self):
+        world = self.world
+        layer = self.layer
+        style = self.style
+        viewport = self.viewport
+        hud = style['hud'].format(lives=max(world.lives, 0), score=world.score,
+                                  level=world.level)
+        x, y = viewport.point(*style['hud_at'])
+        layer.text(('hud',), x, y, text=hud, fill=style['text'],
+                   font=(style['font'], viewport.size(style['hud_size'])))
+        x, y = viewport.point(world.width / 2, world.height / 2)
+        layer.text(('message',), x, y, text=self.status(), fill=style['text'],
+                   font=(style['font'], viewport.size(style['message_size'])))
+
+    def draw_pool(self, alpha):
+        # One oval per pool slot, hidden rather than deleted when the slot is
+        # free so spawning never creates items once the pool has warmed up
+        pool = self.world.pool
+        layer = self.layer
+        alive = pool.alive
+        bounds = pool.bounds(range(pool.used), alpha).tolist()
+        for slot in range(pool.used):
+            key = ('pool', slot)
+            if alive[slot]:
+                layer.oval(key, self.viewport.bounds(bounds[slot]),
+                           fill=self.style['ball'], state='normal')
+            elif key in layer:
+                layer.config(key, state='hidden')
+
+    def draw_particles(self):
+        # One small rectangle per live slot below the limit. A slot is only
+        # touched again once it dies, to hide it, so dead slots and those
+        # above a lowered limit cost nothing frame after frame.
+        self.effects.advance()
+        particles = self.effects.particles
+        layer = self.layer
+        viewport = self.viewport
+        keys = self.particle_keys
+        if keys is None:
+            keys = self.particle_keys = [('particle', slot) for slot
+                                         in range(particles.budget)]
+        live = particles.live()
+        if self.particles_shown is not None:
+            for slot in (self.particles_shown & ~live).nonzero()[0].tolist():
+                if keys[slot] in layer:
+                    layer.config(keys[slot], state='hidden')
+        self.particles_shown = live
+        slots = live.nonzero()[0]
+        palette = particles.palette
+        for slot, bounds, color in zip(slots.tolist(),
+                                       particles.bounds(slots).tolist(),
+                                       particles.color[slots].tolist()):
+            layer.rect(keys[slot], viewport.bounds(bounds),
+                       fill=palette[color], outline='', state='normal')
+
+    def status(self):
+        state = self.world.state
+        if state in ('ready', 'won', 'over'):
+            return self.style[state]
+        return ''
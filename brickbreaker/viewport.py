@@ -0,0 +1,48 @@
+class Viewport(object):
+    # Maps world units to canvas pixels. The world keeps its own fixed size
+    # (610x400 and so on) and is scaled to fit the window, keeping its
+    # aspect ratio and centred. The window size is cached and only changes
+    # on <Configure>, so drawing never asks Tk for geometry.
+    def __init__(self, width, height, widget=None):
+        self.width = width
+        self.height = height
+        self.window = (width, height)
+        self.scale = 1.0
+        self.x = 0.0
+        self.y = 0.0
+        self.version = 0
+        if widget is not None:
+            widget.bind('<Configure>', self.configure, add='+')
+
+    def configure(self, event):
+        if (event.width, event.height) != self.window:
+            self.resize(event.width, event.height)
+
+    def resize(self, width, height):
+        self.window = (width, height)
+        self.scale = min(width / self.width, height / self.height)
+        self.x = (width - self.width * self.scale) / 2
+        self.y = (height - self.height * self.scale) / 2
+        # Anything drawn once and left alone (bricks) redraws on a change
+        self.version += 1
+
+    @property
+    def identity(self):
+        return self.scale == 1 and self.x == 0 and self.y == 0
+
+    def bounds(self, coords):
+        if self.identity:
+            return coords
+        scale = self.scale
+        return [self.x + coords[0] * scale, self.y + coords[1] * scale,
+                self.x + coords[2] * scale, self.y + coords[3] * scale]
+
+    def point(self, x, y):
+        return self.x + x * self.scale, self.y + y * self.scale
+
+    def size(self, value):
+        # Lengths such as font sizes, at least 1
+        return max(1, int(round(value * self.scale)))
+
+    def to_world(self, x, y):
+        return (x - self.x) / self.scale, (y - self.y) / self.scale
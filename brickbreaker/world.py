@@ -0,0 +1,430 @@
+import random
+
+from .spatial import UniformGrid, overlaps
+from .sweep import sweep, sweep_walls, swept_bounds
+
+# Ball speeds are in pixels per tick of the original after(50) loops.
+TICK = 0.05
+
+
+class Body(object):
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.prev = (x, y)
+
+    def get_position(self):
+        return [self.x - self.width / 2, self.y - self.height / 2,
+                self.x + self.width / 2, self.y + self.height / 2]
+
+    def save(self):
+        self.prev = (self.x, self.y)
+
+    def interpolate(self, alpha):
+        # Bounds between the last saved position and the current one
+        x = self.prev[0] + (self.x - self.prev[0]) * alpha
+        y = self.prev[1] + (self.y - self.prev[1]) * alpha
+        return [x - self.width / 2, y - self.height / 2,
+                x + self.width / 2, y + self.height / 2]
+
+    def move(self, x, y):
+        self.x += x
+        self.y += y
+
+
+class Ball(Body):
+    def __init__(self, x, y, radius=10, speed=5, direction=None):
+        super().__init__(x, y, radius * 2, radius * 2)
+        self.radius = radius
+        self.speed = speed
+        self.direction = direction or [1, -1]
+
+    def update(self, width, height, scale=1):
+        coords = self.get_position()
+        if coords[0] <= 0 or coords[2] >= width:
+            self.direction[0] *= -1
+        if coords[1] <= 0:
+            self.direction[1] *= -1
+        x = self.direction[0] * self.speed * scale
+        y = self.direction[1] * self.speed * scale
+        self.move(x, y)
+
+    def collide(self, objects):
+        # objects are the bounds of everything the ball overlaps
+        x = self.x
+        if len(objects) > 1:
+            self.direction[1] *= -1
+        elif len(objects) == 1:
+            coords = objects[0]
+            if x > coords[2]:
+                self.direction[0] = 1
+            elif x < coords[0]:
+                self.direction[0] = -1
+            else:
+                self.direction[1] *= -1
+
+
+class Paddle(Body):
+    def __init__(self, x, y, width=80, height=10):
+        super().__init__(x, y, width, height)
+        self.ball = None
+
+    def move(self, offset, limit):
+        coords = self.get_position()
+        if coords[0] + offset >= 0 and coords[2] + offset <= limit:
+            super().move(offset, 0)
+            if self.ball is not None:
+                self.ball.move(offset, 0)
+
+
+class Brick(Body):
+    COLORS = {1: '#4535AA', 2: '#ED639E', 3: '#8FE1A2'}
+
+    def __init__(self, x, y, hits, width=75, height=20):
+        super().__init__(x, y, width, height)
+        self.hits = hits
+
+    def hit(self):
+        self.hits -= 1
+        return self.hits
+
+
+class BrickList(object):
+    # Bricks are addressed by the index returned from add(), which stays
+    # valid after the brick is destroyed.
+    def __init__(self):
+        self.bricks = []
+        self.count = 0
+
+    def add(self, x, y, hits, width=75, height=20):
+        # A brick added with no hits is dead from the start, as in
+        # BrickArray.extend
+        self.bricks.append(Brick(x, y, hits, width, height))
+        if hits > 0:
+            self.count += 1
+        return len(self.bricks) - 1
+
+    def clear(self):
+        self.bricks = []
+        self.count = 0
+
+    def overlapping(self, bounds):
+        return [i for i, brick in enumerate(self.bricks)
+                if brick.hits > 0 and overlaps(brick.get_position(), bounds)]
+
+    def get_position(self, index):
+        return self.bricks[index].get_position()
+
+    def hits(self, index):
+        return self.bricks[index].hits
+
+    def hit(self, index):
+        hits = self.bricks[index].hit()
+        if hits == 0:
+            self.count -= 1
+        return hits
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return (i for i, brick in enumerate(self.bricks) if brick.hits > 0)
+
+
+class BrickGrid(BrickList):
+    # BrickList with a UniformGrid over the live bricks, so a collision check
+    # only visits the cells under the ball.
+    def __init__(self, cell_size=64):
+        super().__init__()
+        self.grid = UniformGrid(cell_size)
+
+    def add(self, x, y, hits, width=75, height=20):
+        index = super().add(x, y, hits, width, height)
+        if hits > 0:
+            self.grid.insert(index, self.bricks[index].get_position())
+        return index
+
+    def clear(self):
+        super().clear()
+        self.grid.clear()
+
+    def overlapping(self, bounds):
+        return self.grid.query(bounds)
+
+    def hit(self, index):
+        hits = super().hit(index)
+        if hits == 0:
+            self.grid.remove(index)
+        return hits
+
+
+class Rules(object):
+    lives = 3
+    ball_speed = 5
+    ball_radius = 10
+    paddle_width = 80
+    paddle_height = 10
+    paddle_y = 326
+    ball_y = 310
+    paddle_speedup = 0     # added to the ball speed on every paddle hit
+    level_speedup = 0      # added to the ball speed on every new level
+    levels = False         # clear the field to go to the next level
+    swept = False          # time-of-impact collisions instead of overlap
+    respawn_delay = 1.0    # seconds, as after(1000, self.setup_game)
+    points = 10
+    autostart = False      # launch every ball at once, no 'ready' state
+    retry = True           # space restarts the game after game over
+    multiball = 0          # extra balls launched along with every ball
+    powerup = 0            # every powerup-th brick broken launches 2 more
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            if not hasattr(Rules, key):
+                raise TypeError('unknown rule %r' % key)
+            # Flags take true or false, everything else a number
+            flag = isinstance(getattr(Rules, key), bool)
+            if (flag != isinstance(value, bool) or
+                    not isinstance(value, (int, float))):
+                raise TypeError('rule %r must be %s, not %r'
+                                % (key, 'true or false' if flag
+                                   else 'a number', value))
+            setattr(self, key, value)
+
+
+def classic_layout(world):
+    # The three rows from BrickBreakerGame.py
+    for x in range(5, int(world.width) - 5, 75):
+        world.add_brick(x + 37.5, 50, 3)
+        world.add_brick(x + 37.5, 70, 2)
+        world.add_brick(x + 37.5, 90, 1)
+
+
+class World(object):
+    # Game state without a canvas: 'ready' waits for start(), 'running'
+    # steps the ball, 'dead' counts down to the next ball, 'won' and 'over'
+    # are final.
+    def __init__(self, width=610, height=400, rules=None, layout=classic_layout,
+                 seed=None, bricks=None, level=1):
+        self.width = width
+        self.height = height
+        self.rules = rules or Rules()
+        self.layout = layout
+        self.random = random.Random(seed)
+        self.bricks = bricks if bricks is not None else BrickGrid()
+        # Colours a layout gave its bricks, by index; others go by hits
+        self.colors = {}
+        self.lives = self.rules.lives
+        self.score = 0
+        self.level = level
+        self.ticks = 0
+        self.broken = 0
+        self.state = 'ready'
+        self.wait = 0
+        self.events = []
+        self.listeners = []
+
+        self.ball = None
+        self.pool = None
+        self.paddle = Paddle(width / 2, self.rules.paddle_y,
+                             self.rules.paddle_width, self.rules.paddle_height)
+        self.layout(self)
+        self.setup_game()
+
+    def add_brick(self, x, y, hits, width=75, height=20, color=None):
+        index = self.bricks.add(x, y, hits, width, height)
+        if color is not None:
+            self.colors[index] = color
+        return index
+
+    def brick_color(self, index, hits):
+        return self.colors.get(index) or Brick.COLORS.get(hits,
+                                                          Brick.COLORS[3])
+
+    def emit(self, *event):
+        # events holds what happened during the current step; listeners also
+        # see every event as it happens, however many steps run per frame
+        self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def add_ball(self):
+        self.ball = Ball(self.paddle.x, self.rules.ball_y,
+                         self.rules.ball_radius,
+                         self.rules.ball_speed + self.speed_bonus(),
+                         [self.random.choice([-1, 1]), -1])
+        if not self.rules.autostart:
+            self.paddle.ball = self.ball
+
+    def multiball(self, count, spread=20):
+        # Extra balls from the current ball's position, kept in a BallPool.
+        # They break bricks like the main ball but cost no lives when lost.
+        from .balls import BallPool
+
+        if self.pool is None:
+            self.pool = BallPool(max(count, 16))
+        for _ in range(count):
+            self.pool.spawn(self.ball.x + self.random.uniform(-spread, spread),
+                            self.ball.y,
+                            [self.random.choice([-1, 1]), -1],
+                            self.ball.speed, self.ball.radius)
+        self.emit('multiball', count)
+
+    def speed_bonus(self):
+        return (self.level - 1) * self.rules.level_speedup
+
+    def setup_game(self):
+        if self.pool is not None:
+            self.pool.clear()
+        self.add_ball()
+        self.state = 'running' if self.rules.autostart else 'ready'
+        if self.state == 'running':
+            self.launch()
+
+    def start(self):
+        if self.state == 'ready':
+            self.paddle.ball = None
+            self.state = 'running'
+            self.launch()
+
+    def launch(self):
+        # The ball leaves with rules.multiball more alongside it
+        if self.rules.multiball:
+            self.multiball(self.rules.multiball)
+
+    def power_up(self):
+        # Every rules.powerup-th brick broken launches two more balls
+        broken = sum(1 for event in self.events
+                     if event[0] == 'hit' and event[2] == 0)
+        for _ in range(broken):
+            self.broken += 1
+            if self.broken % self.rules.powerup == 0:
+                self.multiball(2)
+
+    def retry(self):
+        if self.state == 'over' and self.rules.retry:
+            self.lives = self.rules.lives
+            self.score = 0
+            self.setup_game()
+            self.emit('retry')
+
+    def move_paddle(self, offset):
+        self.paddle.move(offset, self.width)
+
+    def step(self, dt=TICK):
+        self.events = []
+        self.ticks += 1
+        self.ball.save()
+        self.paddle.save()
+        if self.state == 'dead':
+            self.wait -= dt
+            if self.wait <= 0:
+                self.setup_game()
+            return
+        if self.state != 'running':
+            return
+
+        if self.rules.swept:
+            self.sweep_ball(dt / TICK)
+        else:
+            self.check_collisions()
+        if self.pool is not None:
+            self.pool.step(self, dt / TICK)
+        if self.rules.powerup:
+            self.power_up()
+        if len(self.bricks) == 0:
+            if self.rules.levels:
+                self.next_level()
+            else:
+                self.state = 'won'
+                self.emit('won')
+        elif self.ball.get_position()[3] >= self.height:
+            self.lives -= 1
+            self.emit('lost', self.lives)
+            if self.lives < 0:
+                self.state = 'over'
+                self.emit('over')
+            else:
+                self.state = 'dead'
+                self.wait = self.rules.respawn_delay
+        elif not self.rules.swept:
+            self.ball.update(self.width, self.height, dt / TICK)
+
+    def check_collisions(self):
+        ball_coords = self.ball.get_position()
+        paddle_coords = self.paddle.get_position()
+        objects = []
+        # Only a falling ball bounces off the paddle, as in sweep_ball: one
+        # that has sunk into it would be flipped back down on the next tick
+        # and carried along inside it
+        if (self.ball.direction[1] > 0 and
+                overlaps(paddle_coords, ball_coords)):
+            objects.append(paddle_coords)
+            self.ball.speed += self.rules.paddle_speedup
+        hit = self.bricks.overlapping(ball_coords)
+        objects.extend(self.bricks.get_position(i) for i in hit)
+        self.ball.collide(objects)
+        for index in hit:
+            hits = self.bricks.hit(index)
+            self.score += self.rules.points
+            self.emit('hit', index, hits)
+
+    def sweep_ball(self, scale, bounces=8):
+        # Moves the ball its full distance for this step, stopping at each
+        # wall, paddle or brick it reaches on the way and reflecting off the
+        # side it touched, so nothing is skipped however fast it goes.
+        ball = self.ball
+        rules = self.rules
+        # The paddle can be moved into the ball between steps
+        if (ball.direction[1] > 0 and
+                overlaps(self.paddle.get_position(), ball.get_position())):
+            ball.direction[1] = -1
+            ball.speed += rules.paddle_speedup
+
+        remaining = 1.0
+        for _ in range(bounces):
+            box = ball.get_position()
+            vx = ball.direction[0] * ball.speed * scale * remaining
+            vy = ball.direction[1] * ball.speed * scale * remaining
+            contacts = []
+            hit = sweep_walls(box, vx, vy, self.width)
+            if hit:
+                contacts.append((hit[0], hit[1], None))
+            hit = sweep(box, vx, vy, self.paddle.get_position())
+            if hit:
+                contacts.append((hit[0], hit[1], 'paddle'))
+            for index in self.bricks.overlapping(swept_bounds(box, vx, vy)):
+                hit = sweep(box, vx, vy, self.bricks.get_position(index))
+                if hit:
+                    contacts.append((hit[0], hit[1], index))
+            if not contacts:
+                ball.move(vx, vy)
+                return
+
+            t = min(contact[0] for contact in contacts)
+            ball.move(vx * t, vy * t)
+            axes = set()
+            for when, axis, what in contacts:
+                if when > t + 1e-9:
+                    continue
+                axes.add(axis)
+                if what == 'paddle':
+                    ball.speed += rules.paddle_speedup
+                elif what is not None:
+                    hits = self.bricks.hit(index=what)
+                    self.score += rules.points
+                    self.emit('hit', what, hits)
+            for axis in axes:
+                ball.direction[axis] *= -1
+            remaining *= 1 - t
+            if remaining <= 0:
+                return
+
+    def next_level(self):
+        self.level += 1
+        self.bricks.clear()
+        self.colors.clear()
+        self.layout(self)
+        self.emit('level', self.level)
+        self.setup_game()
@@ -0,0 +1,14 @@
+import pytest
+
+from brickbreaker.batch import play
+from brickbreaker.variants import VARIANTS
+
+
+@pytest.mark.parametrize('name', sorted(VARIANTS))
+@pytest.mark.parametrize('swept', [False, True])
+def test_predictor_never_misses(name, swept):
+    for seed in range(8):
+        game = play(name, seed, rules=dict(swept=swept), error=0,
+                    pilot='predict')
+        assert game['result'] == 'cleared', seed
+        assert game['lives_lost'] == 0, seed
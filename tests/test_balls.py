@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from brickbreaker.balls import BallPool
+from brickbreaker.brickfield import BrickArray
+from brickbreaker.world import BrickGrid, Rules, World
+
+
+@pytest.mark.parametrize('store', [BrickGrid, BrickArray])
+def test_pile_on_one_brick_scores_once(store):
+    # 50 balls overlapping one single-hit brick break it once
+    world = World(rules=Rules(paddle_width=600), bricks=store(),
+                  layout=lambda world: None, seed=0)
+    index = world.add_brick(300, 100, 1)
+    world.start()
+    pool = BallPool(64)
+    for _ in range(50):
+        pool.spawn(300, 100, [1, 1])
+    pool.apply_hits(world, np.full(50, index))
+    assert world.score == world.rules.points
+    assert world.bricks.hits(index) == 0
+    assert len(world.bricks) == 0
+
+
+@pytest.mark.parametrize('store', [BrickGrid, BrickArray])
+def test_hits_score_up_to_what_is_left(store):
+    world = World(bricks=store(), layout=lambda world: None, seed=0)
+    strong = world.add_brick(100, 100, 3)
+    weak = world.add_brick(300, 100, 1)
+    BallPool().apply_hits(world, np.array([strong, strong, weak, weak]))
+    assert world.score == 3 * world.rules.points
+    assert world.bricks.hits(strong) == 1
+
+
+def test_storm_launches_extra_balls_that_world_step_moves():
+    world = World(rules=Rules(multiball=3), seed=0)
+    assert world.pool is None
+    world.start()
+    assert len(world.pool) == 3
+    assert ('multiball', 3) in world.events
+    start = world.pool.y[:3].copy()
+    for _ in range(5):
+        world.step()
+    assert (world.pool.y[:3] < start).all()
+
+
+def test_powerup_launches_two_balls_when_a_brick_breaks():
+    world = World(rules=Rules(powerup=2), layout=lambda world: None, seed=0)
+    world.add_brick(50, 50, 1)
+    world.start()
+    ball = world.ball
+    world.add_brick(ball.x, ball.y - 10, 1)
+    world.step()
+    # One brick broken: not yet
+    assert world.pool is None
+    world.add_brick(ball.x, ball.y, 1)
+    world.step()
+    assert ('multiball', 2) in world.events
+    assert len(world.pool) == 2
+    assert world.state == 'running'
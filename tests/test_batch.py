@@ -0,0 +1,42 @@
+import pytest
+
+from brickbreaker.batch import main, play
+from brickbreaker.variants import VARIANTS
+
+
+def test_unknown_rule_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(['--rule', 'speed=9', '-n', '1', '-j', '0'])
+    assert exit.value.code == 2
+    assert "unknown rule 'speed'" in capsys.readouterr().err
+
+
+def test_rule_values_are_checked(capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(['--rule', 'lives=abc', '-n', '1', '-j', '0'])
+    assert exit.value.code == 2
+    assert "rule 'lives' must be a number" in capsys.readouterr().err
+
+
+def test_seeds_play_different_games():
+    # Not just the two mirror images the launch direction gives
+    for name in VARIANTS:
+        games = [play(name, seed, max_ticks=2000) for seed in range(10)]
+        outcomes = {(game['ticks'], game['score'], game['bricks'])
+                    for game in games}
+        assert len(outcomes) > 2, name
+
+
+def test_event_mode_plays_every_variant():
+    for name in VARIANTS:
+        for seed in range(3):
+            game = play(name, seed, pilot='predict', mode='events')
+            assert game['result'] == 'cleared', (name, seed)
+            assert game['lives_lost'] == 0, (name, seed)
+
+
+def test_event_mode_has_no_extra_balls(capsys):
+    with pytest.raises(SystemExit):
+        main(['--mode', 'events', '--rule', 'multiball=2', '-n', '1',
+              '-j', '0'])
+    assert 'without extra balls' in capsys.readouterr().err
@@ -0,0 +1,32 @@
+import pytest
+
+from brickbreaker import bench
+from brickbreaker.variants import VARIANTS
+
+BASE = {'reference': 1000.0,
+        'v': {'ticks_per_sec': 100.0, 'calls_per_tick': 2.0, 'items': 30}}
+
+
+def result(ticks_per_sec=100.0, calls_per_tick=2.0, items=30):
+    return {'v': {'ticks_per_sec': ticks_per_sec,
+                  'calls_per_tick': calls_per_tick, 'items': items}}
+
+
+def test_speed_is_not_gated_by_default():
+    assert bench.compare(result(ticks_per_sec=1.0), BASE) == []
+
+
+def test_speed_is_relative_to_the_reference():
+    # Half as fast on a machine half as fast is no regression
+    assert bench.compare(result(ticks_per_sec=50.0), BASE, 0.2, 500.0) == []
+    assert bench.compare(result(ticks_per_sec=30.0), BASE, 0.2, 500.0)
+
+
+def test_calls_and_items_are_gated():
+    assert bench.compare(result(calls_per_tick=2.5), BASE)
+    assert bench.compare(result(items=31), BASE)
+
+
+@pytest.mark.parametrize('name', sorted(VARIANTS))
+def test_variant_matches_the_baseline(name):
+    assert bench.main(['--only', name]) == 0
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from brickbreaker.batch import play_many
+from brickbreaker.brickfield import BrickArray
+
+
+def test_count_follows_hits():
+    rng = np.random.default_rng(0)
+    field = BrickArray.from_arrays(rng.uniform(0, 600, (500, 4)),
+                                   rng.integers(0, 4, 500))
+    for _ in range(2000):
+        indexes = rng.integers(0, 500, rng.integers(1, 6))
+        if rng.random() < 0.5:
+            field.hit_many(indexes)
+        else:
+            field.hit(int(indexes[0]))
+        hits = field.rows[:, 4]
+        assert field.count == np.count_nonzero(hits > 0)
+        assert hits.min() >= 0
+
+
+def test_repeated_hits_in_one_call():
+    field = BrickArray.from_arrays([[0, 0, 10, 10], [20, 0, 30, 10]], [2, 1])
+    assert field.hit_many([0, 0, 0, 1]).tolist() == [0, 0, 0, 0]
+    assert len(field) == 0
+    assert field.hit(0) == 0
+    assert len(field) == 0
+
+
+@pytest.mark.parametrize('variant', ['brickbreakergame', 'ballclass'])
+def test_stores_play_the_same_games(variant):
+    games = {bricks: play_many(variant, range(5), pilot='predict',
+                               bricks=bricks)
+             for bricks in ('grid', 'list', 'array')}
+    assert games['grid'] == games['list'] == games['array']
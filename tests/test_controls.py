@@ -0,0 +1,76 @@
+from brickbreaker.autopilot import Autopilot
+from brickbreaker.controls import Controls
+from brickbreaker.fakecanvas import Event, FakeCanvas
+from brickbreaker.variants import KEY_REPEAT, VARIANTS
+from brickbreaker.world import TICK, World
+
+
+def hold(hz, seconds=0.25, key='Right', speed=200):
+    # Pixels a held key moves the paddle at a physics rate of hz
+    world = World(seed=0)
+    controls = Controls(FakeCanvas(), world, paddle_speed=speed)
+    world.paddle.x = 100
+    start = world.paddle.x
+    controls.key_press(Event(keysym=key))
+    for _ in range(int(round(seconds * hz))):
+        controls.step(1.0 / hz)
+    return world.paddle.x - start
+
+
+def test_held_key_speed_is_independent_of_the_physics_rate():
+    expected = 200 * 0.25
+    for hz in (20, 60, 400, 1000):
+        assert abs(hold(hz) - expected) <= 1, hz
+
+
+def test_held_key_keeps_up_with_each_variants_key_repeat():
+    # A held key in the scripts moved paddle_step per key repeat event
+    for name, variant in VARIANTS.items():
+        expected = variant.paddle_step * KEY_REPEAT * 0.25
+        moved = hold(variant.physics_hz, speed=variant.paddle_speed)
+        assert abs(moved - expected) <= 1, name
+
+
+def test_paddle_outruns_the_ball_sideways():
+    # Otherwise a ball crossing the field can't be caught
+    for name, variant in VARIANTS.items():
+        world = variant.world(seed=0)
+        ball_speed = world.ball.speed / TICK
+        assert variant.paddle_speed > ball_speed, name
+
+
+def chase(hz, seconds=0.25):
+    # Pixels an autopilot moves the paddle toward a ball far to its right
+    world = World(seed=0)
+    pilot = Autopilot(world, 200, error=0)
+    world.paddle.x = 100
+    world.ball.x = world.width
+    start = world.paddle.x
+    for _ in range(int(round(seconds * hz))):
+        pilot.drive(1.0 / hz)
+    return world.paddle.x - start
+
+
+def test_autopilot_moves_as_fast_as_a_held_key():
+    for hz in (20, 100):
+        assert abs(chase(hz) - hold(hz)) <= 1, hz
+
+
+def test_offsets_stay_whole_pixels():
+    world = World(seed=0)
+    controls = Controls(FakeCanvas(), world, paddle_speed=200)
+    controls.key_press(Event(keysym='Left'))
+    offsets = [controls.poll(1.0 / 60) for _ in range(30)]
+    assert all(isinstance(offset, int) for offset in offsets)
+    assert sum(offsets) == -100
+
+
+def test_two_keys_for_one_direction_move_at_one_keys_speed():
+    world = World(seed=0)
+    controls = Controls(FakeCanvas(), world, paddle_speed=200)
+    world.paddle.x = 300
+    controls.key_press(Event(keysym='Left'))
+    controls.key_press(Event(keysym='a'))
+    for _ in range(5):
+        controls.step(TICK)
+    assert world.paddle.x == 300 - 200 * 5 * TICK
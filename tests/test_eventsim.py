@@ -0,0 +1,31 @@
+from brickbreaker.autopilot import predict
+from brickbreaker.eventsim import EventSimulator
+from brickbreaker.variants import VARIANTS
+from brickbreaker.world import World
+
+
+def test_missed_ball_reaches_the_floor():
+    # A paddle parked in the corner misses every ball; each one must still
+    # be lost instead of stopping on the paddle line for good
+    result = EventSimulator(World(seed=1),
+                            controller=lambda world, ticks: 0).run(200000)
+    assert result['state'] == 'over'
+    assert result['lives'] == -1
+    assert result['events'] < 1000
+
+
+def test_every_variant_finishes():
+    for name, variant in VARIANTS.items():
+        result = EventSimulator(variant.world(1), controller=predict,
+                                paddle_speed=variant.paddle_speed).run(200000)
+        assert result['state'] in ('won', 'over'), name
+        assert result['events'] < 200000, name
+
+
+def test_paddle_moves_while_the_ball_falls():
+    # The predicting controller has the whole fall to get there
+    variant = VARIANTS['brickbreakergame']
+    result = EventSimulator(variant.world(1), controller=predict,
+                            paddle_speed=variant.paddle_speed).run()
+    assert result['state'] == 'won'
+    assert result['lives'] == variant.make_rules().lives
@@ -0,0 +1,90 @@
+import gc
+import sys
+import weakref
+
+from brickbreaker import app
+from brickbreaker.fakecanvas import FakeCanvas, FakeTk, fake_tkinter
+from brickbreaker.replay import Replay
+
+
+def test_cancelling_a_timer_that_ran_is_ignored():
+    root = FakeTk()
+    ran = []
+    after_id = root.after(10, ran.append, 1)
+    root.advance(10)
+    root.after_cancel(after_id)
+    root.after_cancel(after_id)
+    assert ran == [1]
+    assert root.pending() == 0
+    assert not root.cancelled
+
+
+def test_cancelled_timers_never_run():
+    root = FakeTk()
+    ran = []
+    keep = root.after(5, ran.append, 'keep')
+    drop = root.after(5, ran.append, 'drop')
+    root.after_cancel(drop)
+    assert root.pending() == 1
+    root.advance(10)
+    assert ran == ['keep']
+    assert root.pending() == 0
+    root.after_cancel(keep)
+    assert root.pending() == 0
+
+
+def test_fakes_are_not_kept_alive():
+    root = FakeTk()
+    canvas = FakeCanvas(root)
+    refs = [weakref.ref(root), weakref.ref(canvas)]
+    del root, canvas
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
+
+
+def test_find_overlapping_in_stacking_order():
+    canvas = FakeCanvas()
+    low = canvas.create_rectangle(0, 0, 50, 50)
+    high = canvas.create_rectangle(10, 10, 60, 60)
+    away = canvas.create_rectangle(200, 200, 220, 220)
+    assert canvas.find_overlapping(20, 20, 30, 30) == (low, high)
+    canvas.tag_raise(low)
+    assert canvas.find_overlapping(20, 20, 30, 30) == (high, low)
+    canvas.tag_lower(low)
+    assert canvas.find_overlapping(20, 20, 30, 30) == (low, high)
+    assert canvas.find_overlapping(205, 205, 206, 206) == (away,)
+    canvas.coords(away, 15, 15, 25, 25)
+    assert canvas.find_overlapping(20, 20, 30, 30) == (low, high, away)
+
+
+def test_find_overlapping_skips_hidden_items():
+    canvas = FakeCanvas()
+    shown = canvas.create_oval(0, 0, 40, 40)
+    hidden = canvas.create_rectangle(0, 0, 40, 40, state='hidden')
+    assert canvas.find_overlapping(10, 10, 20, 20) == (shown,)
+    canvas.itemconfig(hidden, state='normal')
+    canvas.itemconfig(shown, state='hidden')
+    assert canvas.find_overlapping(10, 10, 20, 20) == (hidden,)
+
+
+class ClosingTk(FakeTk):
+    # Holds the right arrow down for a while, then closes the window
+    def __init__(self, *args, **options):
+        super().__init__(*args, **options)
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+        if self.updates == 5:
+            self.fire('<KeyPress>', keysym='Right')
+        elif self.updates == 60:
+            self.close()
+
+
+def test_app_runs_headless(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'tkinter', fake_tkinter(tk=ClosingTk))
+    log = str(tmp_path / 'game.log')
+    app.main('brickbreakergame', physics_hz=100, record=log, tiles=True)
+    world = Replay.load(log).run()
+    assert world.ticks > 0
+    assert world.paddle.x > world.width / 2
@@ -0,0 +1,115 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from brickbreaker import framebuffer
+from brickbreaker.framebuffer import FramebufferCanvas, write_png
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+def pixel(pixels, x, y):
+    return tuple(int(value) for value in pixels[y, x])
+
+
+def test_rectangle_fill_and_outline():
+    canvas = FramebufferCanvas(40, 30, 'black')
+    canvas.create_rectangle(10, 5, 20, 15, fill='red', outline='white')
+    pixels = canvas.frame()
+    assert pixel(pixels, 15, 10) == RED
+    for x, y in [(10, 5), (19, 5), (10, 14), (19, 14), (15, 5), (10, 10)]:
+        assert pixel(pixels, x, y) == WHITE, (x, y)
+    assert pixel(pixels, 9, 10) == BLACK
+    assert pixel(pixels, 20, 10) == BLACK
+
+
+def test_outline_defaults_to_black_and_can_be_turned_off():
+    canvas = FramebufferCanvas(20, 20, 'white')
+    canvas.create_rectangle(0, 0, 10, 10, fill='red')
+    canvas.create_rectangle(10, 10, 20, 20, fill='blue', outline='')
+    pixels = canvas.frame()
+    assert pixel(pixels, 0, 0) == BLACK
+    assert pixel(pixels, 5, 5) == RED
+    assert pixel(pixels, 10, 10) == BLUE
+
+
+def test_oval_is_round():
+    canvas = FramebufferCanvas(40, 40, 'black')
+    canvas.create_oval(0, 0, 40, 40, fill='blue', outline='')
+    pixels = canvas.frame()
+    assert pixel(pixels, 20, 20) == BLUE
+    assert pixel(pixels, 0, 0) == BLACK
+    assert pixel(pixels, 39, 39) == BLACK
+
+
+def test_hidden_items_are_not_drawn():
+    canvas = FramebufferCanvas(20, 20, 'black')
+    item = canvas.create_rectangle(0, 0, 20, 20, fill='red', state='hidden')
+    assert pixel(canvas.frame(), 10, 10) == BLACK
+    canvas.itemconfig(item, state='normal')
+    assert pixel(canvas.frame(), 10, 10) == RED
+
+
+def test_later_and_raised_items_draw_on_top():
+    canvas = FramebufferCanvas(20, 20, 'black')
+    red = canvas.create_rectangle(0, 0, 20, 20, fill='red', outline='')
+    blue = canvas.create_rectangle(5, 5, 15, 15, fill='blue', outline='')
+    assert pixel(canvas.frame(), 10, 10) == BLUE
+    canvas.tag_raise(red)
+    assert pixel(canvas.frame(), 10, 10) == RED
+    canvas.tag_lower(red)
+    assert pixel(canvas.frame(), 10, 10) == BLUE
+    canvas.delete(blue)
+    assert pixel(canvas.frame(), 10, 10) == RED
+
+
+def read_png(path):
+    # The image data of an 8-bit RGB PNG written with filter 0 on every row
+    data = open(path, 'rb').read()
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos = 8
+    chunks = {}
+    while pos < len(data):
+        size, = struct.unpack_from('>I', data, pos)
+        tag = data[pos + 4:pos + 8]
+        body = data[pos + 8:pos + 8 + size]
+        crc, = struct.unpack_from('>I', data, pos + 8 + size)
+        assert crc == zlib.crc32(tag + body)
+        chunks[tag] = body
+        pos += 12 + size
+    width, height, depth, kind = struct.unpack_from('>IIBB', chunks[b'IHDR'])
+    assert (depth, kind) == (8, 2)
+    raw = np.frombuffer(zlib.decompress(chunks[b'IDAT']), np.uint8)
+    rows = raw.reshape(height, width * 3 + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 3)
+
+
+def test_png_round_trip(tmp_path):
+    canvas = FramebufferCanvas(31, 17, '#102030')
+    canvas.create_oval(3, 2, 20, 15, fill='yellow')
+    canvas.create_rectangle(15, 5, 28, 12, fill='#ED639E')
+    pixels = canvas.frame()
+    path = str(tmp_path / 'frame.png')
+    write_png(path, pixels)
+    assert np.array_equal(read_png(path), pixels)
+
+
+def test_capture_every_must_be_positive(capsys):
+    with pytest.raises(SystemExit) as exit:
+        framebuffer.main(['--every', '0', '-n', '1'])
+    assert exit.value.code == 2
+    assert 'must be at least 1' in capsys.readouterr().err
+
+
+def test_capture_writes_frames(tmp_path):
+    out = tmp_path / 'frames'
+    assert framebuffer.main(['-n', '5', '--every', '2',
+                             '--out', str(out)]) == 0
+    assert sorted(path.name for path in out.iterdir()) == [
+        'frame000000.png', 'frame000002.png', 'frame000004.png']
@@ -0,0 +1,106 @@
+from brickbreaker.backends import NullCanvas
+from brickbreaker.effects import Effects
+from brickbreaker.governor import LEVELS, Governor
+from brickbreaker.loop import FixedStepLoop
+from brickbreaker.view import CanvasView
+from brickbreaker.world import World
+
+
+def governed(window=10):
+    # A loop on a fake clock whose every render costs cost[0] seconds
+    world = World(seed=0)
+    world.start()
+    effects = Effects(world, 256, seed=0)
+    view = CanvasView(NullCanvas(), world, effects=effects)
+    governor = Governor(60, view, effects, window=window)
+    now = [0.0]
+    cost = [0.0]
+
+    def render(alpha):
+        view.draw(alpha)
+        now[0] += cost[0]
+
+    loop = FixedStepLoop(world.step, render, 20, clock=lambda: now[0],
+                         governor=governor)
+
+    def run(seconds, frames):
+        cost[0] = seconds
+        qualities = []
+        for _ in range(frames):
+            now[0] += loop.interval(60)
+            loop.tick()
+            qualities.append(governor.quality)
+        return qualities
+
+    return governor, view, effects, loop, run
+
+
+def test_degrades_in_order_and_restores():
+    governor, view, effects, loop, run = governed()
+    assert run(0.005, 50)[-1] == 'full'
+    slow = run(0.020, 80)
+    # Each level in turn, and no further than needed
+    assert [level for i, level in enumerate(slow)
+            if i == 0 or slow[i - 1] != level] == list(LEVELS)
+    assert view.hud_every > 1
+    assert effects.particles.limit < effects.particles.budget
+    assert loop.interval(60) == 1.0 / 30
+    fast = run(0.005, 80)
+    assert fast[-1] == 'full'
+    assert view.hud_every == 1
+    assert effects.particles.limit == effects.particles.budget
+    assert loop.interval(60) == 1.0 / 60
+
+
+def test_holds_while_within_budget():
+    governor, _, _, _, run = governed()
+    # Over half the interval but under the high mark: no change either way
+    assert set(run(0.012, 200)) == {'full'}
+    assert governor.changes == 0
+
+
+def test_waits_for_a_full_window():
+    governor, _, _, _, run = governed(window=30)
+    assert set(run(0.020, 29)) == {'full'}
+    assert run(0.020, 1) == ['no-hud']
+
+
+def test_lowered_particle_limit_shrinks_the_draw():
+    world = World(seed=0)
+    effects = Effects(world, 64, trail=False, seed=0)
+    view = CanvasView(NullCanvas(), world, effects=effects)
+    particles = effects.particles
+    calls = []
+    rect, config = view.layer.rect, view.layer.config
+    view.layer.rect = lambda key, *args, **options: (
+        calls.append(('rect', key[1])), rect(key, *args, **options))
+    view.layer.config = lambda key, **options: (
+        calls.append(('config', key[1])), config(key, **options))
+
+    particles.burst((100, 100, 120, 120), 'red', 64, life=1000)
+    view.draw_particles()
+    view.layer.flush()
+    assert calls == [('rect', slot) for slot in range(64)]
+
+    # Governor(...).set(FEW_EFFECTS) with a share of 1/8
+    particles.limit = 8
+    del calls[:]
+    view.draw_particles()
+    view.layer.flush()
+    assert calls == ([('config', slot) for slot in range(8, 64)] +
+                     [('rect', slot) for slot in range(8)])
+    assert view.layer.sent[('particle', 40)][2]['state'] == 'hidden'
+    del calls[:]
+    view.draw_particles()
+    view.layer.flush()
+    assert calls == [('rect', slot) for slot in range(8)]
+
+    # Dead slots are hidden once, then left alone
+    particles.life[:4] = 0
+    del calls[:]
+    view.draw_particles()
+    view.layer.flush()
+    view.draw_particles()
+    view.layer.flush()
+    assert calls == ([('config', slot) for slot in range(4)] +
+                     [('rect', slot) for slot in range(4, 8)] * 2)
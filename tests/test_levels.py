@@ -0,0 +1,93 @@
+import builtins
+
+import pytest
+
+from brickbreaker import batch, levels
+from brickbreaker.batch import play_many
+from brickbreaker.levels import HEADER, LevelFile, write_level
+from brickbreaker.variants import VARIANTS, make_bricks
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    # Every file LevelFile opens, to check they all get closed
+    files = []
+
+    def spy(*args, **kwargs):
+        files.append(builtins.open(*args, **kwargs))
+        return files[-1]
+
+    monkeypatch.setattr(levels, 'open', spy, raising=False)
+    return files
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'BRKL',
+    b'XXXX' + bytes(HEADER.size),
+    HEADER.pack(b'BRKL', 1, 100, 610, 400),
+])
+def test_bad_files_raise_and_close(tmp_path, opened, data):
+    path = tmp_path / 'bad.brkl'
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        LevelFile(str(path))
+    assert opened and all(f.closed for f in opened)
+
+
+def test_batch_plays_a_level_file(tmp_path):
+    path = str(tmp_path / 'level.brkl')
+    write_level(path, [(100 + 80 * i, 60, 75, 20, 1, 4) for i in range(5)])
+    results = play_many('brickbreakergame', [0, 1], pilot='predict',
+                        level_file=path)
+    for game in results:
+        assert game['result'] == 'cleared'
+        assert game['score'] == 50
+
+
+@pytest.mark.parametrize('name', ['missing.brkl', 'bad.brkl'])
+def test_info_reports_bad_files(tmp_path, capsys, name):
+    (tmp_path / 'bad.brkl').write_bytes(b'BRKL')
+    with pytest.raises(SystemExit) as exit:
+        levels.main(['info', str(tmp_path / name)])
+    assert exit.value.code == 2
+    assert name in capsys.readouterr().err
+
+
+def test_field_size_is_checked(tmp_path, capsys):
+    path = str(tmp_path / 'level.brkl')
+    levels.main(['export', 'ball_class', path])
+    with LevelFile(path) as level:
+        assert (level.width, level.height) == (500, 500)
+        VARIANTS['ballclass'].world(layout=level.layout)
+        with pytest.raises(ValueError):
+            VARIANTS['brickbreakergame'].world(layout=level.layout)
+    with pytest.raises(SystemExit):
+        batch.main(['gameclass', '--level-file', path, '-n', '1', '-j', '0'])
+    assert 'laid out for a 500x500 field' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('brick, error', [
+    ((100, 60, 75, 20, 1, len(levels.PALETTE)), 'past the palette'),
+    ((100, 60, 75, 20, 0, 4), 'has no hits'),
+])
+def test_bad_records_are_usage_errors(tmp_path, capsys, brick, error):
+    path = str(tmp_path / 'level.brkl')
+    write_level(path, [(200, 60, 75, 20, 1, 4), brick])
+    with LevelFile(path) as level:
+        with pytest.raises(ValueError, match=error):
+            VARIANTS['brickbreakergame'].world(layout=level.layout)
+    with pytest.raises(SystemExit) as exit:
+        batch.main(['--level-file', path, '-n', '1', '-j', '0'])
+    assert exit.value.code == 2
+    assert error in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('bricks', ['grid', 'list', 'array'])
+def test_stores_agree_on_dead_bricks(bricks):
+    store = make_bricks(bricks)
+    store.add(100, 60, 1)
+    dead = store.add(200, 60, 0)
+    assert len(store) == 1
+    assert list(store) == [0]
+    assert dead not in store.overlapping((150, 40, 250, 80))
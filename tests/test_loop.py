@@ -0,0 +1,57 @@
+import pytest
+
+from brickbreaker.loop import FixedStepLoop
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_loop(physics_hz=4, max_steps=5):
+    # 4 Hz keeps dt at 0.25, which floats hold exactly
+    clock = Clock()
+    steps, alphas = [], []
+    loop = FixedStepLoop(steps.append, alphas.append, physics_hz,
+                         max_steps=max_steps, clock=clock)
+    return loop, clock, steps, alphas
+
+
+def test_a_long_stall_is_capped_and_dropped():
+    loop, clock, steps, alphas = make_loop(max_steps=5)
+    loop.tick()
+    clock.now = 10.125
+    assert loop.tick() == 5
+    assert steps == [0.25] * 5
+    # 40 steps were due; 5 ran, 35 were dropped and the eighth of a
+    # step left over is kept for the next tick
+    assert loop.dropped == pytest.approx(35 * 0.25)
+    assert loop.accumulator == pytest.approx(0.125)
+    assert alphas[-1] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize('gap', [0.0, 0.1, 0.25, 0.3, 0.74, 0.999])
+def test_alpha_is_the_fraction_left_over(gap):
+    loop, clock, steps, alphas = make_loop()
+    loop.tick()
+    clock.now = gap
+    loop.tick()
+    assert len(steps) == int(gap / 0.25)
+    assert 0 <= alphas[-1] < 1
+    assert alphas[-1] == pytest.approx(gap / 0.25 - len(steps))
+
+
+def test_repeated_ticks_run_the_expected_steps():
+    loop, clock, steps, alphas = make_loop()
+    loop.tick()
+    for _ in range(100):
+        clock.now += 0.1
+        assert loop.tick() in (0, 1)
+    # 10 seconds at 4 Hz, give or take the step still in the accumulator
+    assert loop.steps == len(steps) in (39, 40)
+    assert loop.dropped == 0
+    assert len(alphas) == 101
+    assert all(0 <= alpha < 1 for alpha in alphas)
@@ -0,0 +1,43 @@
+import atexit
+
+from brickbreaker.backends import NullCanvas
+from brickbreaker.loop import FixedStepLoop
+from brickbreaker.profiler import Profiler
+from brickbreaker.view import CanvasView
+from brickbreaker.world import World
+
+
+def loop_and_profiler():
+    world = World(seed=0)
+    world.start()
+    view = CanvasView(NullCanvas(), world)
+    clock = iter(i * 0.01 for i in range(100000))
+    loop = FixedStepLoop(world.step, view.draw, 20,
+                         clock=lambda: next(clock))
+    return world, loop, Profiler(clock=lambda: 0.0)
+
+
+def test_world_phases_are_timed():
+    world, loop, profiler = loop_and_profiler()
+    profiler.attach(loop)
+    for _ in range(200):
+        loop.tick()
+    phases = profiler.summary()['phase_ms']
+    assert {'check_collisions', 'draw_hud', 'step', 'render'} <= set(phases)
+    profiler.detach()
+    assert 'check_collisions' not in vars(world)
+    assert 'draw_hud' not in vars(loop.render.__self__)
+
+
+def test_nothing_is_written_unless_profiled(tmp_path, monkeypatch):
+    hooks = []
+    monkeypatch.setattr(atexit, 'register', hooks.append)
+    path = tmp_path / 'profile.json'
+    _, loop, profiler = loop_and_profiler()
+    profiler.dump_at_exit(str(path))
+    hooks[0]()
+    assert not path.exists()
+    profiler.attach(loop)
+    loop.tick()
+    hooks[0]()
+    assert path.exists()
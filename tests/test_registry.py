@@ -0,0 +1,83 @@
+import pytest
+
+from brickbreaker.autopilot import Autopilot
+from brickbreaker.effects import Effects
+from brickbreaker.fakecanvas import FakeCanvas, FakeTk
+from brickbreaker.registry import ItemRegistry, LeakError
+from brickbreaker.variants import VARIANTS
+from brickbreaker.view import CanvasView
+
+# Ball, paddle, HUD and message
+SPARE = 4
+PARTICLES = 64
+
+
+def session(name, ticks):
+    # A long headless session: every game lost or cleared is started over,
+    # and every frame is drawn with particles on. Yields the registry's
+    # counts and the most bricks a level has had, every 500 ticks.
+    variant = VARIANTS[name]
+    # With levels on a cleared field lays out the next one instead of
+    # ending the game
+    world = variant.world(seed=3, rules=variant.make_rules(levels=True))
+    canvas = FakeCanvas(FakeTk(), width=variant.width, height=variant.height)
+    registry = ItemRegistry(canvas)
+    bricks = [len(world.bricks)]
+
+    def budget(event):
+        if event[0] == 'level':
+            bricks.append(len(world.bricks))
+        registry.limit = max(bricks) + PARTICLES + SPARE
+
+    budget(('start',))
+    world.listeners.append(budget)
+    effects = Effects(world, PARTICLES, seed=3)
+    view = CanvasView(canvas, world, style=variant.style, effects=effects,
+                      registry=registry)
+    pilot = Autopilot(world, variant.paddle_speed, seed=3, error=1.5)
+    dt = 1.0 / variant.physics_hz
+    for tick in range(1, ticks + 1):
+        pilot.drive(dt)
+        world.step(dt)
+        if world.state == 'over':
+            world.retry()
+        if world.state == 'ready':
+            world.start()
+        view.draw()
+        if tick % 500 == 0:
+            counts = registry.counts()
+            # Nothing on the canvas that the registry doesn't know about
+            assert len(canvas.items) == counts['items'] + counts['pooled']
+            yield counts, max(bricks)
+
+
+@pytest.mark.parametrize('name', sorted(VARIANTS))
+def test_item_counts_stay_flat(name):
+    # Games lost, retried and cleared reuse the same items: for a given
+    # layout size the total on the canvas never moves
+    totals = {}
+    for counts, bricks in session(name, 10000):
+        total = counts['items'] + counts['pooled']
+        assert total <= bricks + PARTICLES + SPARE
+        assert totals.setdefault(bricks, total) == total
+        assert counts['timers'] == 0
+
+
+def test_limit_raises():
+    registry = ItemRegistry(FakeCanvas(FakeTk()), limit=2)
+    registry.create('rectangle', (0, 0, 1, 1), {})
+    registry.create('rectangle', (0, 0, 1, 1), {})
+    with pytest.raises(LeakError):
+        registry.create('rectangle', (0, 0, 1, 1), {})
+
+
+def test_released_items_are_reused():
+    canvas = FakeCanvas(FakeTk())
+    registry = ItemRegistry(canvas)
+    item, options, _ = registry.create('oval', (0, 0, 5, 5), {'fill': 'red'})
+    registry.release(item, (0, 0, 5, 5), options)
+    again, _, _ = registry.create('oval', (1, 1, 6, 6), {'fill': 'blue'})
+    assert again == item
+    assert registry.counts()['items'] == 1
+    assert registry.counts()['pooled'] == 0
+    assert len(canvas.items) == 1
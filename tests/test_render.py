@@ -0,0 +1,64 @@
+from brickbreaker.fakecanvas import FakeCanvas, FakeTk
+from brickbreaker.render import RenderLayer
+
+
+class CountingCanvas(FakeCanvas):
+    # Counts every command that reaches the canvas, whatever RenderLayer
+    # reports about itself
+    def __init__(self, *args, **options):
+        super().__init__(*args, **options)
+        self.calls = []
+
+    def create(self, kind, coords, options):
+        self.calls.append(('create', kind))
+        return super().create(kind, coords, options)
+
+    def coords(self, tag_or_id, *coords):
+        if coords:
+            self.calls.append(('coords', tag_or_id))
+        return super().coords(tag_or_id, *coords)
+
+    def itemconfig(self, tag_or_id, **options):
+        self.calls.append(('itemconfig', tag_or_id))
+        return super().itemconfig(tag_or_id, **options)
+
+    def delete(self, *tags_or_ids):
+        self.calls.append(('delete',) + tags_or_ids)
+        return super().delete(*tags_or_ids)
+
+
+def draw(layer, score=0, ball=(10, 10, 30, 30)):
+    layer.text('score', 40, 10, text='Score: %d' % score, fill='white')
+    layer.oval('ball', ball, fill='red')
+    layer.rect('paddle', (100, 300, 180, 310), fill='blue')
+
+
+def test_unchanged_frames_send_nothing():
+    canvas = CountingCanvas(FakeTk(), width=400, height=400)
+    layer = RenderLayer(canvas)
+    draw(layer)
+    assert layer.flush() == 3
+    assert [call[0] for call in canvas.calls] == ['create'] * 3
+    del canvas.calls[:]
+    draw(layer)
+    assert layer.flush() == 0
+    assert canvas.calls == []
+
+
+def test_one_change_sends_one_command():
+    canvas = CountingCanvas(FakeTk(), width=400, height=400)
+    layer = RenderLayer(canvas)
+    draw(layer)
+    layer.flush()
+
+    del canvas.calls[:]
+    draw(layer, score=10)
+    assert layer.flush() == 1
+    assert canvas.calls == [('itemconfig', layer.items['score'])]
+    assert canvas.itemcget(layer.items['score'], 'text') == 'Score: 10'
+
+    del canvas.calls[:]
+    draw(layer, score=10, ball=(12, 14, 32, 34))
+    assert layer.flush() == 1
+    assert canvas.calls == [('coords', layer.items['ball'])]
+    assert canvas.coords(layer.items['ball']) == [12, 14, 32, 34]
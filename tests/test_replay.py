@@ -0,0 +1,134 @@
+import io
+import sys
+
+import pytest
+
+from brickbreaker import app, loop
+from brickbreaker.autopilot import Autopilot
+from brickbreaker.cli import main
+from brickbreaker.fakecanvas import FakeTk, fake_tkinter
+from brickbreaker.loop import FixedStepLoop
+from brickbreaker.replay import (CHECK, HEADER, INPUT, DesyncError, Recorder,
+                                 Replay)
+
+
+def record(variant='brickbreakergame', ticks=600, seed=5):
+    f = io.BytesIO()
+    recorder = Recorder(f, seed=seed, interval=50, variant=variant)
+    pilot = Autopilot(recorder.world, 200, seed=seed)
+    recorder.start()
+    for _ in range(ticks):
+        recorder.press(pilot())
+        recorder.step()
+        if recorder.world.state in ('ready', 'over'):
+            recorder.start()
+    recorder.close()
+    return recorder.world, f.getvalue()
+
+
+def records(data):
+    # (tag, position of the record's fields) for every record in a log
+    pos = HEADER.size + HEADER.unpack_from(data)[-1]
+    while pos < len(data):
+        tag = data[pos:pos + 1]
+        yield tag, pos + 1
+        pos += 1 + (INPUT.size if tag == b'I' else CHECK.size)
+
+
+def test_round_trip():
+    world, data = record()
+    replay = Replay(data)
+    replay.run()
+    assert replay.checked == world.ticks // 50
+    assert replay.world.score == world.score
+    assert replay.world.ticks == world.ticks
+
+
+def test_changed_input_is_caught():
+    _, data = record()
+    data = bytearray(data)
+    # Reverse the first input run that moves the paddle
+    for tag, pos in records(bytes(data)):
+        if tag != b'I':
+            continue
+        count, offset, flags = INPUT.unpack_from(data, pos)
+        if offset:
+            INPUT.pack_into(data, pos, count, -offset, flags)
+            break
+    with pytest.raises(DesyncError):
+        Replay(bytes(data)).run()
+
+
+def test_changed_checksum_is_caught():
+    _, data = record()
+    data = bytearray(data)
+    pos = [pos for tag, pos in records(bytes(data)) if tag == b'C'][-1]
+    tick, crc = CHECK.unpack_from(data, pos)
+    CHECK.pack_into(data, pos, tick, crc ^ 1)
+    with pytest.raises(DesyncError):
+        Replay(bytes(data)).run()
+
+
+def test_not_a_log():
+    with pytest.raises(ValueError):
+        Replay(b'XXXX' + bytes(40))
+
+
+def test_replay_command(tmp_path, capsys):
+    world, data = record()
+    path = tmp_path / 'game.log'
+    path.write_bytes(data)
+    assert main(['replay', str(path)]) == 0
+    out = capsys.readouterr().out
+    assert '%d checksums ok' % (world.ticks // 50) in out
+
+    data = bytearray(data)
+    pos = [pos for tag, pos in records(bytes(data)) if tag == b'C'][0]
+    tick, crc = CHECK.unpack_from(data, pos)
+    CHECK.pack_into(data, pos, tick, crc ^ 1)
+    path.write_bytes(bytes(data))
+    assert main(['replay', str(path)]) == 1
+    assert 'diverged at tick 50' in capsys.readouterr().err
+
+
+class ClosingTk(FakeTk):
+    def update(self):
+        self.close()
+
+
+def test_fast_playback_is_not_capped(tmp_path, monkeypatch):
+    # At 50x a 20 Hz log needs 1000 steps a second, 34 a frame at 30 fps
+    # (the governor's lowest rate). None of it may be dropped.
+    loops = []
+
+    class Loop(FixedStepLoop):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            loops.append(self)
+
+    monkeypatch.setitem(sys.modules, 'tkinter', fake_tkinter(tk=ClosingTk))
+    monkeypatch.setattr(loop, 'FixedStepLoop', Loop)
+    world, data = record()
+    path = tmp_path / 'game.log'
+    path.write_bytes(data)
+    app.main(replay=str(path), speed=50)
+    assert loops[0].max_steps >= 50 * 20 / 30
+
+
+def test_play_reports_unreadable_logs(tmp_path, capsys):
+    world, data = record()
+    path = tmp_path / 'short.log'
+    path.write_bytes(data[:10])
+    for log in (str(tmp_path / 'missing.log'), str(path)):
+        with pytest.raises(SystemExit) as exit:
+            main(['play', '--replay', log])
+        assert exit.value.code == 2
+        assert 'cannot read %s' % log in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('option', ['--speed', '--physics-hz', '--render-hz'])
+def test_play_rejects_rates_of_zero(capsys, option):
+    with pytest.raises(SystemExit) as exit:
+        main(['play', option, '0'])
+    assert exit.value.code == 2
+    assert 'must be more than 0' in capsys.readouterr().err
@@ -0,0 +1,59 @@
+import asyncio
+import sys
+
+import pytest
+
+from brickbreaker.fakecanvas import FakeTk, TclError, fake_tkinter
+from brickbreaker.scheduler import Scheduler
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'tkinter', fake_tkinter())
+    return Scheduler(FakeTk())
+
+
+def forever(cancelled):
+    async def run():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    return run()
+
+
+def test_stop_cancels_every_task(scheduler):
+    cancelled = []
+
+    async def stop_soon():
+        await asyncio.sleep(0.01)
+        scheduler.stop()
+        await asyncio.sleep(3600)
+
+    scheduler.run(forever(cancelled), forever(cancelled), stop_soon())
+    assert cancelled == [True, True]
+    assert not scheduler.tasks
+
+
+def test_a_failing_task_stops_the_rest_and_reraises(scheduler):
+    cancelled = []
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        scheduler.run(forever(cancelled), fail())
+    assert cancelled == [True]
+    assert not scheduler.tasks
+
+
+def test_a_destroyed_window_stops(scheduler):
+    def update():
+        raise TclError('application has been destroyed')
+
+    scheduler.root.update = update
+    cancelled = []
+    scheduler.run(forever(cancelled))
+    assert cancelled == [True]
@@ -0,0 +1,95 @@
+import itertools
+
+import pytest
+
+from brickbreaker.scores import INSERT_SCORE, ScoreStore, Session
+from brickbreaker.world import Rules, World
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScoreStore(str(tmp_path / 'scores.sqlite3'))
+    yield store
+    store.close()
+
+
+def clock():
+    ticks = itertools.count(1000)
+    return lambda: float(next(ticks))
+
+
+def lose_ball(world):
+    world.ball.y = world.height
+    world.step()
+
+
+def test_flush_commits_a_batch_at_once(tmp_path):
+    store = ScoreStore(str(tmp_path / 'scores.sqlite3'), batch=5, delay=5)
+    try:
+        for score in range(5):
+            store.submit(INSERT_SCORE, ('s', 'v', score, 1, 'over', score))
+        store.flush()
+        assert store.written == 5
+        assert store.commits == 1
+        assert store.error is None
+        assert len(store.leaderboard('v')) == 5
+    finally:
+        store.close()
+
+
+def test_session_records_over_retry_and_quit(store):
+    world = World(rules=Rules(lives=0), seed=0)
+    session = Session(store, world, 'v', clock=clock())
+    world.start()
+    world.step()
+    world.score = 30
+    lose_ball(world)
+    assert world.state == 'over'
+    world.retry()
+    world.start()
+    world.step()
+    world.score = 20
+    session.close()
+    store.flush()
+    assert [row[2] for row in store.leaderboard('v')] == ['over', 'quit']
+    assert store.read('SELECT games FROM sessions') == [(2,)]
+    rows = store.read('SELECT game, level, lives_lost, points, result '
+                      'FROM level_stats ORDER BY game')
+    assert rows == [(1, 1, 1, 30, 'over'), (2, 1, 0, 20, 'quit')]
+    assert world.listeners == []
+
+
+def test_session_records_each_level(store):
+    def one_brick(world):
+        world.add_brick(world.width / 2, 200, 1)
+
+    world = World(rules=Rules(lives=0, levels=True), layout=one_brick,
+                  seed=0)
+    session = Session(store, world, 'v', clock=clock())
+    world.start()
+    world.ball.x, world.ball.y = world.width / 2, 200
+    world.step()
+    assert world.level == 2
+    world.start()
+    lose_ball(world)
+    session.close()
+    store.flush()
+    rows = store.read('SELECT level, hits, points, result FROM level_stats '
+                      'ORDER BY level')
+    assert rows == [(1, 1, 10, 'cleared'), (2, 0, 0, 'over')]
+    stats = store.level_stats('v')
+    assert [(level, plays, cleared) for level, plays, _, _, _, _, cleared
+            in stats] == [(1, 1, 1), (2, 1, 0)]
+    assert store.leaderboard('v') == [(10, 2, 'over', 1001.0)]
+
+
+def test_leaderboard_is_best_first_then_oldest(store):
+    for score, at in ((50, 3), (90, 2), (50, 1), (70, 4)):
+        store.submit(INSERT_SCORE, ('s', 'v', score, 1, 'over', at))
+    store.submit(INSERT_SCORE, ('s', 'other', 100, 1, 'over', 5))
+    store.flush()
+    assert [(row[0], row[3]) for row in store.leaderboard('v')] == \
+        [(90, 2), (70, 4), (50, 1), (50, 3)]
+    assert len(store.leaderboard('v', 2)) == 2
+    assert store.best('v') == 90
+    assert store.best('none') == 0
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from brickbreaker.spatial import UniformGrid, overlaps
+from brickbreaker.world import BrickGrid, BrickList
+
+
+def random_box(rng, span=600, size=150):
+    x0 = rng.uniform(-50, span)
+    y0 = rng.uniform(-50, span)
+    return (x0, y0, x0 + rng.uniform(0, size), y0 + rng.uniform(0, size))
+
+
+@pytest.mark.parametrize('cell_size', [16, 64, 200])
+def test_query_matches_a_linear_scan(cell_size):
+    rng = random.Random(cell_size)
+    grid = UniformGrid(cell_size)
+    boxes = {}
+    for key in range(300):
+        boxes[key] = random_box(rng)
+        grid.insert(key, boxes[key])
+    for _ in range(500):
+        if rng.random() < 0.2 and boxes:
+            key = rng.choice(sorted(boxes))
+            del boxes[key]
+            grid.remove(key)
+        query = random_box(rng, size=400)
+        assert grid.query(query) == [key for key in sorted(boxes)
+                                     if overlaps(boxes[key], query)]
+
+
+def test_boxes_spanning_cells():
+    grid = UniformGrid(64)
+    grid.insert('wide', (10, 10, 300, 20))
+    grid.insert('tall', (100, 0, 110, 300))
+    # Each query touches only a far cell of the boxes it should find
+    assert grid.query((250, 15, 260, 16)) == ['wide']
+    assert grid.query((105, 250, 106, 251)) == ['tall']
+    assert grid.query((0, 0, 400, 400)) == ['wide', 'tall']
+    # Edges touch at cell boundaries
+    assert grid.query((300, 20, 320, 40)) == ['wide']
+    assert grid.query((128, 128, 190, 190)) == []
+
+
+def test_move_keeps_the_insertion_order():
+    grid = UniformGrid(64)
+    grid.insert('a', (0, 0, 10, 10))
+    grid.insert('b', (200, 200, 210, 210))
+    grid.move('a', (205, 205, 215, 215))
+    assert grid.query((0, 0, 300, 300)) == ['a', 'b']
+    assert grid.query((0, 0, 20, 20)) == []
+
+
+def test_brick_grid_matches_a_brick_list_as_bricks_break():
+    rng = random.Random(7)
+    grid, bricks = BrickGrid(), BrickList()
+    for _ in range(200):
+        x, y = rng.uniform(0, 600), rng.uniform(0, 400)
+        hits = rng.randint(1, 3)
+        assert grid.add(x, y, hits) == bricks.add(x, y, hits)
+    while len(bricks):
+        query = random_box(rng, size=200)
+        found = grid.overlapping(query)
+        assert found == bricks.overlapping(query)
+        for index in found[:1]:
+            assert grid.hit(index) == bricks.hit(index)
+        assert len(grid) == len(bricks)
+    assert grid.overlapping((-100, -100, 1000, 1000)) == []
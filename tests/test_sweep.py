@@ -0,0 +1,55 @@
+import pytest
+
+from brickbreaker.world import Rules, World
+
+# 60 px per tick each way, against a 4 px brick and a 10 px paddle that the
+# ball's 20 px box steps right over
+FAST = 60
+
+
+def fast_world(swept, **rules):
+    world = World(rules=Rules(ball_speed=FAST, swept=swept, **rules),
+                  layout=lambda world: None, seed=0)
+    world.start()
+    return world
+
+
+@pytest.mark.parametrize('swept', [False, True])
+def test_fast_ball_and_thin_brick(swept):
+    world = fast_world(swept)
+    thin = world.add_brick(world.width / 2, 220, 1, width=600, height=4)
+    world.ball.x, world.ball.y = world.width / 2, 310
+    world.ball.direction = [1, -1]
+    for _ in range(3):
+        world.step()
+    # Overlap tests only see the ball at 310, 250 and 190
+    assert world.bricks.hits(thin) == (0 if swept else 1)
+
+
+@pytest.mark.parametrize('swept', [False, True])
+def test_fast_ball_and_paddle(swept):
+    world = fast_world(swept, paddle_width=600)
+    world.add_brick(50, 50, 1)
+    world.ball.x, world.ball.y = world.width / 2, 300
+    world.ball.direction = [1, 1]
+    for _ in range(3):
+        world.step()
+    if swept:
+        assert world.ball.direction[1] == -1
+        assert world.ball.y < world.paddle.y
+        assert world.lives == world.rules.lives
+    else:
+        assert world.lives == world.rules.lives - 1
+
+
+def test_long_steps_are_as_fast_as_fast_balls():
+    # 20 px per TICK stepped at a third of the rate is 60 px per step
+    world = World(rules=Rules(ball_speed=20, swept=True),
+                  layout=lambda world: None, seed=0)
+    world.start()
+    thin = world.add_brick(world.width / 2, 220, 1, width=600, height=4)
+    world.ball.x, world.ball.y = world.width / 2, 310
+    world.ball.direction = [1, -1]
+    for _ in range(3):
+        world.step(0.15)
+    assert world.bricks.hits(thin) == 0
@@ -0,0 +1,59 @@
+from brickbreaker.fakecanvas import FakeCanvas, FakePhotoImage
+from brickbreaker.tiles import TiledBrickRenderer
+from brickbreaker.world import World
+
+BG = '#D6D1F5'
+
+
+def rendered(tile=32):
+    world = World(seed=0)
+    canvas = FakeCanvas(width=world.width, height=world.height)
+    image = FakePhotoImage(width=world.width, height=world.height)
+    renderer = TiledBrickRenderer(canvas, world, tile, bg=BG, image=image)
+    renderer.draw()
+    return world, canvas, image, renderer
+
+
+def break_brick(world, index):
+    # Hits a brick until it is gone, the way World reports each hit
+    while world.bricks.hits(index) > 0:
+        world.emit('hit', index, world.bricks.hit(index))
+
+
+def test_first_draw_paints_every_tile():
+    world, canvas, image, renderer = rendered()
+    assert renderer.repaints == renderer.cols * renderer.rows
+    x0, y0, x1, y1 = world.bricks.get_position(0)
+    assert image.get(int(x0 + x1) // 2, int(y0 + y1) // 2) == \
+        world.brick_color(0, world.bricks.hits(0))
+    assert image.get(5, world.height - 5) == BG
+
+
+def test_hit_repaints_only_the_tiles_under_the_brick():
+    world, canvas, image, renderer = rendered()
+    # The bottom row's bricks take one hit
+    index = next(i for i in world.bricks if world.bricks.hits(i) == 1)
+    x0, y0, x1, y1 = world.bricks.get_position(index)
+    tiles = {(col, row) for col in range(int(x0 // 32), int(x1 // 32) + 1)
+             for row in range(int(y0 // 32), int(y1 // 32) + 1)}
+    before = renderer.repaints
+    break_brick(world, index)
+    assert renderer.dirty == tiles
+    renderer.draw()
+    assert renderer.repaints - before == len(tiles)
+    assert image.get(int(x0 + x1) // 2, int(y0 + y1) // 2) == BG
+    # Nothing outside those tiles was touched
+    renderer.draw()
+    assert renderer.repaints - before == len(tiles)
+
+
+def test_one_canvas_item_whatever_the_level():
+    world, canvas, image, renderer = rendered()
+    for index in list(world.bricks):
+        break_brick(world, index)
+        renderer.draw()
+    assert len(canvas.items) == 1
+    world.next_level()
+    renderer.draw()
+    assert len(canvas.items) == 1
+    assert len(world.bricks) > 0
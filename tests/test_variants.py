@@ -0,0 +1,31 @@
+from brickbreaker.brickfield import BrickArray
+from brickbreaker.levels import PALETTE, LevelFile, write_level
+from brickbreaker.variants import VARIANTS
+from brickbreaker.world import Brick, World
+
+
+def test_layout_colours_reach_the_world():
+    world = VARIANTS['paddleclass'].world(seed=0)
+    colors = {world.brick_color(index, world.bricks.hits(index))
+              for index in world.bricks}
+    assert colors <= {'red', 'blue', 'green', 'yellow'}
+    assert len(colors) > 1
+    world = VARIANTS['gameobjeckclass'].world(seed=0)
+    assert world.brick_color(0, 1) == 'lightgreen'
+
+
+def test_classic_bricks_go_by_hits():
+    world = VARIANTS['brickbreakergame'].world(seed=0)
+    for index in world.bricks:
+        hits = world.bricks.hits(index)
+        assert world.brick_color(index, hits) == Brick.COLORS[hits]
+
+
+def test_level_file_colours(tmp_path):
+    path = str(tmp_path / 'level.brkl')
+    write_level(path, [(50, 50, 40, 20, 1, 4), (100, 50, 40, 20, 2, 0)])
+    for bricks in (None, BrickArray()):
+        with LevelFile(path) as level:
+            world = World(layout=level.layout, bricks=bricks)
+        assert world.brick_color(0, 1) == PALETTE[4]
+        assert world.brick_color(1, 2) == Brick.COLORS[2]
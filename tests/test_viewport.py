@@ -0,0 +1,56 @@
+from brickbreaker.controls import Controls
+from brickbreaker.fakecanvas import Event, FakeCanvas
+from brickbreaker.viewport import Viewport
+from brickbreaker.world import World
+
+
+def test_starts_as_identity():
+    viewport = Viewport(610, 400)
+    assert viewport.identity
+    assert viewport.bounds([1, 2, 3, 4]) == [1, 2, 3, 4]
+    assert viewport.to_world(10, 20) == (10, 20)
+
+
+def test_resize_fits_and_centres():
+    viewport = Viewport(610, 400)
+    viewport.resize(1220, 1000)
+    # Width limits the scale; the spare height is split top and bottom
+    assert viewport.scale == 2
+    assert (viewport.x, viewport.y) == (0, 100)
+    assert viewport.bounds([0, 0, 610, 400]) == [0, 100, 1220, 900]
+    viewport.resize(1000, 400)
+    assert viewport.scale == 1
+    assert (viewport.x, viewport.y) == (195, 0)
+    assert viewport.size(14) == 14
+
+
+def test_resize_bumps_the_version_only_on_a_change():
+    viewport = Viewport(610, 400, FakeCanvas())
+    viewport.configure(Event(width=610, height=400))
+    assert viewport.version == 0
+    viewport.configure(Event(width=915, height=600))
+    assert viewport.version == 1
+    assert viewport.scale == 1.5
+
+
+def test_to_world_inverts_bounds():
+    viewport = Viewport(500, 500)
+    for width, height in [(500, 500), (1280, 720), (333, 900)]:
+        viewport.resize(width, height)
+        for x, y in [(0, 0), (250, 125), (500, 500), (37.5, 410)]:
+            x0, y0 = viewport.bounds([x, y, x, y])[:2]
+            wx, wy = viewport.to_world(x0, y0)
+            assert abs(wx - x) < 1e-9 and abs(wy - y) < 1e-9
+
+
+def test_pointer_steers_in_world_units():
+    world = World(seed=0)
+    canvas = FakeCanvas()
+    viewport = Viewport(world.width, world.height, canvas)
+    viewport.resize(world.width * 2, world.height * 2)
+    controls = Controls(canvas, world, viewport=viewport)
+    # The window pixel over world x = 200
+    x, y = viewport.point(200, 300)
+    controls.motion(Event(x=x, y=y))
+    world.move_paddle(controls.poll())
+    assert world.paddle.x == 200